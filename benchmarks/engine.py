@@ -0,0 +1,202 @@
+'''
+Engine benchmarks module
+
+Times the core board operations over a sweep of board sizes and mine densities
+without needing a display. Run it with:
+
+    python -m benchmarks.engine --output results.json --baseline benchmarks/baseline.json
+'''
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+from importlib import import_module
+from time import perf_counter
+from typing import Callable
+
+from src.base import instrumentation
+from src.base.board import Board
+from src.base.tile import Tile
+from src.solver.solver import Solver
+
+ENGINES: dict[str, tuple[str, str]] = {
+    "list": ("src.base.board", "Board"),
+    "numpy": ("src.base.numpy_board", "NumpyBoard"),
+}
+DEFAULT_SIZES: list[int] = [10, 100, 500, 1000, 2000]
+DEFAULT_DENSITIES: list[float] = [0.1, 0.2, 0.5]
+SEED: int = 0
+
+
+def measure(function: Callable[..., object], repeat: int,
+            setup: Callable[[], tuple] = tuple) -> float:
+    '''
+    Returns the best time of a function over a number of runs.
+    The arguments of every run are made by setup, which is not timed.
+    '''
+    best = float("inf")
+
+    for _ in range(repeat):
+        args = setup()
+        start = perf_counter()
+        function(*args)
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def measure_probe(name: str, function: Callable[[], object], repeat: int) -> float:
+    '''
+    Returns the best time an instrumentation probe of the engine recorded
+    over a number of runs of a function, so only that part of the run is timed
+    '''
+    instrumentation.enable()
+
+    try:
+        for _ in range(repeat):
+            function()
+        return min(instrumentation.samples(name)) / 1000
+    finally:
+        instrumentation.disable()
+
+
+def bench_case(board_type: type, size: int, density: float, repeat: int) -> dict[str, float]:
+    '''
+    Times every benchmark on one board size and density
+    '''
+    num_mines = int(size * size * density)
+    center = size // 2
+    forbidden = {(center + dx, center + dy) for dx in [-1, 0, 1] for dy in [-1, 0, 1]}
+    mine_coords = Board.generate_mine_coords(size, size, num_mines, forbidden, SEED)
+
+    def make_tiles() -> list[list[Tile]]:
+        return [[Tile((x, y) in mine_coords) for y in range(size)] for x in range(size)]
+
+    def first_click(board):
+        board.show(center, center)
+
+    def solve(board):
+        Solver(board).play((center, center))
+
+    def scripted_win():
+        board = board_type(make_tiles())
+        for x in range(size):
+            for y in range(size):
+                if (x, y) not in mine_coords:
+                    board.show(x, y)
+        assert board.has_won()
+
+    started = board_type((size, size, num_mines), SEED)
+    started.show(center, center)
+
+    def print_board():
+        with contextlib.redirect_stdout(io.StringIO()):
+            started.print()
+
+    def construct():
+        board_type((size, size, num_mines), SEED)
+
+    return {
+        "construction": measure(construct, repeat),
+        # Every engine places the mines and counts their neighbours its own way
+        "mine_placement": measure_probe("board.mines", construct, repeat),
+        "neighbour_counting": measure_probe("board.neighbours", construct, repeat),
+        # The layout is generated with the board, the first click only moves mines
+        "first_click": measure(first_click, repeat,
+                               lambda: (board_type((size, size, num_mines), SEED),)),
+        "repr": measure(started.repr, repeat),
+        "print": measure(print_board, repeat),
+        "scripted_win": measure(scripted_win, repeat),
+        # Plays from the opening until the solver has to guess
+        "solve": measure(solve, repeat, lambda: (board_type(make_tiles()),)),
+    }
+
+
+def run(engines: list[str], sizes: list[int], densities: list[float], repeat: int) -> list[dict]:
+    '''
+    Runs the whole sweep and returns one record per benchmark
+    '''
+    results: list[dict] = []
+
+    for engine in engines:
+        module, name = ENGINES[engine]
+        board_type = getattr(import_module(module), name)
+        for size in sizes:
+            for density in densities:
+                if not Board.is_valid_board(size, size, int(size * size * density)):
+                    continue
+                for benchmark, seconds in bench_case(board_type, size, density, repeat).items():
+                    results.append({"engine": engine,
+                                    "size": size,
+                                    "density": density,
+                                    "benchmark": benchmark,
+                                    "seconds": seconds})
+                    print(f"{engine:>5} {size:>5}x{size:<5} {density:<4} "
+                          f"{benchmark:<20} {seconds:.6f}s", file=sys.stderr)
+
+    return results
+
+
+def compare(results: list[dict],
+            baseline: list[dict],
+            tolerance: float,
+            floor: float = 0.0) -> list[str]:
+    '''
+    Returns a description of every result slower than the baseline by more than
+    the tolerance and by more than floor seconds, so timer noise on the
+    shortest cases isn't reported
+    '''
+    def key(record: dict) -> tuple:
+        return record["engine"], record["size"], record["density"], record["benchmark"]
+
+    expected = {key(record): record["seconds"] for record in baseline}
+
+    return [f"{' '.join(map(str, key(record)))}: {record['seconds']:.6f}s "
+            f"(baseline {expected[key(record)]:.6f}s)"
+            for record in results
+            if key(record) in expected
+            and record["seconds"] > expected[key(record)] * (1 + tolerance)
+            and record["seconds"] - expected[key(record)] > floor]
+
+
+def main(args: list[str]) -> int:
+    '''
+    Parses the arguments, runs the benchmarks and compares them with the baseline
+    '''
+    parser = argparse.ArgumentParser(description="Benchmarks the minesweeper engine")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES.keys(), default=list(ENGINES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--densities", nargs="+", type=float, default=DEFAULT_DENSITIES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="file to write the results to as JSON")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown relative to the baseline")
+    parser.add_argument("--floor", type=float, default=0.001,
+                        help="smallest slowdown in seconds that is reported")
+    options = parser.parse_args(args)
+
+    results = run(options.engines, options.sizes, options.densities, options.repeat)
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+
+    if not options.baseline:
+        return 0
+
+    with open(options.baseline, "r", encoding="utf-8") as file:
+        regressions = compare(results, json.load(file), options.tolerance, options.floor)
+
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
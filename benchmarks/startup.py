@@ -0,0 +1,106 @@
+'''
+Startup benchmarks module
+
+Times cold starts of the entry point in new processes, from launching the
+interpreter until the CLI ran a short script or the GUI drew its first frame.
+The GUI uses the dummy SDL video driver, so no display is needed. Run it with:
+
+    python -m benchmarks.startup --output startup.json --baseline benchmarks/startup_baseline.json
+'''
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from statistics import median
+from time import perf_counter
+
+# The first frame of the GUI exits the process once it is on the screen
+GUI_FIRST_FRAME: str = """
+import pygame
+update = pygame.display.update
+def first_frame(*args):
+    update(*args)
+    raise SystemExit(0)
+pygame.display.update = first_frame
+from src.minesweeper import main
+main(["gui"])
+"""
+MODES: dict[str, tuple[list[str], str]] = {
+    "python": (["-c", "pass"], ""),
+    "cli": (["-m", "src.minesweeper", "cli", "--batch", "-", "--output", "none"],
+            "new 16 30 99\nshow 8 15\nexit\n"),
+    "gui": (["-c", GUI_FIRST_FRAME], ""),
+}
+
+
+def measure(mode: str, repeat: int) -> dict[str, float]:
+    '''
+    Returns the best and the median time of starting a mode over a number of runs
+    '''
+    args, commands = MODES[mode]
+    env = {**os.environ, "SDL_VIDEODRIVER": "dummy", "SDL_AUDIODRIVER": "dummy"}
+    times = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        subprocess.run([sys.executable, *args], input=commands, text=True, env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append(perf_counter() - start)
+
+    return {"seconds": min(times), "median": median(times)}
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    '''
+    Returns a description of every mode slower than the baseline by more than the tolerance
+    '''
+    expected = {record["mode"]: record["seconds"] for record in baseline}
+
+    return [f"{record['mode']}: {record['seconds']:.6f}s "
+            f"(baseline {expected[record['mode']]:.6f}s)"
+            for record in results
+            if record["mode"] in expected
+            and record["seconds"] > expected[record["mode"]] * (1 + tolerance)]
+
+
+def main(args: list[str]) -> int:
+    '''
+    Parses the arguments, times the modes and compares them with the baseline
+    '''
+    parser = argparse.ArgumentParser(description="Benchmarks the startup of minesweeper")
+    parser.add_argument("--modes", nargs="+", choices=MODES.keys(), default=list(MODES))
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="file to write the results to as JSON")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown relative to the baseline")
+    options = parser.parse_args(args)
+
+    results = []
+    for mode in options.modes:
+        results.append({"mode": mode, **measure(mode, options.repeat)})
+        print(f"{mode:<7} best {results[-1]['seconds']:.6f}s "
+              f"median {results[-1]['median']:.6f}s", file=sys.stderr)
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+
+    if not options.baseline:
+        return 0
+
+    with open(options.baseline, "r", encoding="utf-8") as file:
+        regressions = compare(results, json.load(file), options.tolerance)
+
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,277 @@
+"""
+Base board module
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from random import Random
+from typing import Callable
+
+from src.base import instrumentation
+
+
+class BaseBoard(ABC):
+    """
+    This class holds the game state and the moves shared by the board engines.
+    An engine stores the tiles and implements the protected hooks that look
+    at and change them, the moves check the state of the game before using them.
+    """
+
+    # Random cells tried before listing the free ones when picking a free cell
+    __PICK_ATTEMPTS: int = 64
+
+    def __init__(self, rows: int, cols: int, num_mines: int, seed: Random | int | None):
+        self._rng: Random = seed if isinstance(seed, Random) else Random(seed)
+        self._rows: int = rows
+        self._cols: int = cols
+        self._num_mines: int = num_mines
+        self._lose: bool = False
+        self._discovered: int = 0
+        self._started: bool = False
+        # Most tiles revealed by the flood of a single move
+        self._max_reveal: float = float("inf")
+
+    @abstractmethod
+    def _generate_layout(self):
+        """
+        Places the mines of a board that has not started yet, ahead of its first click
+        """
+
+    @abstractmethod
+    def _reveal(self, x: int, y: int) -> bool:
+        """
+        Reveals a single tile if possible.
+        Returns whether it was revealed.
+        """
+
+    @abstractmethod
+    def _is_empty(self, x: int, y: int) -> bool:
+        """
+        Checks if a tile is not a mine and has no neighbouring mines
+        """
+
+    @abstractmethod
+    def _toggle_mark(self, x: int, y: int) -> bool:
+        """
+        Marks/unmarks a hidden tile.
+        Returns whether it was toggled.
+        """
+
+    @abstractmethod
+    def _can_chord(self, x: int, y: int) -> bool:
+        """
+        Checks if a tile is revealed and has as many marked neighbours as neighbouring mines
+        """
+
+    @abstractmethod
+    def repr_tile(self, x: int, y: int) -> str:
+        """
+        Returns the character representation of the board[x][y] tile
+        """
+
+    @abstractmethod
+    def repr(self) -> list[list[str]]:
+        """
+        Returns a mxn array of character representations of the tiles
+        """
+
+    def _begin_game(self, x: int, y: int):
+        """
+        Starts a game from showing the board[x][y] tile, before it is revealed
+        """
+
+    def _relocate_mines(self,
+                        x: int,
+                        y: int,
+                        is_mine: Callable[[int, int], bool],
+                        move_mine: Callable[[int, int, int, int], None]):
+        """
+        Moves the mines near board[x][y] to random free tiles away from it,
+        so the engine only updates the neighbour counts around the moved mines
+        """
+        def is_free(row: int, col: int) -> bool:
+            return not is_mine(row, col) and (abs(row - x) > 1 or abs(col - y) > 1)
+
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                if self._valid_coords(x + dx, y + dy) and is_mine(x + dx, y + dy):
+                    move_mine(x + dx, y + dy,
+                              *self.pick_free_coords(self._rows, self._cols, is_free, self._rng))
+
+    def _valid_coords(self, x: int, y: int) -> bool:
+        """
+        Checks if coordinates are valid
+        """
+        return 0 <= x < self._rows and 0 <= y < self._cols
+
+    def _show_region(self, x: int, y: int) -> list[tuple[int, int]]:
+        """
+        Reveals a tile and, iteratively, the region of tiles around it,
+        at most max_reveal tiles at once.
+        Returns the coordinates of the revealed tiles.
+        """
+        if not self._reveal(x, y):
+            return []
+
+        revealed: list[tuple[int, int]] = [(x, y)]
+        queue: deque[tuple[int, int]] = deque()
+
+        if self._is_empty(x, y):
+            queue.append((x, y))
+
+        while queue and len(revealed) < self._max_reveal:
+            x, y = queue.popleft()
+            for dx in [-1, 0, 1]:
+                for dy in [-1, 0, 1]:
+                    if (
+                        (dx, dy) != (0, 0)
+                        and self._valid_coords(x + dx, y + dy)
+                        and self._reveal(x + dx, y + dy)
+                    ):
+                        revealed.append((x + dx, y + dy))
+                        if self._is_empty(x + dx, y + dy):
+                            queue.append((x + dx, y + dy))
+
+        if len(revealed) > 1:
+            instrumentation.record("board.flood_fill", len(revealed))
+
+        return revealed
+
+    def restart(self):
+        """
+        Resets the board
+        """
+        self._lose = False
+        self._discovered = 0
+        self._started = False
+        self._generate_layout()
+
+    def get_rows(self) -> int:
+        """
+        Returns the amount of rows on the board
+        """
+        return self._rows
+
+    def get_cols(self) -> int:
+        """
+        Returns the amount of columns on the board
+        """
+        return self._cols
+
+    def get_mines(self) -> int:
+        """
+        Returns the amount of mines on the board
+        """
+        return self._num_mines
+
+    def has_started(self) -> bool:
+        """
+        Checks if the game has started (a tile was shown)
+        """
+        return self._started
+
+    def has_won(self):
+        """
+        Checks if the game was won
+        """
+        return not (self.should_continue() or self._lose)
+
+    def has_lost(self):
+        """
+        Checks if the game was lost
+        """
+        return self._lose
+
+    def should_continue(self):
+        """
+        Checks if any more moves can be made
+        """
+        return (
+            not self._lose
+            and self._discovered != self._rows * self._cols - self.get_mines()
+        )
+
+    def show(self, x: int, y: int) -> list[tuple[int, int, str]]:
+        """
+        Reveals a tile.
+        Returns the tiles whose representation changed with their new characters.
+        """
+        if not self.should_continue() or not self._valid_coords(x, y):
+            return []
+
+        if not self._started:
+            self._started = True
+            self._begin_game(x, y)
+
+        changes = [(cx, cy, self.repr_tile(cx, cy)) for cx, cy in self._show_region(x, y)]
+        instrumentation.record("board.revealed", len(changes))
+
+        return changes
+
+    def toggle_marked(self, x: int, y: int) -> list[tuple[int, int, str]]:
+        """
+        Marks/unmarks a tile if possible.
+        Returns the tiles whose representation changed with their new characters.
+        """
+        if (
+            not self.should_continue()
+            or not self._valid_coords(x, y)
+            or not self._started
+            or not self._toggle_mark(x, y)
+        ):
+            return []
+
+        return [(x, y, self.repr_tile(x, y))]
+
+    def chord(self, x: int, y: int) -> list[tuple[int, int, str]]:
+        """
+        Reveals the unmarked neighbours of a revealed number
+        if it has as many marked neighbours as neighbouring mines.
+        Returns the tiles whose representation changed with their new characters.
+        """
+        if (
+            not self.should_continue()
+            or not self._valid_coords(x, y)
+            or not self._started
+            or not self._can_chord(x, y)
+        ):
+            return []
+
+        return [
+            (cx, cy, self.repr_tile(cx, cy))
+            for dx in [-1, 0, 1]
+            for dy in [-1, 0, 1]
+            if (dx, dy) != (0, 0) and self._valid_coords(x + dx, y + dy)
+            for cx, cy in self._show_region(x + dx, y + dy)
+        ]
+
+    def print(self):
+        """
+        Prints the board
+        """
+        for row in self.repr():
+            print(" ".join(row))
+
+    @staticmethod
+    def pick_free_coords(
+        rows: int,
+        cols: int,
+        is_free: Callable[[int, int], bool],
+        rng: Random,
+    ) -> tuple[int, int]:
+        """
+        Picks random coordinates that are free.
+        Random cells are tried first, which takes O(1) expected time unless
+        almost no cell is free, only then the free cells are listed.
+        """
+        for _ in range(BaseBoard.__PICK_ATTEMPTS):
+            x, y = divmod(rng.randrange(rows * cols), cols)
+            if is_free(x, y):
+                return x, y
+
+        free = [(x, y) for x in range(rows) for y in range(cols) if is_free(x, y)]
+
+        if not free:
+            raise Exception("Invalid data")
+
+        return free[rng.randrange(len(free))]
@@ -3,149 +3,201 @@ Board module
 """
 
 from itertools import product
-from random import randint
+from random import Random
+
+from src.base import instrumentation
+from src.base.base_board import BaseBoard
+from src.base.serialization import BoardState
 from src.base.tile import Tile
 
 
-class Board:
+class Board(BaseBoard):
     """
     This class represents a mxn board of tiles.
     It provides an interface for interacting with all of the tiles.
     """
 
-    def __init__(self, board_info: tuple[int, int, int] | list[list[Tile]]):
-        self.__lose: bool = False
-        self.__discovered: int = 0
+    __NEIGHBOURS: list[tuple[int, int]] = [
+        (dx, dy) for dx, dy in product([-1, 0, 1], [-1, 0, 1]) if (dx, dy) != (0, 0)
+    ]
+
+    def __init__(
+        self,
+        board_info: tuple[int, int, int] | list[list[Tile]] | BoardState,
+        seed: Random | int | None = None,
+    ):
+        # A saved board continues with the tiles it had revealed
+        state = board_info if isinstance(board_info, BoardState) else None
+        if state is not None:
+            board_info = self.__tiles_from_state(state) if state.started \
+                else (state.rows, state.cols, state.num_mines)
 
         if isinstance(board_info, tuple):
-            rows, cols, num_mines = board_info
-            self.__rows: int = rows
-            self.__cols: int = cols
-            self.__num_mines: int = num_mines
-            self.__started: bool = False
-            self.__board: list[list[Tile | None]] = [
-                [None for _ in range(cols)] for _ in range(rows)
-            ]
-            self.__neighbouring_mines: list[list[int]] = [
-                [0 for _ in range(cols)] for _ in range(rows)
-            ]
+            super().__init__(*board_info, seed)
+            self._generate_layout()
             return
 
-        self.__rows, self.__cols = len(board_info), len(board_info[0])
-        self.__num_mines = sum(
+        super().__init__(len(board_info), len(board_info[0]), sum(
             map(
                 sum,
                 [[1 if tile.is_mine() else 0 for tile in row] for row in board_info],
             )
-        )
+        ), seed)
 
-        if not self.is_valid_board(self.__rows, self.__cols, self.__num_mines):
+        if not self.is_valid_board(self._rows, self._cols, self._num_mines):
             raise Exception("Invalid board")
 
         self.__neighbouring_mines: list[list[int]] = [
-            [0 for _ in range(self.__cols)] for _ in range(self.__rows)
+            [0 for _ in range(self._cols)] for _ in range(self._rows)
         ]
-        self.__board = board_info
-        self.__started = True
+        self.__board: list[list[Tile]] = board_info
+        self._started = True
+        # Amount of marked neighbours of every tile, updated on every toggle
+        self.__flagged_neighbours: list[list[int]] = [
+            [0 for _ in range(self._cols)] for _ in range(self._rows)
+        ]
+        # Regions of empty tiles are labelled when they are first revealed.
+        # Only the labels of empty tiles are meaningful, -1 is not labelled yet.
+        self.__region_of: list[list[int]] = [[-1] * self._cols for _ in range(self._rows)]
+        self.__regions: list[list[tuple[int, int]]] = []
         self.__calculate_neighbouring_mines()
 
-    def __begin_game(self, x: int, y: int):
+        for x, row in enumerate(board_info):
+            for y, tile in enumerate(row):
+                if tile.is_marked():
+                    self.__update_flagged_neighbours(x, y, 1)
+
+        if state is not None:
+            for row in board_info:
+                for tile in row:
+                    if not tile.is_hidden():
+                        self._discovered += 1
+                        self._lose |= tile.is_mine()
+
+    @staticmethod
+    def __tiles_from_state(state: BoardState) -> list[list[Tile]]:
         """
-        Starts a game from showing the board[x][y] tile.
-        Bombs can't be placed near board[x][y].
+        Creates the tiles of a saved board
         """
-        forbidden: tuple[int, int] = set()
-
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if self.__valid_coords(x + dx, y + dy):
-                    forbidden.add((x + dx, y + dy))
+        import numpy as np  # pylint: disable=import-outside-toplevel
 
-        mine_coords = Board.generate_mine_coords(
-            self.__rows, self.__cols, self.__num_mines, forbidden
-        )
+        tiles = [[Tile(is_mine) for is_mine in row] for row in state.mines.tolist()]
 
-        for i in range(self.__rows):
-            for j in range(self.__cols):
-                self.__board[i][j] = Tile((i, j) in mine_coords)
+        for x, y in zip(*np.nonzero(~state.hidden)):
+            tiles[x][y].show()
+        for x, y in zip(*np.nonzero(state.marked)):
+            tiles[x][y].toggle_marked()
 
-        self.__calculate_neighbouring_mines()
+        return tiles
 
-    def restart(self):
+    def _generate_layout(self):
         """
-        Resets the board
+        Places the mines of a board that has not started yet, ahead of its first click
         """
-        self.__lose = False
-        self.__discovered = 0
-        self.__started = False
-        self.__board = [[None for _ in range(self.__rows)] for _ in range(self.__cols)]
-        self.__neighbouring_mines = [
-            [0 for _ in range(self.__cols)] for _ in range(self.__rows)
+        mine_coords = Board.generate_mine_coords(
+            self._rows, self._cols, self._num_mines, set(), self._rng
+        )
+
+        self._started = False
+        self.__board = [
+            [Tile((x, y) in mine_coords) for y in range(self._cols)]
+            for x in range(self._rows)
         ]
+        self.__neighbouring_mines = [[0] * self._cols for _ in range(self._rows)]
+        self.__flagged_neighbours = [[0] * self._cols for _ in range(self._rows)]
+        self.__region_of = [[-1] * self._cols for _ in range(self._rows)]
+        self.__regions = []
+        self.__calculate_neighbouring_mines()
 
-    def get_rows(self) -> int:
+    def _begin_game(self, x: int, y: int):
         """
-        Returns the amount of rows on the board
+        Starts a game from showing the board[x][y] tile.
+        The mines near board[x][y] are moved to random free tiles away from it,
+        so only the neighbour counts around the moved mines change.
         """
-        return self.__rows
+        self._relocate_mines(x, y, lambda row, col: self.__board[row][col].is_mine(),
+                             self.__move_mine)
 
-    def get_cols(self) -> int:
+    def __move_mine(self, old_x: int, old_y: int, new_x: int, new_y: int):
         """
-        Returns the amount of columns on the board
+        Moves a mine to a free tile and updates the neighbour counts around both
         """
-        return self.__cols
+        self.__board[old_x][old_y], self.__board[new_x][new_y] = Tile(False), Tile(True)
+        self.__update_neighbouring_mines(old_x, old_y, -1)
+        self.__update_neighbouring_mines(new_x, new_y, 1)
 
-    def get_mines(self) -> int:
-        """
-        Returns the amount of mines on the board
-        """
-        return self.__num_mines
+    @instrumentation.timed("board.neighbours")
+    def __calculate_neighbouring_mines(self):
+        for x in range(self._rows):
+            for y in range(self._cols):
+                if not self.__board[x][y].is_mine():
+                    continue
+                for dx, dy in self.__NEIGHBOURS:
+                    if self._valid_coords(x + dx, y + dy):
+                        self.__neighbouring_mines[x + dx][y + dy] += 1
 
-    def has_started(self) -> bool:
+    def __update_neighbouring_mines(self, x: int, y: int, change: int):
         """
-        Checks if the game has started (a tile was shown)
+        Updates the neighbouring mine counts around a tile that gained or lost a mine
         """
-        return self.__started
+        for dx, dy in self.__NEIGHBOURS:
+            if self._valid_coords(x + dx, y + dy):
+                self.__neighbouring_mines[x + dx][y + dy] += change
 
-    def has_won(self):
+    def _is_empty(self, x: int, y: int) -> bool:
         """
-        Checks if the game was won
+        Checks if a tile is not a mine and has no neighbouring mines
         """
-        return not (self.should_continue() or self.__lose)
+        return not self.__neighbouring_mines[x][y] and not self.__board[x][y].is_mine()
 
-    def has_lost(self):
+    @instrumentation.timed("board.regions")
+    def __collect_region(self, x: int, y: int) -> list[tuple[int, int]]:
         """
-        Checks if the game was lost
+        Labels the empty region containing board[x][y] and collects its tiles.
+        Every region stores its empty tiles followed by the numbered tiles
+        bordering it, so it can be revealed without searching it again.
         """
-        return self.__lose
+        # Numbered tiles only use their label to avoid duplicate border entries
+        labels = self.__region_of
+        region_id = labels[x][y] = len(self.__regions)
+        region: list[tuple[int, int]] = []
+        border: list[tuple[int, int]] = []
+        stack: list[tuple[int, int]] = [(x, y)]
 
-    def should_continue(self):
-        """
-        Checks if any more moves can be made
-        """
-        return (
-            not self.__lose
-            and self.__discovered != self.__rows * self.__cols - self.__num_mines
-        )
+        while stack:
+            cx, cy = stack.pop()
+            region.append((cx, cy))
 
-    def __calculate_neighbouring_mines(self):
-        for x in range(self.__rows):
-            for y in range(self.__cols):
-                for dx, dy in product([-1, 0, 1], [-1, 0, 1]):
-                    if (
-                        self.__valid_coords(x + dx, y + dy)
-                        and (dx, dy) != (0, 0)
-                        and self.__board[x][y]
-                        and self.__board[x][y].is_mine()
-                    ):
-                        self.__neighbouring_mines[x + dx][y + dy] += 1
+            for dx, dy in self.__NEIGHBOURS:
+                nx, ny = cx + dx, cy + dy
+                if (
+                    0 <= nx < self._rows
+                    and 0 <= ny < self._cols
+                    and labels[nx][ny] != region_id
+                ):
+                    labels[nx][ny] = region_id
+                    if self._is_empty(nx, ny):
+                        stack.append((nx, ny))
+                    else:
+                        border.append((nx, ny))
+
+        return region + border
 
     @staticmethod
+    @instrumentation.timed("board.mines")
     def generate_mine_coords(
-        rows: int, cols: int, num_mines: int, forbidden: tuple[int, int]
+        rows: int,
+        cols: int,
+        num_mines: int,
+        forbidden: set[tuple[int, int]],
+        rng: Random | int | None = None,
     ) -> set[tuple[int, int]]:
         """
-        Generates a fixed amount of mines on non-forbidden coordinates
+        Generates a fixed amount of mines on non-forbidden coordinates.
+        Runs a partial Fisher-Yates shuffle over the flat cell indices,
+        tracking only the swapped positions, so it takes O(forbidden + mines)
+        time regardless of the mine density.
+        A seed or Random instance can be passed for reproducible boards.
         """
         if (
             rows * cols < num_mines
@@ -153,12 +205,30 @@ class Board:
         ):
             raise Exception("Invalid data")
 
+        if not isinstance(rng, Random):
+            rng = Random(rng)
+
+        # Virtual array of the remaining cells: position -> flat index and back
+        cell_at: dict[int, int] = {}
+        position_of: dict[int, int] = {}
+        size = rows * cols
+
+        def take(position: int) -> int:
+            nonlocal size
+            size -= 1
+            cell = cell_at.get(position, position)
+            last = cell_at.get(size, size)
+            cell_at[position], position_of[last] = last, position
+            return cell
+
+        for x, y in forbidden:
+            cell = x * cols + y
+            take(position_of.get(cell, cell))
+
         mine_coords: set[tuple[int, int]] = set()
 
-        while len(mine_coords) < num_mines:
-            x, y = randint(0, rows - 1), randint(0, cols - 1)
-            if (x, y) not in forbidden:
-                mine_coords.add((x, y))
+        for _ in range(num_mines):
+            mine_coords.add(divmod(take(rng.randrange(size)), cols))
 
         return mine_coords
 
@@ -175,71 +245,84 @@ class Board:
             and rows * cols - mines > 9
         )
 
-    def __valid_coords(self, x: int, y: int) -> bool:
+    def _reveal(self, x: int, y: int) -> bool:
         """
-        Checks if coordinates are valid
+        Reveals a single tile if possible.
+        Returns whether it was revealed.
         """
-        return 0 <= x < self.__rows and 0 <= y < self.__cols
+        tile = self.__board[x][y]
 
-    def __check_for_neighbours(self, x: int, y: int):
-        """
-        Checks for neighbour tiles to possibly reveal them
-        """
-        if not self.__valid_coords(x, y):
-            return
+        if not tile.is_hidden() or tile.is_marked():
+            return False
 
-        tile = self.__board[x][y]
+        tile.show()
+        self._discovered += 1
 
-        if tile.is_hidden() and not tile.is_marked():
-            tile.show()
-            self.__discovered += 1
+        if tile.is_mine():
+            self._lose = True
 
-            if tile.is_mine():
-                self.__lose = True
-            elif not self.__neighbouring_mines[x][y]:
-                self.__show_neighbours(x, y)
+        return True
 
-    def __show_neighbours(self, x: int, y: int):
+    def _show_region(self, x: int, y: int) -> list[tuple[int, int]]:
         """
-        Shows neighbouring tiles if possible
+        Reveals a tile and, if it is empty, its whole labeled region.
+        Marked tiles stop the flood, so a region containing any of them
+        is searched again like on the other engines.
+        Returns the coordinates of the revealed tiles.
         """
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != dy:
-                    self.__check_for_neighbours(x + dx, y + dy)
+        tile = self.__board[x][y]
 
-    def show(self, x: int, y: int):
+        if not tile.is_hidden() or tile.is_marked() or not self._is_empty(x, y):
+            return super()._show_region(x, y)
+
+        if self.__region_of[x][y] == -1:
+            self.__regions.append(self.__collect_region(x, y))
+
+        region = self.__regions[self.__region_of[x][y]]
+
+        if any(self.__board[cx][cy].is_marked() for cx, cy in region):
+            return super()._show_region(x, y)
+
+        self._reveal(x, y)
+        instrumentation.record("board.flood_fill", len(region))
+
+        return [(x, y)] + [(cx, cy) for cx, cy in region if self._reveal(cx, cy)]
+
+    def _toggle_mark(self, x: int, y: int) -> bool:
         """
-        Reveals a tile
+        Marks/unmarks a hidden tile.
+        Returns whether it was toggled.
         """
-        if not self.should_continue():
-            return
+        if not self.__board[x][y].is_hidden():
+            return False
 
-        if not self.__started:
-            self.__started = True
-            self.__begin_game(x, y)
+        self.__board[x][y].toggle_marked()
+        self.__update_flagged_neighbours(x, y, 1 if self.__board[x][y].is_marked() else -1)
 
-        self.__check_for_neighbours(x, y)
+        return True
 
-    def toggle_marked(self, x: int, y: int):
+    def __update_flagged_neighbours(self, x: int, y: int, change: int):
         """
-        Marks/unmarks a tile if possible
+        Updates the marked neighbour counts around a tile that was marked or unmarked
         """
-        if (
-            not self.should_continue()
-            or not self.__valid_coords(x, y)
-            or not self.__started
-        ):
-            return
+        for dx, dy in self.__NEIGHBOURS:
+            if self._valid_coords(x + dx, y + dy):
+                self.__flagged_neighbours[x + dx][y + dy] += change
 
-        self.__board[x][y].toggle_marked()
+    def _can_chord(self, x: int, y: int) -> bool:
+        """
+        Checks if a tile is revealed and has as many marked neighbours as neighbouring mines
+        """
+        return (
+            not self.__board[x][y].is_hidden()
+            and self.__flagged_neighbours[x][y] == self.__neighbouring_mines[x][y]
+        )
 
-    def print(self):
+    def repr_tile(self, x: int, y: int) -> str:
         """
-        Prints the board
+        Returns the character representation of the board[x][y] tile
         """
-        for row in self.repr():
-            print(" ".join(row))
+        return Tile.repr(self.__board[x][y], self.__neighbouring_mines[x][y])
 
     def repr(self) -> list[list[str]]:
         """
@@ -252,3 +335,22 @@ class Board:
             ]
             for row, tile_row in enumerate(self.__board)
         ]
+
+    def get_state(self) -> BoardState:
+        """
+        Returns the state of the board that is saved
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        shape = (self._rows, self._cols)
+
+        if not self._started:
+            return BoardState(*shape, self._num_mines, False,
+                              np.zeros(shape, dtype=bool),
+                              np.ones(shape, dtype=bool),
+                              np.zeros(shape, dtype=bool))
+
+        return BoardState(*shape, self._num_mines, True,
+                          *(np.array([[query(tile) for tile in row] for row in self.__board],
+                                     dtype=bool)
+                            for query in (Tile.is_mine, Tile.is_hidden, Tile.is_marked)))
@@ -0,0 +1,323 @@
+"""
+Chunked board module
+"""
+
+from math import floor
+from random import Random
+
+from src.base.base_board import BaseBoard
+from src.base.board import Board
+
+
+class ChunkedBoard(BaseBoard):  # pylint: disable=too-many-instance-attributes
+    """
+    This class represents a board that is generated in square chunks only when
+    they are first touched, so memory grows with the explored area instead of
+    the size of the board.
+    The mines of a chunk are placed from the board seed hashed with the chunk
+    coordinates. On a bounded board the mine count is split over the chunks by
+    recursively halving the chunk range, which keeps the total exact while any
+    chunk can be generated on its own. An endless board is created from a mine
+    density instead of dimensions and accepts any coordinates.
+    Neighbouring mine and mark counts are computed on demand across chunk borders.
+    """
+
+    __MINE: int = 1
+    __REVEALED: int = 2
+    __MARKED: int = 4
+    __UNKNOWN: int = 255
+
+    def __init__(
+        self,
+        board_info: tuple[int, int, int] | float,
+        seed: Random | int | None = None,
+        chunk_size: int = 64,
+        max_reveal: int = 1_000_000,
+    ):
+        if isinstance(board_info, tuple):
+            super().__init__(*board_info, seed)
+            self.__density: float = self._num_mines / (self._rows * self._cols)
+        else:
+            super().__init__(0, 0, 0, seed)
+            self.__density = board_info
+
+        self.__chunk_size: int = chunk_size
+        self.__endless: bool = not self._rows
+        if self.__endless:
+            self._max_reveal = max_reveal
+        self.__chunk_rows: int = -(-self._rows // chunk_size)
+        self.__chunk_cols: int = -(-self._cols // chunk_size)
+        self.__safe: set[tuple[int, int]] = set()
+        self._generate_layout()
+
+    def _generate_layout(self):
+        """
+        Prepares a new layout, chunks are only generated when they are first touched
+        """
+        self.__seed: int = self._rng.getrandbits(63)
+        self.__safe = set()
+        self.__dropped_mines: int = 0
+        # Chunk coordinates -> flags and neighbouring mine counts of its tiles
+        self.__chunks: dict[tuple[int, int], bytearray] = {}
+        self.__counts: dict[tuple[int, int], bytearray] = {}
+
+    def get_mines(self) -> int:
+        """
+        Returns the amount of mines on the board, 0 if it is endless
+        """
+        return self._num_mines - self.__dropped_mines
+
+    def get_chunk_count(self) -> int:
+        """
+        Returns the amount of chunks generated so far
+        """
+        return len(self.__chunks)
+
+    def should_continue(self):
+        """
+        Checks if any more moves can be made
+        """
+        return self.__endless and not self._lose or super().should_continue()
+
+    def __chunk_shape(self, cx: int, cy: int) -> tuple[int, int]:
+        """
+        Returns the amount of rows and columns of a chunk, smaller at the board edges
+        """
+        if self.__endless:
+            return self.__chunk_size, self.__chunk_size
+
+        return (min(self.__chunk_size, self._rows - cx * self.__chunk_size),
+                min(self.__chunk_size, self._cols - cy * self.__chunk_size))
+
+    def __area_before(self, index: int) -> int:
+        """
+        Returns the amount of tiles in the chunks before a chunk in row major order
+        """
+        cx, cy = divmod(index, self.__chunk_cols)
+
+        return (min(cx * self.__chunk_size, self._rows) * self._cols
+                + self.__chunk_shape(cx, 0)[0] * min(cy * self.__chunk_size, self._cols)
+                if cx < self.__chunk_rows else self._rows * self._cols)
+
+    @staticmethod
+    def __round(value: float, key: str) -> int:
+        """
+        Rounds a value up or down at random, with the chance of the fractional part
+        """
+        return floor(value) + (Random(key).random() < value - floor(value))
+
+    def __chunk_mines(self, cx: int, cy: int) -> int:
+        """
+        Returns the amount of mines in a chunk.
+        On an endless board it follows the density, on a bounded board the mines
+        of a range of chunks are split between its halves by area until only
+        the chunk is left.
+        """
+        rows, cols = self.__chunk_shape(cx, cy)
+
+        if self.__endless:
+            return self.__round(self.__density * rows * cols, f"{self.__seed}:{cx}:{cy}")
+
+        index = cx * self.__chunk_cols + cy
+        low, high, mines = 0, self.__chunk_rows * self.__chunk_cols, self._num_mines
+
+        while high - low > 1:
+            middle = (low + high) // 2
+            area = self.__area_before(high) - self.__area_before(low)
+            left_area = self.__area_before(middle) - self.__area_before(low)
+            left = self.__round(mines * left_area / area, f"{self.__seed}:{low}:{high}")
+            left = min(max(left, mines - (area - left_area)), left_area, mines)
+
+            if index < middle:
+                high, mines = middle, left
+            else:
+                low, mines = middle, mines - left
+
+        return mines
+
+    def __chunk(self, cx: int, cy: int) -> bytearray:
+        """
+        Returns the flags of the tiles of a chunk, placing its mines on first use
+        """
+        chunk = self.__chunks.get((cx, cy))
+
+        if chunk is not None:
+            return chunk
+
+        rows, cols = self.__chunk_shape(cx, cy)
+        forbidden = {(x - cx * self.__chunk_size, y - cy * self.__chunk_size)
+                     for x, y in self.__safe
+                     if (x // self.__chunk_size, y // self.__chunk_size) == (cx, cy)}
+        mines = self.__chunk_mines(cx, cy)
+
+        if mines > rows * cols - len(forbidden):
+            # Not enough room next to the first click, the extra mines are dropped
+            self.__dropped_mines += mines - (rows * cols - len(forbidden))
+            mines = rows * cols - len(forbidden)
+
+        chunk = bytearray(self.__chunk_size * self.__chunk_size)
+        for x, y in Board.generate_mine_coords(rows, cols, mines, forbidden,
+                                               Random(f"{self.__seed}:{cx}:{cy}")):
+            chunk[x * self.__chunk_size + y] = self.__MINE
+
+        self.__chunks[(cx, cy)] = chunk
+        self.__counts[(cx, cy)] = bytearray([self.__UNKNOWN]) * len(chunk)
+
+        return chunk
+
+    def __locate(self, x: int, y: int) -> tuple[tuple[int, int], int]:
+        """
+        Returns the chunk of a tile and the index of the tile in it
+        """
+        cx, row = divmod(x, self.__chunk_size)
+        cy, col = divmod(y, self.__chunk_size)
+        return (cx, cy), row * self.__chunk_size + col
+
+    def _valid_coords(self, x: int, y: int) -> bool:
+        """
+        Checks if coordinates are valid, any coordinates are on an endless board
+        """
+        return self.__endless or super()._valid_coords(x, y)
+
+    def __neighbouring_mines(self, x: int, y: int) -> int:
+        """
+        Returns the amount of mines around a tile, generating the neighbouring chunks
+        """
+        key, index = self.__locate(x, y)
+        counts = self.__counts[key]
+
+        if counts[index] == self.__UNKNOWN:
+            total = 0
+            for dx in [-1, 0, 1]:
+                for dy in [-1, 0, 1]:
+                    if (dx, dy) != (0, 0) and self._valid_coords(x + dx, y + dy):
+                        neighbour, neighbour_index = self.__locate(x + dx, y + dy)
+                        total += self.__chunk(*neighbour)[neighbour_index] & self.__MINE
+            counts[index] = total
+
+        return counts[index]
+
+    def __flagged_neighbours(self, x: int, y: int) -> int:
+        """
+        Returns the amount of marked tiles around a tile.
+        Marked tiles are in generated chunks, so no chunks are generated.
+        """
+        total = 0
+
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                if (dx, dy) != (0, 0) and self._valid_coords(x + dx, y + dy):
+                    neighbour, neighbour_index = self.__locate(x + dx, y + dy)
+                    chunk = self.__chunks.get(neighbour)
+                    total += chunk is not None and bool(chunk[neighbour_index] & self.__MARKED)
+
+        return total
+
+    def _reveal(self, x: int, y: int) -> bool:
+        """
+        Reveals a single tile if possible, counting its neighbouring mines,
+        so it can be looked at without generating any chunks.
+        Returns whether it was revealed.
+        """
+        key, index = self.__locate(x, y)
+        chunk = self.__chunk(*key)
+
+        if chunk[index] & (self.__REVEALED | self.__MARKED):
+            return False
+
+        chunk[index] |= self.__REVEALED
+        self._discovered += 1
+
+        if chunk[index] & self.__MINE:
+            self._lose = True
+        else:
+            self.__neighbouring_mines(x, y)
+
+        return True
+
+    def _is_empty(self, x: int, y: int) -> bool:
+        """
+        Checks if a tile is not a mine and has no neighbouring mines
+        """
+        key, index = self.__locate(x, y)
+        return not self.__chunk(*key)[index] & self.__MINE and not self.__neighbouring_mines(x, y)
+
+    def _begin_game(self, x: int, y: int):
+        """
+        Keeps the mines away from the first tile shown
+        """
+        self.__safe = {(x + dx, y + dy) for dx in [-1, 0, 1] for dy in [-1, 0, 1]
+                       if self._valid_coords(x + dx, y + dy)}
+
+    def _toggle_mark(self, x: int, y: int) -> bool:
+        """
+        Marks/unmarks a hidden tile.
+        Returns whether it was toggled.
+        """
+        key, index = self.__locate(x, y)
+        chunk = self.__chunk(*key)
+
+        if chunk[index] & self.__REVEALED:
+            return False
+
+        chunk[index] ^= self.__MARKED
+        return True
+
+    def _can_chord(self, x: int, y: int) -> bool:
+        """
+        Checks if a tile is revealed and has as many marked neighbours as neighbouring mines.
+        Unrevealed tiles may be in chunks that don't exist yet, they are never generated.
+        """
+        key, index = self.__locate(x, y)
+        chunk = self.__chunks.get(key)
+
+        return (
+            chunk is not None
+            and bool(chunk[index] & self.__REVEALED)
+            and self.__flagged_neighbours(x, y) == self.__neighbouring_mines(x, y)
+        )
+
+    def repr_tile(self, x: int, y: int) -> str:
+        """
+        Returns the character representation of the board[x][y] tile.
+        Looking at a tile never generates its chunk.
+        """
+        key, index = self.__locate(x, y)
+        chunk = self.__chunks.get(key)
+
+        if chunk is None or not chunk[index] & (self.__REVEALED | self.__MARKED):
+            return '#'
+        if chunk[index] & self.__MARKED:
+            return 'P'
+        if chunk[index] & self.__MINE:
+            return '*'
+
+        # The neighbouring mines were counted when the tile was revealed
+        mines = self.__counts[key][index]
+        return ' ' if not mines else str(mines)
+
+    def repr_area(self, x: int, y: int, rows: int, cols: int) -> list[list[str]]:
+        """
+        Returns the character representations of a rectangle of tiles
+        starting at board[x][y]
+        """
+        return [[self.repr_tile(i, j) for j in range(y, y + cols)] for i in range(x, x + rows)]
+
+    def repr(self) -> list[list[str]]:
+        """
+        Returns a mxn array of character representations of the tiles.
+        For an endless board it covers the chunks generated so far.
+        """
+        if not self.__endless:
+            return self.repr_area(0, 0, self._rows, self._cols)
+
+        if not self.__chunks:
+            return []
+
+        low_x, low_y = (min(key[i] for key in self.__chunks) for i in range(2))
+        high_x, high_y = (max(key[i] for key in self.__chunks) + 1 for i in range(2))
+
+        return self.repr_area(low_x * self.__chunk_size,
+                              low_y * self.__chunk_size,
+                              (high_x - low_x) * self.__chunk_size,
+                              (high_y - low_y) * self.__chunk_size)
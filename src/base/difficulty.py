@@ -0,0 +1,7 @@
+'''
+Difficulty module
+'''
+
+DIFFICULTY_PRESETS: dict[str, tuple[int, int, int]] = {"easy": (10, 10, 10),
+                                                       "medium": (16, 16, 40),
+                                                       "hard": (16, 30, 99)}
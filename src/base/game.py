@@ -2,8 +2,13 @@
 Game module
 '''
 
+from random import Random
 from time import perf_counter
+from src.base import serialization
 from src.base.board import Board
+from src.base.chunked_board import ChunkedBoard
+from src.base.journal import (Journal, BOARD, CHUNKED_BOARD, NUMPY_BOARD,
+                              CHORD, RESTART, SHOW, TOGGLE)
 from src.base.tile import Tile
 
 
@@ -11,39 +16,119 @@ class Game:
     '''
     This class is used as a wrapper for the board class.
     It stores information about the time a game took to finish.
+    The board storage engine can be selected with board_type
+    (for example NumpyBoard for very large boards) and a seed
+    makes the mine placement reproducible.
+    Games can be saved and loaded again, elapsed is the time played before.
+    With a journal path every move is recorded, so the game can be replayed.
+    A recorded game can be used as a context manager that closes its journal.
     '''
 
-    def __init__(self, board_info: tuple[int, int, int] | list[list[Tile]]):
-        self.__board: Board = Board(board_info)
-        self.__start_time: float = perf_counter()
-        self.__end_time: float = perf_counter()
+    def __init__(self,
+                 board_info: tuple[int, int, int] | list[list[Tile]] | serialization.BoardState,
+                 board_type: type = Board,
+                 seed: Random | int | None = None,
+                 elapsed: float = 0.0,
+                 journal: str | None = None):
+        self.__journal: Journal | None = None
+
+        if journal is not None and not (isinstance(seed, int) and 0 <= seed < 2 ** 64):
+            # The journal needs a seed it can store to rebuild the board
+            seed = (seed if isinstance(seed, Random) else Random(seed)).getrandbits(63)
+
+        self.__board: Board = board_type(board_info, seed)
+        self.__start_time: float = perf_counter() - elapsed
+        self.__end_time: float = self.__start_time + elapsed
+
+        if journal is not None:
+            from src.base.numpy_board import NumpyBoard  # pylint: disable=import-outside-toplevel
+            engines = {Board: BOARD, NumpyBoard: NUMPY_BOARD, ChunkedBoard: CHUNKED_BOARD}
+
+            # The replay can only rebuild bounded boards on the engines it knows
+            if type(self.__board) not in engines or not self.__board.get_rows():
+                raise Exception("Invalid board type")
+
+            self.__journal = Journal(journal,
+                                     (self.__board.get_rows(),
+                                      self.__board.get_cols(),
+                                      self.__board.get_mines()),
+                                     seed,
+                                     serialization.dumps(self.__board.get_state())
+                                     if self.__board.has_started() else None,
+                                     engine=engines[type(self.__board)])
+
+    def __enter__(self) -> "Game":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
 
     def restart(self):
         '''
         Restarts game
         '''
+        if self.__journal is not None:
+            self.__journal.record(RESTART)
+
         self.__board.restart()
 
-    def show(self, x: int, y: int):
+    def show(self, x: int, y: int) -> list[tuple[int, int, str]]:
         '''
         Shows a selected tile.
         If it was the first tile shown start the game timer.
+        Returns the tiles whose representation changed with their new characters.
+        '''
+        if not self.should_continue():
+            return []
+
+        if not self.__board.has_started():
+            self.__start_time = perf_counter()
+
+        if self.__journal is not None:
+            self.__journal.record(SHOW, x, y)
+
+        changes = self.__board.show(x, y)
+
+        if not self.__board.should_continue():
+            self.__end_time = perf_counter()
+            if self.__journal is not None:
+                self.__journal.flush()
+
+        return changes
+
+    def toggle_marked(self, x: int, y: int) -> list[tuple[int, int, str]]:
+        '''
+        Marks/unmarks a tile if game is not over.
+        Returns the tiles whose representation changed with their new characters.
         '''
-        if self.should_continue():
-            if not self.__board.has_started():
-                self.__start_time = perf_counter()
+        if not self.should_continue():
+            return []
 
-            self.__board.show(x, y)
+        if self.__journal is not None:
+            self.__journal.record(TOGGLE, x, y)
 
-            if not self.__board.should_continue():
-                self.__end_time = perf_counter()
+        return self.__board.toggle_marked(x, y)
 
-    def toggle_marked(self, x: int, y: int):
+    def chord(self, x: int, y: int) -> list[tuple[int, int, str]]:
         '''
-        Marks/unmarks a tile if game is not over
+        Reveals the unmarked neighbours of a revealed number whose marks
+        match its mines, if game is not over.
+        Returns the tiles whose representation changed with their new characters.
         '''
-        if self.should_continue():
-            self.__board.toggle_marked(x, y)
+        if not self.should_continue():
+            return []
+
+        if self.__journal is not None:
+            self.__journal.record(CHORD, x, y)
+
+        changes = self.__board.chord(x, y)
+
+        if not self.__board.should_continue():
+            self.__end_time = perf_counter()
+            if self.__journal is not None:
+                self.__journal.flush()
+
+        return changes
 
     def should_continue(self) -> bool:
         '''
@@ -81,6 +166,65 @@ class Game:
         '''
         return self.__board.get_rows(), self.__board.get_cols()
 
+    def get_mines(self) -> int:
+        '''
+        Returns the amount of mines on the game board
+        '''
+        return self.__board.get_mines()
+
+    def dumps(self) -> bytes:
+        '''
+        Returns the saved game as bytes, including the time played so far.
+        Boards without a saved state (like ChunkedBoard) can't be saved.
+        '''
+        if not hasattr(self.__board, "get_state"):
+            raise Exception("Invalid board, it can't be saved")
+
+        if not self.__board.has_started():
+            elapsed = 0.0
+        elif self.should_continue():
+            elapsed = perf_counter() - self.__start_time
+        else:
+            elapsed = self.get_time()
+
+        return serialization.dumps(self.__board.get_state(), elapsed)
+
+    def save(self, path: str):
+        '''
+        Saves the game, including the time played so far
+        '''
+        with open(path, "wb") as file:
+            file.write(self.dumps())
+
+    @classmethod
+    def load(cls,
+             path: str,
+             board_type: type | None = None,
+             seed: Random | int | None = None) -> "Game":
+        '''
+        Loads a saved game, its timer continues from the time played before saving.
+        Boards are loaded into NumpyBoard by default, which does not create a tile per cell.
+        '''
+        if board_type is None:
+            from src.base.numpy_board import NumpyBoard  # pylint: disable=import-outside-toplevel
+            board_type = NumpyBoard
+
+        state, elapsed = serialization.load(path)
+        return cls(state, board_type, seed, elapsed)
+
+    def close(self):
+        '''
+        Writes the rest of the journal, if the game is recorded
+        '''
+        if self.__journal is not None:
+            self.__journal.close()
+
+    def repr_tile(self, x: int, y: int) -> str:
+        '''
+        Gets the representation of a single tile
+        '''
+        return self.__board.repr_tile(x, y)
+
     def repr(self):
         '''
         Gets the board representation
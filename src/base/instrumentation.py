@@ -0,0 +1,224 @@
+'''
+Instrumentation module
+
+Records timings and counters of the hot paths into fixed size ring buffers.
+It is disabled by default and every probe only checks a flag then, so it can
+stay in the code. It is enabled with the MINESWEEPER_PROFILE environment
+variable or `--profile` of src.minesweeper: a value of 1 prints a summary with
+histograms to stderr on exit, any other value is a path the samples are written
+to as JSON.
+'''
+
+import atexit
+import json
+import os
+import sys
+from array import array
+from functools import wraps
+from math import ceil, log2
+from time import perf_counter
+from typing import Callable, TextIO
+
+SIZE: int = 4096
+ENABLED: bool = False
+
+
+class RingBuffer:
+    '''
+    This class keeps the last size samples of a metric and counts all of them
+    '''
+
+    def __init__(self, unit: str = "", size: int = SIZE):
+        self.__unit: str = unit
+        self.__values: array = array("d", bytes(8 * size))
+        self.__count: int = 0
+
+    def append(self, value: float):
+        '''
+        Adds a sample, replacing the oldest one when the buffer is full
+        '''
+        self.__values[self.__count % len(self.__values)] = value
+        self.__count += 1
+
+    def get_unit(self) -> str:
+        '''
+        Returns the unit of the samples
+        '''
+        return self.__unit
+
+    def get_count(self) -> int:
+        '''
+        Returns the amount of samples ever added
+        '''
+        return self.__count
+
+    def values(self) -> list[float]:
+        '''
+        Returns the samples in the buffer from the oldest to the newest
+        '''
+        if self.__count <= len(self.__values):
+            return self.__values[:self.__count].tolist()
+
+        split = self.__count % len(self.__values)
+        return (self.__values[split:] + self.__values[:split]).tolist()
+
+
+__metrics: dict[str, RingBuffer] = {}
+
+
+def enable(path: str | None = None):
+    '''
+    Starts recording, the samples are written to path as JSON on exit
+    or summarized on stderr without a path
+    '''
+    global ENABLED  # pylint: disable=global-statement
+
+    atexit.unregister(__dump)
+    atexit.register(__dump, path)
+    ENABLED = True
+
+
+def disable():
+    '''
+    Stops recording and forgets the samples
+    '''
+    global ENABLED  # pylint: disable=global-statement
+
+    atexit.unregister(__dump)
+    ENABLED = False
+    __metrics.clear()
+
+
+def record(name: str, value: float, unit: str = ""):
+    '''
+    Adds a sample to a metric if recording
+    '''
+    if ENABLED:
+        buffer = __metrics.get(name)
+        if buffer is None:
+            buffer = __metrics[name] = RingBuffer(unit)
+        buffer.append(value)
+
+
+def samples(name: str) -> list[float]:
+    '''
+    Returns the samples in the buffer of a metric, none if it was never recorded
+    '''
+    buffer = __metrics.get(name)
+    return buffer.values() if buffer is not None else []
+
+
+def clock() -> float:
+    '''
+    Returns the time to measure from if recording
+    '''
+    return perf_counter() if ENABLED else 0.0
+
+
+def lap(name: str, start: float) -> float:
+    '''
+    Records the milliseconds since start if recording and returns the time
+    to measure the next part from
+    '''
+    if not ENABLED:
+        return 0.0
+
+    now = perf_counter()
+    record(name, (now - start) * 1000, "ms")
+    return now
+
+
+def timed(name: str) -> Callable:
+    '''
+    Decorator that records the milliseconds every call takes if recording
+    '''
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return function(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, (perf_counter() - start) * 1000, "ms")
+
+        return wrapper
+
+    return decorator
+
+
+def __percentile(values: list[float], fraction: float) -> float:
+    '''
+    Returns the value below which the fraction of the sorted values lies
+    '''
+    return values[max(0, ceil(fraction * len(values)) - 1)]
+
+
+def summarize() -> dict[str, dict]:
+    '''
+    Returns the statistics of the samples in the buffers of every metric
+    '''
+    summary = {}
+
+    for name, buffer in sorted(__metrics.items()):
+        values = sorted(buffer.values())
+        summary[name] = {"unit": buffer.get_unit(),
+                         "count": buffer.get_count(),
+                         "mean": sum(values) / len(values),
+                         "p50": __percentile(values, 0.5),
+                         "p90": __percentile(values, 0.9),
+                         "p99": __percentile(values, 0.99),
+                         "max": values[-1]}
+
+    return summary
+
+
+def dumps() -> str:
+    '''
+    Returns the statistics and the samples of every metric as JSON
+    '''
+    return json.dumps({name: {**stats, "values": __metrics[name].values()}
+                       for name, stats in summarize().items()})
+
+
+def print_summary(stream: TextIO = sys.stderr, width: int = 40):
+    '''
+    Prints the statistics of every metric with a histogram of its samples
+    in power of two buckets
+    '''
+    for name, stats in summarize().items():
+        unit = stats["unit"]
+        stream.write(f"{name}: {stats['count']} samples, mean {stats['mean']:.4g}{unit} "
+                     f"p50 {stats['p50']:.4g}{unit} p90 {stats['p90']:.4g}{unit} "
+                     f"p99 {stats['p99']:.4g}{unit} max {stats['max']:.4g}{unit}\n")
+
+        buckets: dict[int, int] = {}
+        for value in __metrics[name].values():
+            bucket = ceil(log2(value)) if value > 0 else None
+            buckets[bucket] = buckets.get(bucket, 0) + 1
+
+        largest = max(buckets.values())
+        for bucket in sorted(buckets, key=lambda bucket: -1e9 if bucket is None else bucket):
+            label = "0" if bucket is None else f"<= {2.0 ** bucket:.4g}"
+            bars = "#" * max(1, buckets[bucket] * width // largest)
+            stream.write(f"  {label:>12}{unit:<2} {buckets[bucket]:>7} {bars}\n")
+
+
+def __dump(path: str | None):
+    '''
+    Writes the samples to path as JSON or summarizes them on stderr without a path
+    '''
+    if not __metrics:
+        return
+
+    if path is None:
+        print_summary()
+    else:
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(dumps())
+
+
+if os.environ.get("MINESWEEPER_PROFILE"):
+    enable(None if os.environ["MINESWEEPER_PROFILE"] == "1" else os.environ["MINESWEEPER_PROFILE"])
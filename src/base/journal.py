@@ -0,0 +1,101 @@
+'''
+Journal module
+
+A journal is a header describing how to rebuild the board followed by one
+fixed size record per move: nanoseconds since the journal was started, the
+action and the coordinates of the tile.
+'''
+
+import struct
+import weakref
+from time import perf_counter_ns
+from typing import BinaryIO
+
+MAGIC: bytes = b"MSWJ"
+VERSION: int = 4
+# Magic, version, flags, engine, rows, columns, mines, seed and length of the saved layout
+HEADER: struct.Struct = struct.Struct("<4sBBBxIIIQI")
+# The coordinates are signed, moves outside of the board are recorded as they were made
+RECORD: struct.Struct = struct.Struct("<qBii")
+HAS_LAYOUT: int = 1
+# The engines place the mines of a seed differently, so the engine is recorded too
+BOARD: int = 0
+NUMPY_BOARD: int = 1
+CHUNKED_BOARD: int = 2
+SHOW: int = 0
+TOGGLE: int = 1
+RESTART: int = 2
+CHORD: int = 3
+
+
+class Journal:
+    '''
+    This class records the moves of a game in an append-only file.
+    Moves are packed into a buffer that is written in batches, so recording
+    a move only costs a timestamp and a struct pack. The rest of the buffer is
+    written when the journal is closed, which happens at the latest when it is
+    garbage collected or the interpreter exits. It can be used as a context manager.
+    '''
+
+    def __init__(self,
+                 path: str,
+                 board_info: tuple[int, int, int],
+                 seed: int,
+                 layout: bytes | None = None,
+                 buffer_size: int = 4096,
+                 *,
+                 engine: int = BOARD):
+        self.__file = open(path, "wb")  # pylint: disable=consider-using-with
+        self.__buffer: bytearray = bytearray()
+        self.__buffer_size: int = buffer_size * RECORD.size
+        self.__start: int = perf_counter_ns()
+
+        rows, cols, num_mines = board_info
+        flags = HAS_LAYOUT if layout is not None else 0
+        self.__file.write(HEADER.pack(MAGIC, VERSION, flags, engine,
+                                      rows, cols, num_mines, seed, len(layout or b"")))
+        self.__file.write(layout or b"")
+        self.__finalizer = weakref.finalize(self, self.__close_file, self.__file, self.__buffer)
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @staticmethod
+    def __close_file(file: BinaryIO, buffer: bytearray):
+        '''
+        Writes the buffered moves and closes the file.
+        It doesn't refer to the journal, so it can run when the journal is collected.
+        '''
+        if not file.closed:
+            file.write(buffer)
+            file.close()
+        buffer.clear()
+
+    def record(self, action: int, x: int = 0, y: int = 0):
+        '''
+        Records a move, the buffer is written when it is full
+        '''
+        self.__buffer += RECORD.pack(perf_counter_ns() - self.__start, action, x, y)
+
+        if len(self.__buffer) >= self.__buffer_size:
+            self.flush()
+
+    def flush(self):
+        '''
+        Writes the buffered moves to the file
+        '''
+        if self.__file.closed:
+            return
+
+        self.__file.write(self.__buffer)
+        self.__file.flush()
+        self.__buffer.clear()
+
+    def close(self):
+        '''
+        Writes the buffered moves and closes the file
+        '''
+        self.__finalizer()
@@ -0,0 +1,90 @@
+'''
+Leaderboard module
+'''
+
+import os
+import sqlite3
+from bisect import insort
+
+
+class Leaderboard:
+    '''
+    This class stores the finishing times of won games per difficulty.
+    Scores are kept in an indexed SQLite table and the top scores of every
+    difficulty are cached in memory and updated incrementally on every new score,
+    so reading a leaderboard does not depend on how many scores were recorded.
+    '''
+
+    def __init__(self, path: str = "leaderboard.db", top_scores_amount: int = 10):
+        self.__path: str = path
+        self.__top_scores_amount: int = top_scores_amount
+        self.__connection: sqlite3.Connection | None = None
+        self.__top_scores: dict[str, list[float]] = {}
+
+    def __connect(self) -> sqlite3.Connection:
+        '''
+        Opens the database on first use
+        '''
+        if self.__connection is None:
+            self.__connection = sqlite3.connect(self.__path)
+            with self.__connection:
+                self.__connection.execute(
+                    "CREATE TABLE IF NOT EXISTS scores "
+                    "(difficulty TEXT NOT NULL, time REAL NOT NULL)")
+                self.__connection.execute(
+                    "CREATE INDEX IF NOT EXISTS scores_by_time ON scores (difficulty, time)")
+
+        return self.__connection
+
+    def add_score(self, difficulty: str, time: float):
+        '''
+        Records the time of a won game
+        '''
+        with self.__connect() as connection:
+            connection.execute("INSERT INTO scores VALUES (?, ?)", (difficulty, time))
+
+        if difficulty in self.__top_scores:
+            top_scores = self.__top_scores[difficulty]
+            insort(top_scores, time)
+            del top_scores[self.__top_scores_amount:]
+
+    def get_top_scores(self, difficulty: str) -> list[float]:
+        '''
+        Returns the best times of a difficulty in ascending order
+        '''
+        if difficulty not in self.__top_scores:
+            self.__top_scores[difficulty] = [
+                time for time, in self.__connect().execute(
+                    "SELECT time FROM scores WHERE difficulty = ? ORDER BY time LIMIT ?",
+                    (difficulty, self.__top_scores_amount))]
+
+        return list(self.__top_scores[difficulty])
+
+    def import_legacy(self, difficulty: str, path: str | None = None):
+        '''
+        Imports the scores of the old plain text format, one time per line
+        in a file named after the difficulty, and renames the file afterwards
+        '''
+        path = difficulty if path is None else path
+
+        if not os.path.isfile(path):
+            return
+
+        with open(path, "r", encoding="utf-8") as file:
+            scores = [float(line) for line in file.read().split("\n")
+                      if line.replace('.', '', 1).isdigit()]
+
+        with self.__connect() as connection:
+            connection.executemany("INSERT INTO scores VALUES (?, ?)",
+                                   [(difficulty, score) for score in scores])
+
+        self.__top_scores.pop(difficulty, None)
+        os.replace(path, path + ".imported")
+
+    def close(self):
+        '''
+        Closes the database connection
+        '''
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
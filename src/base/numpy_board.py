@@ -0,0 +1,229 @@
+"""
+Numpy board module
+"""
+
+from random import Random
+import numpy as np
+
+from src.base import instrumentation
+from src.base.base_board import BaseBoard
+from src.base.board import Board
+from src.base.serialization import BoardState
+from src.base.tile import Tile
+
+
+class NumpyBoard(BaseBoard):
+    """
+    This class represents a mxn board stored in numpy arrays.
+    It provides the same interface as Board, but keeps the mine, hidden,
+    marked and neighbouring mines state in flat arrays instead of Tile objects,
+    which makes very large boards cheap to build and query.
+    """
+
+    __SYMBOLS = np.array([" ", "1", "2", "3", "4", "5", "6", "7", "8", "*", "#", "P"])
+    __MINE: int = 9
+    __HIDDEN: int = 10
+    __MARKED: int = 11
+
+    def __init__(
+        self,
+        board_info: tuple[int, int, int] | list[list[Tile]] | BoardState,
+        seed: Random | int | None = None,
+    ):
+        if isinstance(board_info, BoardState):
+            super().__init__(board_info.rows, board_info.cols, board_info.num_mines, seed)
+            self.__load_state(board_info)
+            return
+
+        if isinstance(board_info, tuple):
+            super().__init__(*board_info, seed)
+            self._generate_layout()
+            return
+
+        self.__mines: np.ndarray = np.array(
+            [[tile.is_mine() for tile in row] for row in board_info], dtype=bool
+        )
+        super().__init__(len(board_info), len(board_info[0]), int(self.__mines.sum()), seed)
+
+        if not Board.is_valid_board(self._rows, self._cols, self._num_mines):
+            raise Exception("Invalid board")
+
+        self.__hidden: np.ndarray = np.array(
+            [[tile.is_hidden() for tile in row] for row in board_info], dtype=bool
+        )
+        self.__marked: np.ndarray = np.array(
+            [[tile.is_marked() for tile in row] for row in board_info], dtype=bool
+        )
+        self._started = True
+        self.__neighbouring_mines: np.ndarray = self.__count_neighbours(self.__mines)
+        self.__flagged_neighbours: np.ndarray = self.__count_neighbours(self.__marked)
+
+    def __load_state(self, state: BoardState):
+        """
+        Copies the arrays of a saved board, no tiles are created
+        """
+        if not state.started:
+            self._generate_layout()
+            return
+
+        self._started = True
+        self.__mines = np.array(state.mines, dtype=bool)
+        self.__hidden = np.array(state.hidden, dtype=bool)
+        self.__marked = np.array(state.marked, dtype=bool)
+        self.__neighbouring_mines = self.__count_neighbours(self.__mines)
+        self.__flagged_neighbours = self.__count_neighbours(self.__marked)
+        self._discovered = int((~self.__hidden).sum())
+        self._lose = bool((self.__mines & ~self.__hidden).any())
+
+    def _generate_layout(self):
+        """
+        Places the mines of a board that has not started yet, ahead of its first click
+        """
+        shape = (self._rows, self._cols)
+
+        self._started = False
+        self.__mines = self.__place_mines()
+        self.__hidden = np.ones(shape, dtype=bool)
+        self.__marked = np.zeros(shape, dtype=bool)
+        self.__neighbouring_mines = self.__count_neighbours(self.__mines)
+        # Amount of marked neighbours of every tile, updated on every toggle
+        self.__flagged_neighbours = np.zeros(shape, dtype=np.int8)
+
+    @instrumentation.timed("board.mines")
+    def __place_mines(self) -> np.ndarray:
+        """
+        Places the mines with a single draw of their flat indices,
+        seeded from the random generator of the board to stay reproducible
+        """
+        generator = np.random.default_rng(self._rng.getrandbits(64))
+        mines = np.zeros(self._rows * self._cols, dtype=bool)
+        mines[generator.choice(mines.size, self._num_mines, replace=False, shuffle=False)] = True
+
+        return mines.reshape(self._rows, self._cols)
+
+    def _begin_game(self, x: int, y: int):
+        """
+        Starts a game from showing the board[x][y] tile.
+        The mines near board[x][y] are moved to random free tiles away from it,
+        so only the neighbour counts around the moved mines change.
+        """
+        self._relocate_mines(x, y, lambda row, col: self.__mines[row, col], self.__move_mine)
+
+    def __move_mine(self, old_x: int, old_y: int, new_x: int, new_y: int):
+        """
+        Moves a mine to a free tile and updates the neighbour counts around both
+        """
+        self.__mines[old_x, old_y], self.__mines[new_x, new_y] = False, True
+        self.__update_neighbours(self.__neighbouring_mines, old_x, old_y, -1)
+        self.__update_neighbours(self.__neighbouring_mines, new_x, new_y, 1)
+
+    @instrumentation.timed("board.neighbours")
+    def __count_neighbours(self, values: np.ndarray) -> np.ndarray:
+        """
+        Counts the neighbouring set values (mines or marks) of every tile
+        with a single 3x3 convolution
+        """
+        padded = np.pad(values.astype(np.int8), 1)
+        counts = np.zeros((self._rows, self._cols), dtype=np.int8)
+
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                if (dx, dy) != (0, 0):
+                    counts += padded[
+                        1 + dx : 1 + dx + self._rows, 1 + dy : 1 + dy + self._cols
+                    ]
+
+        return counts
+
+    @staticmethod
+    def __update_neighbours(counts: np.ndarray, x: int, y: int, change: int):
+        """
+        Updates the counts around a tile that gained or lost a mine or mark
+        """
+        counts[max(x - 1, 0) : x + 2, max(y - 1, 0) : y + 2] += change
+        counts[x, y] -= change
+
+    def _reveal(self, x: int, y: int) -> bool:
+        """
+        Reveals a single tile if possible.
+        Returns whether it was revealed.
+        """
+        if not self.__hidden[x, y] or self.__marked[x, y]:
+            return False
+
+        self.__hidden[x, y] = False
+        self._discovered += 1
+
+        if self.__mines[x, y]:
+            self._lose = True
+
+        return True
+
+    def _is_empty(self, x: int, y: int) -> bool:
+        """
+        Checks if a tile is not a mine and has no neighbouring mines
+        """
+        return not self.__mines[x, y] and not self.__neighbouring_mines[x, y]
+
+    def _toggle_mark(self, x: int, y: int) -> bool:
+        """
+        Marks/unmarks a hidden tile.
+        Returns whether it was toggled.
+        """
+        if not self.__hidden[x, y]:
+            return False
+
+        self.__marked[x, y] ^= True
+        self.__update_neighbours(self.__flagged_neighbours, x, y, 1 if self.__marked[x, y] else -1)
+
+        return True
+
+    def _can_chord(self, x: int, y: int) -> bool:
+        """
+        Checks if a tile is revealed and has as many marked neighbours as neighbouring mines
+        """
+        return (
+            not self.__hidden[x, y]
+            and self.__flagged_neighbours[x, y] == self.__neighbouring_mines[x, y]
+        )
+
+    def repr_tile(self, x: int, y: int) -> str:
+        """
+        Returns the character representation of the board[x][y] tile
+        """
+        if self.__marked[x, y]:
+            return str(self.__SYMBOLS[self.__MARKED])
+        if self.__hidden[x, y]:
+            return str(self.__SYMBOLS[self.__HIDDEN])
+        if self.__mines[x, y]:
+            return str(self.__SYMBOLS[self.__MINE])
+        return str(self.__SYMBOLS[self.__neighbouring_mines[x, y]])
+
+    def repr(self) -> list[list[str]]:
+        """
+        Returns a mxn array of character representations of the tiles
+        """
+        indices = np.where(
+            self.__marked,
+            self.__MARKED,
+            np.where(
+                self.__hidden,
+                self.__HIDDEN,
+                np.where(self.__mines, self.__MINE, self.__neighbouring_mines),
+            ),
+        )
+        return self.__SYMBOLS[indices].tolist()
+
+    def get_state(self) -> BoardState:
+        """
+        Returns the state of the board that is saved
+        """
+        if not self._started:
+            shape = (self._rows, self._cols)
+            return BoardState(*shape, self._num_mines, False,
+                              np.zeros(shape, dtype=bool),
+                              np.ones(shape, dtype=bool),
+                              np.zeros(shape, dtype=bool))
+
+        return BoardState(self._rows, self._cols, self._num_mines, self._started,
+                          self.__mines, self.__hidden, self.__marked)
@@ -0,0 +1,93 @@
+'''
+Replay module
+'''
+
+from time import perf_counter_ns, sleep
+from typing import Callable
+
+from src.base import journal, serialization
+from src.base.board import Board
+from src.base.chunked_board import ChunkedBoard
+from src.base.game import Game
+from src.base.numpy_board import NumpyBoard
+
+# Board engines by the id recorded in the journal
+ENGINES: dict[int, type] = {
+    journal.BOARD: Board,
+    journal.NUMPY_BOARD: NumpyBoard,
+    journal.CHUNKED_BOARD: ChunkedBoard,
+}
+
+
+class Replay:
+    '''
+    This class rebuilds a recorded game from its seed or saved layout and
+    applies the moves of its journal again, either instantly or at the
+    recorded pace multiplied by a speed.
+    By default the game is replayed on the board engine it was recorded on.
+    '''
+
+    def __init__(self, path: str, board_type: type | None = None):
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if len(data) < journal.HEADER.size:
+            raise Exception("Invalid journal")
+
+        magic, version, flags, engine, rows, cols, num_mines, seed, layout_size = \
+            journal.HEADER.unpack_from(data)
+
+        if magic != journal.MAGIC or version != journal.VERSION or engine not in ENGINES:
+            raise Exception("Invalid journal")
+
+        offset = journal.HEADER.size + layout_size
+        # Without a saved layout only the recorded engine places the mines of the seed the same way
+        self.__board_type: type = board_type or ENGINES[engine]
+        self.__seed: int = seed
+        self.__board_info: tuple[int, int, int] | serialization.BoardState = \
+            serialization.loads(data[journal.HEADER.size:offset])[0] \
+            if flags & journal.HAS_LAYOUT else (rows, cols, num_mines)
+        # A record cut off by a crash is ignored
+        end = offset + (len(data) - offset) // journal.RECORD.size * journal.RECORD.size
+        self.__moves: list[tuple[int, int, int, int]] = \
+            list(journal.RECORD.iter_unpack(data[offset:end]))
+
+    def get_moves(self) -> list[tuple[int, int, int, int]]:
+        '''
+        Returns the recorded moves as (nanoseconds, action, x, y)
+        '''
+        return list(self.__moves)
+
+    def play(self,
+             speed: float | None = None,
+             on_move: Callable[[int, int, int, list[tuple[int, int, str]]], None] | None = None
+             ) -> Game:
+        '''
+        Replays the game and returns it.
+        Without a speed the moves are applied instantly, otherwise they wait
+        for their recorded time divided by the speed (1 is real time).
+        on_move is called after every move with the action, coordinates and changed tiles.
+        '''
+        game = Game(self.__board_info, self.__board_type, self.__seed)
+        start = perf_counter_ns()
+
+        for timestamp, action, x, y in self.__moves:
+            if speed is not None:
+                delay = timestamp / speed - (perf_counter_ns() - start)
+                if delay > 0:
+                    sleep(delay / 1e9)
+
+            if action == journal.SHOW:
+                changes = game.show(x, y)
+            elif action == journal.TOGGLE:
+                changes = game.toggle_marked(x, y)
+            elif action == journal.CHORD:
+                changes = game.chord(x, y)
+            else:
+                game.restart()
+                changes = []
+
+            if on_move is not None:
+                on_move(action, x, y, changes)
+
+        return game
@@ -0,0 +1,89 @@
+'''
+Serialization module
+
+A saved board is a fixed size header followed by three bit planes holding the
+mine, hidden and marked state of every tile in row major order, eight tiles per byte.
+numpy is only imported to pack or unpack a board, so importing the module stays cheap.
+'''
+# pylint: disable=import-outside-toplevel
+
+import mmap
+import struct
+from typing import NamedTuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MAGIC: bytes = b"MSWB"
+VERSION: int = 1
+# Magic, version, flags, rows, columns, mines and seconds played
+HEADER: struct.Struct = struct.Struct("<4sBB2xIIId")
+STARTED: int = 1
+
+
+class BoardState(NamedTuple):
+    '''
+    The state of a board that is saved, the tile arrays have a rows x cols shape
+    '''
+    rows: int
+    cols: int
+    num_mines: int
+    started: bool
+    mines: "np.ndarray"
+    hidden: "np.ndarray"
+    marked: "np.ndarray"
+
+
+def dumps(state: BoardState, elapsed: float = 0.0) -> bytes:
+    '''
+    Packs a board state and the time played into bytes
+    '''
+    import numpy as np
+
+    header = HEADER.pack(MAGIC, VERSION, STARTED if state.started else 0,
+                         state.rows, state.cols, state.num_mines, elapsed)
+
+    return header + b"".join(np.packbits(np.asarray(plane, dtype=bool)).tobytes()
+                             for plane in (state.mines, state.hidden, state.marked))
+
+
+def loads(data: bytes | mmap.mmap) -> tuple[BoardState, float]:
+    '''
+    Unpacks a board state and the time played.
+    The tile arrays are unpacked into new arrays, so the data can be released afterwards.
+    '''
+    import numpy as np
+
+    if len(data) < HEADER.size:
+        raise Exception("Invalid save")
+
+    magic, version, flags, rows, cols, num_mines, elapsed = HEADER.unpack_from(data)
+    plane_size = (rows * cols + 7) // 8
+
+    if magic != MAGIC or version != VERSION or len(data) != HEADER.size + 3 * plane_size:
+        raise Exception("Invalid save")
+
+    planes = [np.unpackbits(np.frombuffer(data, np.uint8, plane_size,
+                                          HEADER.size + i * plane_size),
+                            count=rows * cols).reshape(rows, cols).view(bool)
+              for i in range(3)]
+
+    return BoardState(rows, cols, num_mines, bool(flags & STARTED), *planes), elapsed
+
+
+def save(path: str, state: BoardState, elapsed: float = 0.0):
+    '''
+    Saves a board state and the time played to a file
+    '''
+    with open(path, "wb") as file:
+        file.write(dumps(state, elapsed))
+
+
+def load(path: str) -> tuple[BoardState, float]:
+    '''
+    Loads a board state and the time played from a file.
+    The file is memory mapped, so only the unpacked arrays are allocated.
+    '''
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return loads(data)
@@ -1,31 +1,71 @@
 '''
 Minesweeper module
+
+Only the front end that is started gets imported, so the CLI starts without
+loading pygame or numpy.
 '''
 
+import argparse
 import sys
 
-from src.ui.gui import GUI
-from src.ui.cli import CLI
+from src.base import instrumentation
 
-if __name__ == "__main__":
-    args = sys.argv[1:]
+# Board output modes of the CLI
+OUTPUTS: list[str] = ["board", "delta", "final", "none"]
+
+
+def main(args: list[str]) -> int:
+    '''
+    Parses the arguments and starts the selected front end
+    '''
+    parser = argparse.ArgumentParser(description="Plays minesweeper")
+    parser.add_argument("interface", nargs="?", choices=["gui", "cli"], default="gui",
+                        type=str.lower)
+    parser.add_argument("--batch", metavar="FILE",
+                        help="runs the CLI commands of a file (- for stdin) without a prompt")
+    parser.add_argument("--output", choices=OUTPUTS, default=None,
+                        help="board output of the CLI after every command "
+                             "(board by default, final in batch mode)")
+    parser.add_argument("--no-guess", action="store_true",
+                        help="plays boards that can be solved without guessing, "
+                             "they start with their opening revealed")
+    parser.add_argument("--profile", metavar="FILE", nargs="?", const="",
+                        help="records timings of frames and of the board engine and writes "
+                             "them to FILE as JSON on exit, or a summary to stderr without FILE "
+                             "(also enabled by MINESWEEPER_PROFILE)")
+    options = parser.parse_args(args)
+
+    if options.profile is not None:
+        instrumentation.enable(options.profile or None)
 
-    if len(args) > 1:
-        raise Exception("Too much arguments")
+    if options.interface == "gui":
+        from src.ui.gui import GUI  # pylint: disable=import-outside-toplevel
+        GUI(no_guess=options.no_guess)
+        return 0
 
-    USE_GUI: bool
+    # pylint: disable=import-outside-toplevel
+    from src.ui.cli import CLI
+    pool = None
 
-    if not args:
-        USE_GUI = True
-    else:
-        if args[0].lower() == "gui":
-            USE_GUI = True
-        elif args[0].lower() == "cli":
-            USE_GUI = False
+    if options.no_guess:
+        from src.base.difficulty import DIFFICULTY_PRESETS
+        from src.solver.no_guess_pool import NoGuessPool
+        pool = NoGuessPool(list(DIFFICULTY_PRESETS.values()))
+
+    try:
+        if options.batch is None:
+            CLI(output=options.output or "board", pool=pool)
+        elif options.batch == "-":
+            CLI(sys.stdin, options.output or "final", pool=pool)
         else:
-            raise Exception("Invalid arguments")
+            with open(options.batch, "r", encoding="utf-8") as file:
+                CLI(file, options.output or "final", pool=pool)
+    finally:
+        if pool is not None:
+            pool.close()
+
+    return 0
 
-    if USE_GUI:
-        GUI()
-    else:
-        CLI()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
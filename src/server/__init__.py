@@ -0,0 +1,3 @@
+'''
+We need this to indicate that server is a module
+'''
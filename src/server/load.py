@@ -0,0 +1,196 @@
+'''
+Load generator module
+
+Plays games on a game server from many concurrent connections and reports the
+throughput and latency of the requests. Run it with:
+
+    python -m src.server.load --connections 1000 --requests 100
+
+Without --port a server is started in a separate process on a free port and
+shut down at the end, so everything runs on the local machine.
+'''
+
+import argparse
+import asyncio
+import json
+import signal
+import subprocess
+import sys
+from math import ceil
+from random import Random
+from time import perf_counter
+
+from src.base.difficulty import DIFFICULTY_PRESETS
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    '''
+    Returns the value below which the fraction of the sorted values lies
+    '''
+    if not values:
+        return 0.0
+
+    return values[max(0, ceil(fraction * len(values)) - 1)]
+
+
+class Player:
+    '''
+    This class plays games for one connection: it shows random hidden tiles,
+    sometimes flags one, and starts a new game when one ends.
+    '''
+
+    def __init__(self, board_info: tuple[int, int, int], rng: Random):
+        self.__board_info: tuple[int, int, int] = board_info
+        self.__rng: Random = rng
+        self.__session: int | None = None
+        self.__ended: bool = False
+        self.__cells: list[tuple[int, int]] = []
+        self.__hidden: set[tuple[int, int]] = set()
+
+    def next_request(self) -> dict:
+        '''
+        Returns the next request to make
+        '''
+        rows, cols, mines = self.__board_info
+
+        if self.__session is None:
+            return {"op": "new", "rows": rows, "cols": cols, "mines": mines,
+                    "seed": self.__rng.getrandbits(32)}
+
+        while self.__cells and self.__cells[-1] not in self.__hidden:
+            self.__cells.pop()
+
+        if self.__ended or not self.__cells:
+            return {"op": "close", "session": self.__session}
+
+        x, y = self.__cells.pop()
+        return {"op": "toggle" if self.__rng.random() < 0.1 else "show",
+                "session": self.__session, "x": x, "y": y}
+
+    def handle(self, request: dict, response: dict) -> bool:
+        '''
+        Updates the game with the response to a request.
+        Returns whether the request succeeded.
+        '''
+        if not response["ok"] or request["op"] == "close":
+            self.__session = None
+        elif request["op"] == "new":
+            rows, cols, _ = self.__board_info
+            self.__session = response["session"]
+            self.__ended = False
+            self.__cells = [(x, y) for x in range(rows) for y in range(cols)]
+            self.__rng.shuffle(self.__cells)
+            self.__hidden = set(self.__cells)
+        else:
+            for x, y, char in response["changes"]:
+                if char == '#':
+                    self.__hidden.add((x, y))
+                else:
+                    self.__hidden.discard((x, y))
+            self.__ended = response["state"] != "playing"
+
+        return response["ok"]
+
+
+async def play(host: str,
+               port: int,
+               requests: int,
+               player: Player) -> tuple[list[float], int]:
+    '''
+    Makes the requests of a player on one connection, one at a time.
+    Returns the latency of every request and the amount of failed requests.
+    '''
+    reader, writer = await asyncio.open_connection(host, port)
+    latencies: list[float] = []
+    errors = 0
+
+    try:
+        for _ in range(requests):
+            request = player.next_request()
+            start = perf_counter()
+            writer.write(json.dumps(request).encode() + b"\n")
+            response = json.loads(await reader.readline())
+            latencies.append(perf_counter() - start)
+            errors += not player.handle(request, response)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+    return latencies, errors
+
+
+async def run_load(host: str,
+                   port: int,
+                   *,
+                   connections: int = 100,
+                   requests: int = 100,
+                   board_info: tuple[int, int, int] = DIFFICULTY_PRESETS["medium"],
+                   seed: int = 0) -> dict:
+    '''
+    Runs the connections at the same time and returns a summary
+    of their requests, with latencies in seconds
+    '''
+    start = perf_counter()
+    results = await asyncio.gather(*(play(host, port, requests,
+                                          Player(board_info, Random(f"{seed}:{connection}")))
+                                     for connection in range(connections)))
+    elapsed = perf_counter() - start
+    latencies = sorted(latency for result in results for latency in result[0])
+
+    return {"connections": connections,
+            "requests": len(latencies),
+            "errors": sum(result[1] for result in results),
+            "time": elapsed,
+            "throughput": len(latencies) / elapsed,
+            "p50": percentile(latencies, 0.5),
+            "p99": percentile(latencies, 0.99),
+            "max": latencies[-1] if latencies else 0.0}
+
+
+def main(args: list[str]) -> int:
+    '''
+    Parses the arguments, runs the load and prints the summary
+    '''
+    parser = argparse.ArgumentParser(description="Measures the throughput of a game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None,
+                        help="port of a running server, a local one is started without it")
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=100, help="requests per connection")
+    parser.add_argument("--difficulty", choices=DIFFICULTY_PRESETS.keys(), default="medium")
+    parser.add_argument("--seed", type=int, default=0)
+    options = parser.parse_args(args)
+
+    server = None
+    port = options.port
+
+    if port is None:
+        # pylint: disable-next=consider-using-with
+        server = subprocess.Popen([sys.executable, "-m", "src.server.server",
+                                   "--host", options.host, "--port", "0", "--rate", "0",
+                                   "--max-connections", str(options.connections)],
+                                  stdout=subprocess.PIPE, text=True)
+        port = int(server.stdout.readline().strip().rsplit(":", 1)[1])
+
+    try:
+        summary = asyncio.run(run_load(options.host, port,
+                                       connections=options.connections,
+                                       requests=options.requests,
+                                       board_info=DIFFICULTY_PRESETS[options.difficulty],
+                                       seed=options.seed))
+    finally:
+        if server is not None:
+            server.send_signal(signal.SIGINT)
+            server.wait()
+
+    print(f"{summary['requests']} requests over {summary['connections']} connections "
+          f"in {summary['time']:.2f}s, {summary['errors']} failed")
+    print(f"throughput {summary['throughput']:.0f} requests/s")
+    print(f"latency p50 {summary['p50'] * 1000:.3f}ms "
+          f"p99 {summary['p99'] * 1000:.3f}ms max {summary['max'] * 1000:.3f}ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
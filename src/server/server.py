@@ -0,0 +1,348 @@
+'''
+Server module
+
+Hosts many games in one process behind a line-delimited JSON protocol over TCP.
+Run it with:
+
+    python -m src.server.server --port 8765
+
+Every request is one JSON object on its own line and is answered by one JSON
+line, in order. A request can carry an "id" that is copied to its response.
+
+    {"op": "new", "rows": 16, "cols": 30, "mines": 99, "seed": 1}
+        -> {"ok": true, "session": 1, "rows": 16, "cols": 30, "mines": 99}
+    {"op": "show", "session": 1, "x": 3, "y": 4}
+        -> {"ok": true, "changes": [[3, 4, "1"]], "state": "playing"}
+    {"op": "toggle" | "chord", "session": 1, "x": 3, "y": 4} -> like show
+    {"op": "state", "session": 1}
+        -> {"ok": true, "state": "playing", "rows": 16, "cols": 30, "mines": 99,
+            "board": ["#1 ...", ...]}
+    {"op": "close", "session": 1} -> {"ok": true}
+
+A failed request is answered with {"ok": false, "error": "..."}.
+Sessions belong to the connection that created them, so a connection can only
+play its own games, and they are closed when it disconnects. Games that are
+not played for a while are evicted to compact snapshots when the tiles of the
+games in memory go over a budget, and are loaded again on their next request.
+'''
+
+import argparse
+import asyncio
+import json
+import signal
+import sys
+from contextlib import suppress
+from itertools import count
+from time import monotonic
+
+from src.base.board import Board
+from src.base.game import Game
+from src.server.sessions import SessionManager
+
+OPS: list[str] = ["new", "show", "toggle", "chord", "state", "close"]
+
+
+class ProtocolError(Exception):
+    '''
+    Raised for a request that can't be handled, its message is sent to the client
+    '''
+
+
+class RateLimiter:
+    '''
+    This class is a token bucket that allows a burst of requests and then
+    a steady rate of them. Instead of rejecting a request over the limit it
+    returns how long to wait before handling it, which also stops reading
+    from the connection until then.
+    '''
+
+    def __init__(self, rate: float, burst: int):
+        self.__rate: float = rate
+        self.__burst: float = float(burst)
+        self.__tokens: float = float(burst)
+        self.__last: float = monotonic()
+
+    def delay(self) -> float:
+        '''
+        Takes a token and returns the seconds to wait until it is available
+        '''
+        now = monotonic()
+        self.__tokens = min(self.__burst, self.__tokens + (now - self.__last) * self.__rate)
+        self.__last = now
+        self.__tokens -= 1
+
+        return max(0.0, -self.__tokens / self.__rate)
+
+
+class GameServer:  # pylint: disable=too-many-instance-attributes
+    '''
+    This class serves games to many connections from a single event loop.
+    Every connection is handled by its own task that reads one request at a
+    time, so a client that doesn't read its responses stops being read from
+    once the write buffer is full (backpressure). Requests of a connection are
+    limited to rate per second after a burst, a rate of 0 disables the limit.
+    Lines, sessions per connection, connections and board sizes are bounded,
+    and the games of all connections share a budget of resident tiles.
+    '''
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 host: str = "127.0.0.1",
+                 port: int = 8765,
+                 *,
+                 rate: float = 1000.0,
+                 burst: int = 100,
+                 max_sessions: int = 16,
+                 max_connections: int = 10_000,
+                 max_cells: int = 100_000,
+                 max_resident_tiles: int = 10_000_000):
+        self.__host: str = host
+        self.__port: int = port
+        self.__rate: float = rate
+        self.__burst: int = burst
+        self.__max_sessions: int = max_sessions
+        self.__max_connections: int = max_connections
+        self.__max_cells: int = max_cells
+        self.__server: asyncio.Server | None = None
+        self.__connections: set[asyncio.Task] = set()
+        self.__sessions: SessionManager = SessionManager(max_resident_tiles)
+        self.__session_ids: count = count(1)
+
+    async def start(self) -> tuple[str, int]:
+        '''
+        Starts listening and returns the address, useful with port 0
+        '''
+        self.__server = await asyncio.start_server(self.__handle, self.__host, self.__port,
+                                                   limit=1 << 16)
+        return self.get_address()
+
+    def get_address(self) -> tuple[str, int]:
+        '''
+        Returns the address the server listens on
+        '''
+        return self.__server.sockets[0].getsockname()[:2]
+
+    def get_connection_count(self) -> int:
+        '''
+        Returns the amount of open connections
+        '''
+        return len(self.__connections)
+
+    def get_stats(self) -> dict:
+        '''
+        Returns the counters of the open connections and sessions
+        '''
+        return {"connections": len(self.__connections), **self.__sessions.get_stats()}
+
+    async def stop(self):
+        '''
+        Stops accepting connections, then closes the open ones and their games.
+        A request that is being handled is finished first.
+        '''
+        if self.__server is None:
+            return
+
+        self.__server.close()
+        await self.__server.wait_closed()
+
+        for task in list(self.__connections):
+            task.cancel()
+        await asyncio.gather(*self.__connections, return_exceptions=True)
+        self.__server = None
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        '''
+        Answers the requests of one connection until it is closed
+        '''
+        task = asyncio.current_task()
+        self.__connections.add(task)
+        sessions: set[int] = set()
+        limiter = RateLimiter(self.__rate, self.__burst) if self.__rate > 0 else None
+
+        try:
+            if len(self.__connections) > self.__max_connections:
+                await self.__send(writer, {"ok": False, "error": "Too many connections"})
+                return
+
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await self.__send(writer, {"ok": False, "error": "Request too long"})
+                    return
+
+                if not line:
+                    return
+
+                if limiter is not None:
+                    delay = limiter.delay()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                await self.__send(writer, self.__respond(line, sessions))
+        except ConnectionError:
+            pass
+        finally:
+            for session in sessions:
+                self.__sessions.close(session)
+            self.__connections.discard(task)
+            writer.close()
+            with suppress(ConnectionError, asyncio.CancelledError):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def __send(writer: asyncio.StreamWriter, response: dict):
+        '''
+        Writes a response, waiting while the client is not reading them
+        '''
+        writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+        await writer.drain()
+
+    def __respond(self, line: bytes, sessions: set[int]) -> dict:
+        '''
+        Returns the response to a request line
+        '''
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "Invalid JSON"}
+
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "A request must be an object"}
+
+        response = {"id": request["id"]} if "id" in request else {}
+
+        try:
+            response.update(self.__dispatch(request, sessions))
+        except ProtocolError as error:
+            response.update(ok=False, error=str(error))
+
+        return response
+
+    @staticmethod
+    def __integer(request: dict, key: str) -> int:
+        '''
+        Returns an integer field of a request
+        '''
+        value = request.get(key)
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ProtocolError(f"{key} must be an integer")
+
+        return value
+
+    @staticmethod
+    def __state(game: Game) -> str:
+        '''
+        Returns whether a game is being played, won or lost
+        '''
+        if game.should_continue():
+            return "playing"
+        return "won" if game.has_won() else "lost"
+
+    def __new(self, request: dict, sessions: set[int]) -> dict:
+        '''
+        Starts a game in a new session
+        '''
+        rows, cols, mines = (self.__integer(request, key) for key in ("rows", "cols", "mines"))
+        seed = self.__integer(request, "seed") if "seed" in request else None
+
+        if not Board.is_valid_board(rows, cols, mines):
+            raise ProtocolError("Not a valid game")
+        if rows * cols > self.__max_cells:
+            raise ProtocolError(f"Boards are limited to {self.__max_cells} tiles")
+        if len(sessions) >= self.__max_sessions:
+            raise ProtocolError(f"Connections are limited to {self.__max_sessions} sessions")
+
+        session = next(self.__session_ids)
+        sessions.add(session)
+        self.__sessions.create(session, (rows, cols, mines), seed)
+
+        return {"ok": True, "session": session, "rows": rows, "cols": cols, "mines": mines}
+
+    def __dispatch(self, request: dict, sessions: set[int]) -> dict:
+        '''
+        Handles a request and returns its response
+        '''
+        operation = request.get("op")
+
+        if operation not in OPS:
+            raise ProtocolError(f"Unknown op, expected one of {', '.join(OPS)}")
+
+        if operation == "new":
+            return self.__new(request, sessions)
+
+        session = self.__integer(request, "session")
+        if session not in sessions:
+            raise ProtocolError("Unknown session")
+
+        if operation == "close":
+            sessions.discard(session)
+            self.__sessions.close(session)
+            return {"ok": True}
+
+        game = self.__sessions.get(session)
+
+        if operation == "state":
+            rows, cols = game.get_dimensions()
+            return {"ok": True, "state": self.__state(game), "rows": rows, "cols": cols,
+                    "mines": game.get_mines(), "board": ["".join(row) for row in game.repr()]}
+
+        x, y = self.__integer(request, "x"), self.__integer(request, "y")
+        rows, cols = game.get_dimensions()
+        if not (0 <= x < rows and 0 <= y < cols):
+            raise ProtocolError("Coordinates are outside of the board")
+
+        move = {"show": game.show, "toggle": game.toggle_marked, "chord": game.chord}[operation]
+        changes = move(x, y)
+
+        return {"ok": True, "changes": changes, "state": self.__state(game)}
+
+
+async def serve(server: GameServer):
+    '''
+    Runs a server until SIGINT or SIGTERM, then shuts it down cleanly
+    '''
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    host, port = await server.start()
+    print(f"Listening on {host}:{port}", flush=True)
+
+    await stop.wait()
+    await server.stop()
+
+
+def main(args: list[str]) -> int:
+    '''
+    Parses the arguments and runs the server
+    '''
+    parser = argparse.ArgumentParser(description="Serves minesweeper games over TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0 picks a free port")
+    parser.add_argument("--rate", type=float, default=1000.0,
+                        help="requests per second of a connection, 0 for no limit")
+    parser.add_argument("--burst", type=int, default=100,
+                        help="requests a connection can make at once before it is limited")
+    parser.add_argument("--max-sessions", type=int, default=16, help="games per connection")
+    parser.add_argument("--max-connections", type=int, default=10_000)
+    parser.add_argument("--max-cells", type=int, default=100_000, help="tiles of a board")
+    parser.add_argument("--max-resident-tiles", type=int, default=10_000_000,
+                        help="tiles of the games kept in memory, the rest are compacted")
+    options = parser.parse_args(args)
+
+    asyncio.run(serve(GameServer(options.host, options.port,
+                                 rate=options.rate,
+                                 burst=options.burst,
+                                 max_sessions=options.max_sessions,
+                                 max_connections=options.max_connections,
+                                 max_cells=options.max_cells,
+                                 max_resident_tiles=options.max_resident_tiles)))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,159 @@
+'''
+Session manager module
+'''
+
+from collections import OrderedDict
+from random import Random
+from time import perf_counter
+from typing import Hashable, NamedTuple
+
+from src.base import serialization
+from src.base.board import Board
+from src.base.game import Game
+
+
+class Snapshot(NamedTuple):
+    '''
+    An evicted game: its saved board, the seed it was created with and
+    when it was evicted if its timer was running
+    '''
+    data: bytes
+    seed: int
+    paused: float | None
+
+
+class SessionManager:  # pylint: disable=too-many-instance-attributes
+    '''
+    This class keeps many games open within a budget of resident tiles.
+    When the games in memory have more tiles than the budget, the least
+    recently used ones are evicted into snapshots of a few bits per tile and
+    the seed, and are loaded again the next time they are used, so a player
+    coming back finds the game as it was left, with its timer still running.
+    '''
+
+    def __init__(self,
+                 max_tiles: int = 1_000_000,
+                 board_type: type = Board,
+                 seed: Random | int | None = None):
+        self.__max_tiles: int = max_tiles
+        self.__board_type: type = board_type
+        self.__rng: Random = seed if isinstance(seed, Random) else Random(seed)
+        self.__resident: OrderedDict[Hashable, tuple[Game, int]] = OrderedDict()
+        self.__snapshots: dict[Hashable, Snapshot] = {}
+        self.__seeds: dict[Hashable, int] = {}
+        self.__resident_tiles: int = 0
+        self.__snapshot_bytes: int = 0
+        self.__evictions: int = 0
+        self.__rehydrations: int = 0
+        self.__rehydration_time: float = 0.0
+        self.__max_rehydration_time: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.__resident) + len(self.__snapshots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__resident or key in self.__snapshots
+
+    def create(self,
+               key: Hashable,
+               board_info: tuple[int, int, int],
+               seed: int | None = None) -> Game:
+        '''
+        Starts a game in a new session, replacing a session with the same key.
+        Without a seed one is drawn, so the game can be rebuilt after an eviction.
+        '''
+        self.close(key)
+
+        seed = self.__rng.getrandbits(63) if seed is None else seed
+        game = Game(board_info, self.__board_type, seed)
+        self.__seeds[key] = seed
+        self.__add(key, game)
+
+        return game
+
+    def get(self, key: Hashable) -> Game | None:
+        '''
+        Returns the game of a session, loading it again if it was evicted
+        '''
+        if key in self.__resident:
+            self.__resident.move_to_end(key)
+            return self.__resident[key][0]
+
+        snapshot = self.__snapshots.pop(key, None)
+        if snapshot is None:
+            return None
+
+        start = perf_counter()
+        state, elapsed = serialization.loads(snapshot.data)
+        if snapshot.paused is not None:
+            elapsed += start - snapshot.paused
+
+        game = Game(state, self.__board_type, snapshot.seed, elapsed)
+        self.__snapshot_bytes -= len(snapshot.data)
+        self.__add(key, game)
+
+        duration = perf_counter() - start
+        self.__rehydrations += 1
+        self.__rehydration_time += duration
+        self.__max_rehydration_time = max(self.__max_rehydration_time, duration)
+
+        return game
+
+    def close(self, key: Hashable) -> bool:
+        '''
+        Closes a session.
+        Returns whether it existed.
+        '''
+        self.__seeds.pop(key, None)
+
+        if key in self.__resident:
+            game, tiles = self.__resident.pop(key)
+            self.__resident_tiles -= tiles
+            game.close()
+            return True
+
+        snapshot = self.__snapshots.pop(key, None)
+        if snapshot is not None:
+            self.__snapshot_bytes -= len(snapshot.data)
+            return True
+
+        return False
+
+    def __add(self, key: Hashable, game: Game):
+        '''
+        Makes a game resident, evicting the least recently used ones over the budget
+        '''
+        rows, cols = game.get_dimensions()
+        self.__resident[key] = (game, rows * cols)
+        self.__resident_tiles += rows * cols
+
+        # The game that was just used stays, even if it is larger than the budget
+        while self.__resident_tiles > self.__max_tiles and len(self.__resident) > 1:
+            self.__evict()
+
+    def __evict(self):
+        '''
+        Replaces the least recently used game with its snapshot
+        '''
+        key, (game, tiles) = self.__resident.popitem(last=False)
+        data = game.dumps()
+
+        self.__snapshots[key] = Snapshot(data, self.__seeds[key],
+                                         perf_counter() if game.should_continue() else None)
+        self.__resident_tiles -= tiles
+        self.__snapshot_bytes += len(data)
+        self.__evictions += 1
+
+    def get_stats(self) -> dict:
+        '''
+        Returns the counters of the sessions, with times in seconds
+        '''
+        return {"sessions": len(self),
+                "resident": len(self.__resident),
+                "resident_tiles": self.__resident_tiles,
+                "snapshots": len(self.__snapshots),
+                "snapshot_bytes": self.__snapshot_bytes,
+                "evictions": self.__evictions,
+                "rehydrations": self.__rehydrations,
+                "rehydration_time": self.__rehydration_time,
+                "max_rehydration_time": self.__max_rehydration_time}
@@ -0,0 +1,228 @@
+'''
+Simulation module
+
+Plays many games per difficulty with an automatic player spread over a process
+pool and aggregates the results. Run it with:
+
+    python -m src.simulate --games 100000 --output simulation.jsonl
+
+Every finished batch of games is appended to the output file as one JSON line,
+so an interrupted run continues from the batches that are already there.
+'''
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from random import Random
+from time import perf_counter
+from typing import Iterator
+
+from src.base.board import Board
+from src.base.difficulty import DIFFICULTY_PRESETS
+from src.base.game import Game
+from src.solver.probability import ProbabilityEngine
+from src.solver.solver import Solver
+
+GUESSES: list[str] = ["random", "probability"]
+# Fields that identify a batch, a batch is only reused if all of them match.
+# The last batch of a difficulty has fewer games when --games changes.
+BATCH_KEY: list[str] = ["difficulty", "rows", "cols", "mines", "seed", "guess",
+                        "batch_size", "batch", "games"]
+
+
+def guess(game: Game, solver: Solver, rng: Random, engine: ProbabilityEngine | None) -> tuple:
+    '''
+    Picks a hidden tile when nothing can be proven, either at random or the
+    tile least likely to be a mine
+    '''
+    if engine is not None:
+        probabilities = engine.probabilities(game.repr(), game.get_mines())
+        for cell in solver.get_mines():
+            probabilities.pop(cell, None)
+        return ProbabilityEngine.safest(probabilities)
+
+    mines = solver.get_mines()
+    return rng.choice([(x, y) for x, row in enumerate(game.repr())
+                       for y, char in enumerate(row) if char == '#' and (x, y) not in mines])
+
+
+def play_game(board_info: tuple[int, int, int],
+              rng: Random,
+              engine: ProbabilityEngine | None = None) -> tuple[bool, int, int]:
+    '''
+    Plays one game, opening in the middle and guessing whenever the solver is stuck.
+    Returns whether it was won, the amount of revealed tiles and the amount of guesses.
+    '''
+    rows, cols, _ = board_info
+    game = Game(board_info, seed=rng)
+    solver = Solver(game)
+    guesses = 0
+
+    solver.play((rows // 2, cols // 2))
+
+    while game.should_continue():
+        solver.update(game.show(*guess(game, solver, rng, engine)))
+        guesses += 1
+        solver.play()
+
+    return game.has_won(), len(solver.get_revealed()), guesses
+
+
+def run_batch(task: dict) -> dict:
+    '''
+    Plays a batch of games with its own seeded random generator, so a batch
+    gives the same results in any worker and on every run
+    '''
+    rng = Random(f"{task['seed']}:{task['difficulty']}:{task['batch']}")
+    engine = ProbabilityEngine(time_budget=0.1, seed=rng) if task["guess"] == "probability" \
+        else None
+    board_info = (task["rows"], task["cols"], task["mines"])
+    wins, revealed, guesses = 0, 0, 0
+    start = perf_counter()
+
+    for _ in range(task["games"]):
+        won, game_revealed, game_guesses = play_game(board_info, rng, engine)
+        wins += won
+        revealed += game_revealed
+        guesses += game_guesses
+
+    return {**task, "wins": wins, "revealed": revealed, "guesses": guesses,
+            "time": perf_counter() - start}
+
+
+def make_tasks(difficulties: dict[str, tuple[int, int, int]],
+               games: int,
+               batch_size: int,
+               seed: int,
+               guess_type: str) -> list[dict]:
+    '''
+    Splits the games of every difficulty into batches
+    '''
+    return [{"difficulty": name, "rows": rows, "cols": cols, "mines": mines,
+             "seed": seed, "guess": guess_type, "batch_size": batch_size, "batch": batch,
+             "games": min(batch_size, games - batch * batch_size)}
+            for name, (rows, cols, mines) in difficulties.items()
+            for batch in range(-(-games // batch_size))]
+
+
+def load_results(path: str) -> Iterator[dict]:
+    '''
+    Reads the batches finished by earlier runs, skipping a line cut off by an interruption
+    '''
+    if not os.path.isfile(path):
+        return
+
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def run(tasks: list[dict], workers: int, path: str) -> list[dict]:
+    '''
+    Runs the batches missing from the output file on a process pool,
+    appending every result as soon as it is finished.
+    Returns the results of all the batches.
+    '''
+    def key(record: dict) -> tuple:
+        return tuple(record[field] for field in BATCH_KEY)
+
+    finished = {key(record): record for record in load_results(path)}
+    results = [finished[key(task)] for task in tasks if key(task) in finished]
+    pending = iter([task for task in tasks if key(task) not in finished])
+
+    with open(path, "a", encoding="utf-8") as file, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        running: set[Future] = set()
+        try:
+            while True:
+                # Only a few batches per worker are submitted at a time,
+                # so huge runs don't queue all of their batches up front
+                for task in pending:
+                    running.add(executor.submit(run_batch, task))
+                    if len(running) >= 2 * workers:
+                        break
+                if not running:
+                    break
+
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results.append(future.result())
+                    file.write(json.dumps(results[-1]) + "\n")
+                file.flush()
+        except KeyboardInterrupt:
+            for future in running:
+                future.cancel()
+            print("Interrupted, run again to resume", file=sys.stderr)
+
+    return results
+
+
+def summarize(results: list[dict]) -> dict[str, dict[str, float]]:
+    '''
+    Aggregates the results of the batches per difficulty
+    '''
+    totals: dict[str, dict[str, float]] = {}
+
+    for record in results:
+        total = totals.setdefault(record["difficulty"],
+                                  {"games": 0, "wins": 0, "revealed": 0, "guesses": 0, "time": 0})
+        for field in total:
+            total[field] += record[field]
+
+    return {difficulty: {"games": total["games"],
+                         "win_rate": total["wins"] / total["games"],
+                         "revealed": total["revealed"] / total["games"],
+                         "guesses": total["guesses"] / total["games"],
+                         "time": total["time"] / total["games"]}
+            for difficulty, total in totals.items() if total["games"]}
+
+
+def main(args: list[str]) -> int:
+    '''
+    Parses the arguments, runs the simulation and prints the summary
+    '''
+    parser = argparse.ArgumentParser(description="Plays minesweeper games automatically")
+    parser.add_argument("--games", type=int, default=1000, help="games per difficulty")
+    parser.add_argument("--difficulties", nargs="*", choices=DIFFICULTY_PRESETS.keys(),
+                        default=None, help="presets to play, all of them by default")
+    parser.add_argument("--custom", nargs=3, type=int, action="append", default=[],
+                        metavar=("ROWS", "COLS", "MINES"), help="a custom board to play")
+    parser.add_argument("--guess", choices=GUESSES, default="random",
+                        help="how to pick a tile when nothing can be proven")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="simulation.jsonl",
+                        help="file the batches are streamed to and resumed from")
+    options = parser.parse_args(args)
+
+    names = options.difficulties
+    if names is None:
+        names = [] if options.custom else list(DIFFICULTY_PRESETS)
+    difficulties = {name: DIFFICULTY_PRESETS[name] for name in names}
+    for rows, cols, mines in options.custom:
+        if not Board.is_valid_board(rows, cols, mines):
+            parser.error(f"{rows}x{cols} with {mines} mines is not a valid board")
+        difficulties[f"{rows}x{cols}x{mines}"] = (rows, cols, mines)
+
+    tasks = make_tasks(difficulties, options.games, options.batch_size,
+                       options.seed, options.guess)
+    summary = summarize(run(tasks, options.workers, options.output))
+
+    for difficulty, result in summary.items():
+        print(f"{difficulty:<12} {result['games']:>10} games "
+              f"{result['win_rate']:>8.2%} won "
+              f"{result['revealed']:>9.1f} revealed "
+              f"{result['guesses']:>6.2f} guesses "
+              f"{result['time'] * 1000:>8.3f}ms/game")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,3 @@
+'''
+We need this to indicate that solver is a module
+'''
@@ -0,0 +1,60 @@
+'''
+No-guess generation module
+
+Generates boards that can be solved from their opening by logic alone. A
+candidate layout is placed around a random opening and kept only if the
+solver wins it without guessing. The opening is revealed in the returned
+board, since a board made before the game starts can't depend on the first click.
+'''
+
+from random import Random
+
+import numpy as np
+
+from src.base.board import Board
+from src.base.serialization import BoardState
+from src.solver.solver import Solver
+
+
+def is_solvable(state: BoardState, start: tuple[int, int]) -> bool:
+    '''
+    Checks if the solver wins a board from the start tile without guessing
+    '''
+    board = Board(state)
+    Solver(board).play(start)
+
+    return board.has_won()
+
+
+def generate(board_info: tuple[int, int, int],
+             seed: Random | int | None = None,
+             max_attempts: int = 1000) -> BoardState | None:
+    '''
+    Generates candidate boards until one can be solved without guessing.
+    Returns it with its opening revealed, or None if no candidate passed.
+    '''
+    rows, cols, num_mines = board_info
+    rng = seed if isinstance(seed, Random) else Random(seed)
+    shape = (rows, cols)
+
+    for _ in range(max_attempts):
+        x, y = rng.randrange(rows), rng.randrange(cols)
+        forbidden = {(x + dx, y + dy) for dx in [-1, 0, 1] for dy in [-1, 0, 1]
+                     if 0 <= x + dx < rows and 0 <= y + dy < cols}
+
+        if len(forbidden) + num_mines > rows * cols:
+            continue
+
+        mines = np.zeros(shape, dtype=bool)
+        for mine in Board.generate_mine_coords(rows, cols, num_mines, forbidden, rng):
+            mines[mine] = True
+
+        state = BoardState(rows, cols, num_mines, True, mines,
+                           np.ones(shape, dtype=bool), np.zeros(shape, dtype=bool))
+
+        if is_solvable(state, (x, y)):
+            board = Board(state)
+            board.show(x, y)
+            return board.get_state()
+
+    return None
@@ -0,0 +1,93 @@
+'''
+No-guess pool module
+'''
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from random import Random
+
+from src.base.serialization import BoardState
+from src.solver.no_guess import generate
+
+
+class NoGuessPool:
+    '''
+    This class keeps a bounded pool of verified boards for every board size it
+    is given, generated by background processes. Taking a board starts the
+    generation of its replacement. Boards are never generated while waiting:
+    when the pool of a size is empty the caller plays a random board instead,
+    and sizes it didn't keep yet are kept from then on.
+    '''
+
+    def __init__(self,
+                 boards: list[tuple[int, int, int]],
+                 size: int = 3,
+                 workers: int = 1,
+                 seed: Random | int | None = None):
+        self.__size: int = size
+        self.__rng: Random = seed if isinstance(seed, Random) else Random(seed)
+        # Spawned workers don't inherit the state of the display of the GUI
+        self.__executor: ProcessPoolExecutor = \
+            ProcessPoolExecutor(workers, mp_context=get_context("spawn"))
+        self.__ready: dict[tuple[int, int, int], deque[BoardState]] = \
+            {board_info: deque() for board_info in boards}
+        self.__pending: dict[tuple[int, int, int], list[Future]] = \
+            {board_info: [] for board_info in boards}
+
+        for board_info in boards:
+            self.__fill(board_info)
+
+    def __collect(self, board_info: tuple[int, int, int]):
+        '''
+        Moves the finished boards of a size to the pool
+        '''
+        pending = self.__pending[board_info]
+
+        for future in [future for future in pending if future.done()]:
+            pending.remove(future)
+            if not future.cancelled() and future.exception() is None \
+                    and future.result() is not None:
+                self.__ready[board_info].append(future.result())
+
+    def __fill(self, board_info: tuple[int, int, int]):
+        '''
+        Starts generating boards of a size until the pool will be full
+        '''
+        self.__collect(board_info)
+
+        while len(self.__ready[board_info]) + len(self.__pending[board_info]) < self.__size:
+            self.__pending[board_info].append(
+                self.__executor.submit(generate, board_info, self.__rng.getrandbits(63)))
+
+    def get_ready(self, board_info: tuple[int, int, int]) -> int:
+        '''
+        Returns the amount of verified boards of a size that are ready
+        '''
+        if board_info not in self.__ready:
+            return 0
+
+        self.__collect(board_info)
+        return len(self.__ready[board_info])
+
+    def get(self, board_info: tuple[int, int, int]) -> BoardState | None:
+        '''
+        Returns a verified board of a size taken from the pool and refills it.
+        Returns None if no board of the size is ready yet.
+        '''
+        if board_info not in self.__ready:
+            self.__ready[board_info] = deque()
+            self.__pending[board_info] = []
+
+        self.__collect(board_info)
+        ready = self.__ready[board_info]
+        state = ready.popleft() if ready else None
+        self.__fill(board_info)
+
+        return state
+
+    def close(self):
+        '''
+        Stops the workers, boards that are being generated are dropped
+        '''
+        self.__executor.shutdown(wait=False, cancel_futures=True)
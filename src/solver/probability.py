@@ -0,0 +1,415 @@
+'''
+Probability module
+'''
+
+from collections import OrderedDict
+from itertools import product
+from math import exp, inf, lgamma, log
+from random import Random
+from time import perf_counter
+
+
+class ProbabilityEngine:
+    '''
+    This class calculates the probability of every hidden tile being a mine
+    from the visible board and the total amount of mines.
+    The hidden tiles next to revealed numbers are split into independent components.
+    The valid mine configurations of every component are enumerated and the
+    components are combined with the tiles away from the numbers through the
+    global mine count. Component results are memoized, so after a move only the
+    components it touched are enumerated again. Components that can't be
+    enumerated within the first half of the time budget of a query are
+    sampled in the rest of it instead.
+    '''
+    __NEIGHBOURS: list[tuple[int, int]] = [
+        (dx, dy) for dx, dy in product([-1, 0, 1], [-1, 0, 1]) if (dx, dy) != (0, 0)
+    ]
+    __PRECISION: float = 1e-30
+
+    def __init__(self,
+                 time_budget: float = 1.0,
+                 samples: int = 2000,
+                 cache_size: int = 4096,
+                 seed: Random | int | None = None):
+        self.__time_budget: float = time_budget
+        self.__samples: int = samples
+        self.__cache_size: int = cache_size
+        self.__rng: Random = seed if isinstance(seed, Random) else Random(seed)
+        self.__cache: OrderedDict[frozenset, dict[int, tuple[int, list[int]]]] = OrderedDict()
+
+    def __constraints(self, state: list[list[str]]) -> dict[tuple[int, int], list]:
+        '''
+        Returns the hidden neighbours and mine count of every revealed number
+        '''
+        rows, cols = len(state), len(state[0])
+        constraints: dict[tuple[int, int], list] = {}
+
+        for x, y in product(range(rows), range(cols)):
+            if not state[x][y].isdigit():
+                continue
+
+            hidden: list[tuple[int, int]] = []
+            mines = int(state[x][y])
+            for dx, dy in self.__NEIGHBOURS:
+                if 0 <= x + dx < rows and 0 <= y + dy < cols:
+                    if state[x + dx][y + dy] in ('#', 'P'):
+                        hidden.append((x + dx, y + dy))
+                    elif state[x + dx][y + dy] == '*':
+                        mines -= 1
+
+            if hidden:
+                constraints[(x, y)] = [hidden, mines]
+
+        return constraints
+
+    @staticmethod
+    def __components(constraints: dict[tuple[int, int], list]) -> list[list[list]]:
+        '''
+        Groups the constraints that (transitively) share hidden tiles
+        '''
+        parent: dict[tuple[int, int], tuple[int, int]] = {}
+
+        def find(cell: tuple[int, int]) -> tuple[int, int]:
+            while parent.setdefault(cell, cell) != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        for hidden, _ in constraints.values():
+            for cell in hidden[1:]:
+                parent[find(cell)] = find(hidden[0])
+
+        groups: dict[tuple[int, int], list[list]] = {}
+        for constraint in constraints.values():
+            groups.setdefault(find(constraint[0][0]), []).append(constraint)
+
+        return list(groups.values())
+
+    @staticmethod
+    def __prepare(cells: list[tuple[int, int]],
+                  component: list[list]) -> tuple[list[list[int]], list[int], list[int]]:
+        '''
+        Returns the constraints of every tile of a component, the mines every
+        constraint still needs and the amount of its tiles without a value
+        '''
+        index = {cell: i for i, cell in enumerate(cells)}
+        cell_constraints: list[list[int]] = [[] for _ in cells]
+        need: list[int] = []
+        left: list[int] = []
+
+        for i, (hidden, mines) in enumerate(component):
+            for cell in hidden:
+                cell_constraints[index[cell]].append(i)
+            need.append(mines)
+            left.append(len(hidden))
+
+        return cell_constraints, need, left
+
+    def __search(self,  # pylint: disable=too-many-locals
+                 cells: list[tuple[int, int]],
+                 component: list[list],
+                 deadline: float) -> dict[int, tuple[int, list[int]]] | None:
+        '''
+        Enumerates the mine configurations of a component with an iterative search.
+        Returns the amount of configurations and the mine count of every tile per
+        amount of mines, or None if the deadline passed.
+        '''
+        cell_constraints, need, left = self.__prepare(cells, component)
+
+        def feasible(i: int, value: int) -> bool:
+            return all(0 <= need[constraint] - value <= left[constraint] - 1
+                       for constraint in cell_constraints[i])
+
+        def assign(i: int, value: int, sign: int):
+            for constraint in cell_constraints[i]:
+                need[constraint] -= sign * value
+                left[constraint] -= sign
+
+        results: dict[int, tuple[int, list[int]]] = {}
+        values: list[int] = [-1] * len(cells)
+        mines, nodes, i = 0, 0, 0
+
+        while i >= 0:
+            if i == len(cells):
+                weight, counts = results.setdefault(mines, (0, [0] * len(cells)))
+                results[mines] = (weight + 1,
+                                  [count + value for count, value in zip(counts, values)])
+                i -= 1
+                continue
+
+            nodes += 1
+            if not nodes % 4096 and perf_counter() > deadline:
+                return None
+
+            if values[i] == -1:
+                candidates: tuple[int, ...] = (0, 1)
+            else:
+                assign(i, values[i], -1)
+                mines -= values[i]
+                candidates = (1,) if values[i] == 0 else ()
+
+            value = next((v for v in candidates if feasible(i, v)), None)
+
+            if value is None:
+                values[i] = -1
+                i -= 1
+                continue
+
+            values[i] = value
+            assign(i, value, 1)
+            mines += value
+            i += 1
+
+        return results
+
+    def __draw(self,
+               cells: list[tuple[int, int]],
+               component: list[list]) -> tuple[int, int, list[int]] | None:
+        '''
+        Draws a configuration of a component by giving every tile one of its
+        feasible values at random. The tiles are visited constraint by
+        constraint, so every constraint is completed soon after it is started.
+        Returns its amount of mines, the amount of tiles that had two feasible
+        values and the values, or None if a tile had none.
+        '''
+        cell_constraints, need, left = self.__prepare(cells, component)
+        index = {cell: i for i, cell in enumerate(cells)}
+        order = list(dict.fromkeys(index[cell] for hidden, _ in component for cell in hidden))
+        values: list[int] = [0] * len(cells)
+        choices = 0
+
+        for i in order:
+            feasible = [value for value in (0, 1)
+                        if all(0 <= need[constraint] - value <= left[constraint] - 1
+                               for constraint in cell_constraints[i])]
+            if not feasible:
+                return None
+
+            choices += len(feasible) - 1
+            values[i] = feasible[self.__rng.randrange(len(feasible))]
+            for constraint in cell_constraints[i]:
+                need[constraint] -= values[i]
+                left[constraint] -= 1
+
+        return sum(values), choices, values
+
+    def __sample(self,
+                 cells: list[tuple[int, int]],
+                 component: list[list],
+                 deadline: float) -> dict[int, tuple[float, list[float]]]:
+        '''
+        Estimates the configurations of a component from random draws, taking
+        draws until their amount or the time runs out. A draw with c choices
+        had a probability of 2^-c, so it is weighted by 2^c to keep the
+        estimate of every configuration count unbiased.
+        '''
+        results: dict[int, tuple[float, list[float]]] = {}
+        reference: int | None = None
+
+        for _ in range(self.__samples):
+            # Draws go on past the deadline until one of them succeeds
+            if results and perf_counter() > deadline:
+                break
+
+            drawn = self.__draw(cells, component)
+            if drawn is None:
+                continue
+
+            mines, choices, values = drawn
+            if reference is None:
+                reference = choices
+            # Weights are relative to the first draw, so they stay in floating point range
+            weight = 2.0 ** (choices - reference)
+            old_weight, old_counts = results.get(mines, (0.0, [0.0] * len(cells)))
+            results[mines] = (old_weight + weight,
+                              [count + weight * value for count, value in zip(old_counts, values)])
+
+        return results
+
+    def __solve_component(self,
+                          cells: list[tuple[int, int]],
+                          component: list[list],
+                          deadlines: tuple[float, float]) -> dict[int, tuple[int, list[int]]]:
+        '''
+        Returns the configurations of a component, memoized by its constraints
+        '''
+        key = frozenset((frozenset(hidden), mines) for hidden, mines in component)
+
+        if key in self.__cache:
+            self.__cache.move_to_end(key)
+            return self.__cache[key]
+
+        search_deadline, deadline = deadlines
+        results = self.__search(cells, component, search_deadline)
+
+        if results is None:
+            results = self.__sample(cells, component, deadline)
+            if not results:
+                # No draw succeeded in time, a later query may still find some
+                return results
+
+        self.__cache[key] = results
+        if len(self.__cache) > self.__cache_size:
+            self.__cache.popitem(last=False)
+
+        return results
+
+    @staticmethod
+    def __log_ways(cells: int, mines: int) -> float:
+        '''
+        Returns the logarithm of the ways to place mines on tiles without constraints
+        '''
+        if not 0 <= mines <= cells:
+            return -inf
+        return lgamma(cells + 1) - lgamma(mines + 1) - lgamma(cells - mines + 1)
+
+    @staticmethod
+    def __normalize(offset: int, coefficients: list[float]) -> tuple[int, list[float]]:
+        '''
+        Scales a polynomial so that its largest coefficient is one and drops
+        the negligible coefficients at both ends
+        '''
+        top = max(coefficients, default=0.0)
+        if not top:
+            return offset, []
+
+        kept = [i for i, value in enumerate(coefficients)
+                if value >= top * ProbabilityEngine.__PRECISION]
+        return offset + kept[0], [value / top for value in coefficients[kept[0]:kept[-1] + 1]]
+
+    @staticmethod
+    def __multiply(first: tuple[int, list[float]],
+                   second: tuple[int, list[float]]) -> tuple[int, list[float]]:
+        '''
+        Multiplies two polynomials given by their lowest degree and coefficients
+        '''
+        result = [0.0] * (len(first[1]) + len(second[1]) - 1)
+
+        for i, value in enumerate(first[1]):
+            for j, other in enumerate(second[1]):
+                result[i + j] += value * other
+
+        return ProbabilityEngine.__normalize(first[0] + second[0], result)
+
+    @staticmethod
+    def __tilt(results: dict[int, tuple[int, list[int]]],
+               log_ratio: float) -> tuple[int, list[float]]:
+        '''
+        Returns the polynomial of the configuration counts of a component,
+        with the count of every amount of mines k multiplied by ratio^k
+        '''
+        low, high = min(results), max(results)
+        logs = [log(results[k][0]) + k * log_ratio if k in results else -inf
+                for k in range(low, high + 1)]
+        top = max(logs)
+        return ProbabilityEngine.__normalize(low, [exp(value - top) for value in logs])
+
+    def __combine(self,  # pylint: disable=too-many-locals
+                  solved: list[tuple[list[tuple[int, int]], dict[int, tuple[int, list[int]]]]],
+                  interior: int,
+                  remaining: int) -> tuple[dict[tuple[int, int], float], float] | None:
+        '''
+        Combines the component configurations with the interior tiles through
+        the amount of remaining mines. A configuration with K mines on the
+        components is weighted by the ways to place the other mines on the interior.
+        The polynomials are tilted by the expected mine ratio, so they stay in
+        floating point range and their negligible terms can be dropped.
+        Returns the probabilities of the component tiles and of an interior tile,
+        None if no configuration fits the board.
+        '''
+        if not all(results for _, results in solved):
+            # A component without configurations means the board is inconsistent
+            return None
+
+        density = remaining / max(interior + sum(len(cells) for cells, _ in solved), 1)
+        density = min(max(density, 1e-9), 1 - 1e-9)
+        log_ratio = log(density / (1 - density))
+        polynomials = [self.__tilt(results, log_ratio) for _, results in solved]
+
+        prefixes = [(0, [1.0])]
+        for polynomial in polynomials:
+            prefixes.append(self.__multiply(prefixes[-1], polynomial))
+
+        # Weight of the interior per amount of mines on the components, tilted back
+        low, coefficients = prefixes[-1]
+        logs = [self.__log_ways(interior, remaining - k) - k * log_ratio
+                for k in range(low, low + len(coefficients))]
+        top = max(logs, default=-inf)
+        if top == -inf:
+            return None
+        rest = (low, [exp(value - top) for value in logs])
+
+        weights = [a * b for a, b in zip(coefficients, rest[1])]
+        interior_probability = sum(weight * (remaining - low - k) / interior
+                                   for k, weight in enumerate(weights)) / sum(weights) \
+            if interior else 0.0
+
+        probabilities: dict[tuple[int, int], float] = {}
+
+        # Walks the components backwards, keeping the weight of everything after them
+        for i in reversed(range(len(solved))):
+            cells, results = solved[i]
+            (prefix_low, prefix), (poly_low, poly) = prefixes[i], polynomials[i]
+            rest_low, rest_values = rest
+
+            def rest_at(k: int, rest_low: int = rest_low,
+                        rest_values: list[float] = rest_values) -> float:
+                return rest_values[k - rest_low] if 0 <= k - rest_low < len(rest_values) else 0.0
+
+            weights = [value * sum(before * rest_at(prefix_low + j + poly_low + extra)
+                                   for j, before in enumerate(prefix))
+                       for extra, value in enumerate(poly)]
+            total = sum(weights)
+
+            for cell in cells:
+                probabilities[cell] = 0.0
+            for extra, weight in enumerate(weights):
+                if weight:
+                    count, counts = results[poly_low + extra]
+                    for cell, mines in zip(cells, counts):
+                        probabilities[cell] += weight / total * mines / count
+
+            rest = self.__normalize(prefix_low, [
+                sum(value * rest_at(prefix_low + j + poly_low + extra)
+                    for extra, value in enumerate(poly))
+                for j in range(len(prefix))])
+
+        return probabilities, interior_probability
+
+    def probabilities(self,
+                      state: list[list[str]],
+                      total_mines: int) -> dict[tuple[int, int], float]:
+        '''
+        Returns the probability of every hidden tile being a mine.
+        The time budget is shared by all the components of the query.
+        '''
+        start = perf_counter()
+        deadlines = (start + self.__time_budget / 2, start + self.__time_budget)
+        solved: list[tuple[list[tuple[int, int]], dict[int, tuple[int, list[int]]]]] = []
+
+        for component in self.__components(self.__constraints(state)):
+            cells = sorted({cell for hidden, _ in component for cell in hidden})
+            solved.append((cells, self.__solve_component(cells, component, deadlines)))
+
+        frontier = {cell for cells, _ in solved for cell in cells}
+        interior = [(x, y) for x, row in enumerate(state) for y, char in enumerate(row)
+                    if char in ('#', 'P') and (x, y) not in frontier]
+
+        combined = self.__combine(
+            solved, len(interior), total_mines - sum(row.count('*') for row in state))
+
+        if combined is None:
+            return {}
+
+        probabilities, interior_probability = combined
+        for cell in interior:
+            probabilities[cell] = interior_probability
+
+        return probabilities
+
+    @staticmethod
+    def safest(probabilities: dict[tuple[int, int], float]) -> tuple[int, int] | None:
+        '''
+        Returns the hidden tile least likely to be a mine
+        '''
+        return min(probabilities, key=probabilities.get, default=None)
@@ -0,0 +1,265 @@
+'''
+Solver module
+'''
+
+from itertools import product
+from typing import Protocol
+
+
+class Playable(Protocol):
+    '''
+    The part of the Game/Board interface the solver relies on
+    '''
+    def show(self, x: int, y: int) -> list[tuple[int, int, str]]:
+        '''
+        Reveals a tile and returns the changed tiles
+        '''
+
+    def toggle_marked(self, x: int, y: int) -> list[tuple[int, int, str]]:
+        '''
+        Marks/unmarks a tile and returns the changed tiles
+        '''
+
+    def should_continue(self) -> bool:
+        '''
+        Checks if any more moves can be made
+        '''
+
+    def repr(self) -> list[list[str]]:
+        '''
+        Returns the character representations of the tiles
+        '''
+
+    def repr_tile(self, x: int, y: int) -> str:
+        '''
+        Returns the character representation of a single tile
+        '''
+
+
+class Solver:  # pylint: disable=too-many-instance-attributes
+    '''
+    This class plays a game using only the information a player can see.
+    Every revealed number is a constraint on its hidden neighbours. The constraints
+    are kept up to date from the changes returned by the game, and single tile
+    and subset rules are applied to them until no more tiles can be proven.
+    Every revealed tile is added and settled once, so a game takes time linear
+    in the revealed tiles. Tiles are kept as flat indices, empty tiles add no
+    constraint since the game reveals their neighbours itself, and numbers only
+    watch the neighbours still hidden after all the changes of a move: a 1000x1000
+    board at density 0.1 takes about 7 seconds, half of it in the moves of the game
+    (see the solve case of benchmarks.engine).
+    '''
+    __NEIGHBOURS: list[tuple[int, int]] = [
+        (dx, dy) for dx, dy in product([-1, 0, 1], [-1, 0, 1]) if (dx, dy) != (0, 0)
+    ]
+    __SAFE: int = 1
+    __MINE: int = 2
+
+    def __init__(self, game: Playable):
+        state = game.repr()
+        self.__game: Playable = game
+        self.__rows: int = len(state)
+        self.__cols: int = len(state[0])
+        # Flat index offsets of the neighbours of a tile away from the edges
+        self.__offsets: list[int] = [dx * self.__cols + dy for dx, dy in self.__NEIGHBOURS]
+        # Flat index -> whether the tile was revealed or proven safe, or proven a mine
+        self.__known: bytearray = bytearray(self.__rows * self.__cols)
+        self.__safe: set[int] = set()
+        self.__mines: set[int] = set()
+        # Revealed number -> [hidden neighbours not proven yet, mines among them]
+        self.__constraints: dict[int, list] = {}
+        # Hidden tile -> revealed numbers constraining it
+        self.__watchers: dict[int, list[int]] = {}
+        self.__pending: set[int] = set()
+
+        self.update([(x, y, char) for x, row in enumerate(state) for y, char in enumerate(row)
+                     if char not in ('#', 'P')])
+
+    def __coords(self, cells: set[int]) -> set[tuple[int, int]]:
+        '''
+        Returns the coordinates of tiles given by their flat indices
+        '''
+        return {divmod(cell, self.__cols) for cell in cells}
+
+    def __neighbours(self, cell: int) -> list[int]:
+        '''
+        Returns the flat indices of the neighbours of a tile
+        '''
+        x, y = divmod(cell, self.__cols)
+
+        if 0 < x < self.__rows - 1 and 0 < y < self.__cols - 1:
+            return [cell + offset for offset in self.__offsets]
+
+        return [(x + dx) * self.__cols + y + dy for dx, dy in self.__NEIGHBOURS
+                if 0 <= x + dx < self.__rows and 0 <= y + dy < self.__cols]
+
+    def __settle(self, cell: int, is_mine: bool):
+        '''
+        Removes a tile whose content is known from the constraints watching it
+        '''
+        for watcher in self.__watchers.pop(cell, ()):
+            constraint = self.__constraints[watcher]
+            constraint[0].discard(cell)
+            constraint[1] -= is_mine
+            self.__pending.add(watcher)
+
+    def __prove(self, cells: set[int], is_mine: bool):
+        '''
+        Records tiles that were proven to be mines or safe
+        '''
+        for cell in cells:
+            if self.__known[cell]:
+                continue
+            self.__known[cell] = self.__MINE if is_mine else self.__SAFE
+            (self.__mines if is_mine else self.__safe).add(cell)
+            self.__settle(cell, is_mine)
+
+    def __add_constraint(self, cell: int, mines: int):
+        '''
+        Adds the constraint of a newly revealed number
+        '''
+        neighbours = self.__neighbours(cell)
+        states = [self.__known[neighbour] for neighbour in neighbours]
+        # Known neighbours are only counted, the constraint watches the others
+        unknown = {neighbour for neighbour, state in zip(neighbours, states) if not state}
+        mines -= states.count(self.__MINE)
+
+        if mines in (0, len(unknown)):
+            # Nothing to watch, the hidden neighbours are all safe or all mines
+            self.__prove(unknown, mines != 0)
+            return
+
+        for neighbour in unknown:
+            if neighbour in self.__watchers:
+                self.__watchers[neighbour].append(cell)
+            else:
+                self.__watchers[neighbour] = [cell]
+
+        self.__constraints[cell] = [unknown, mines]
+        self.__pending.add(cell)
+
+    def update(self, changes: list[tuple[int, int, str]]):
+        '''
+        Updates the known state from the tiles that changed in the game
+        '''
+        known, safe, watchers = self.__known, self.__safe, self.__watchers
+        numbers: list[tuple[int, int]] = []
+
+        for x, y, char in changes:
+            cell = x * self.__cols + y
+            if char in ('#', 'P', '*') or (known[cell] and cell not in safe):
+                continue
+
+            known[cell] = self.__SAFE
+            safe.discard(cell)
+            if cell in watchers:
+                self.__settle(cell, False)
+            # The game reveals the neighbours of an empty tile itself
+            if char != ' ':
+                numbers.append((cell, int(char)))
+
+        # The numbers only watch the neighbours that are still hidden after all the changes
+        for cell, mines in numbers:
+            self.__add_constraint(cell, mines)
+
+    def __apply_subset_rules(self, cell: int):
+        '''
+        Compares a constraint with the constraints sharing tiles with it.
+        If one of them contains the other, the difference of their tiles holds
+        the difference of their mines.
+        '''
+        unknown, mines = self.__constraints[cell]
+        others = {other for tile in unknown for other in self.__watchers.get(tile, ())}
+        others.discard(cell)
+
+        for other in others:
+            other_unknown, other_mines = self.__constraints[other]
+
+            if other_unknown <= unknown:
+                rest, rest_mines = unknown - other_unknown, mines - other_mines
+            elif unknown <= other_unknown:
+                rest, rest_mines = other_unknown - unknown, other_mines - mines
+            else:
+                continue
+
+            if rest and rest_mines in (0, len(rest)):
+                # Proving tiles changes the constraints, so they become pending again
+                self.__prove(rest, rest_mines != 0)
+                return
+
+    def __infer(self):
+        '''
+        Applies the rules to the pending constraints until nothing new is proven
+        '''
+        while self.__pending:
+            cell = self.__pending.pop()
+            unknown, mines = self.__constraints[cell]
+
+            if not unknown:
+                continue
+            if mines == 0:
+                self.__prove(set(unknown), False)
+            elif mines == len(unknown):
+                self.__prove(set(unknown), True)
+            else:
+                self.__apply_subset_rules(cell)
+
+    def step(self) -> tuple[set[tuple[int, int]], set[tuple[int, int]]]:
+        '''
+        Runs the inference until it is stuck.
+        Returns the hidden tiles proven to be safe and the tiles proven to be mines.
+        '''
+        self.__infer()
+        return self.__coords(self.__safe), self.__coords(self.__mines)
+
+    def play(self, first_move: tuple[int, int] | None = None, mark_mines: bool = False) -> bool:
+        '''
+        Reveals every tile that can be proven safe until the game ends or the
+        solver is stuck. The first move is used if nothing is revealed yet.
+        Returns whether the solver made any progress.
+        '''
+        progress = False
+
+        if not any(self.__known) and first_move is not None:
+            self.update(self.__game.show(*first_move))
+            progress = True
+
+        while self.__game.should_continue():
+            self.__infer()
+
+            if not self.__safe:
+                break
+
+            changes = [change for cell in list(self.__safe)
+                       for change in self.__game.show(*divmod(cell, self.__cols))]
+            if not changes:
+                break
+
+            progress = True
+            self.update(changes)
+
+        if mark_mines:
+            for x, y in self.__coords(self.__mines):
+                if self.__game.repr_tile(x, y) == '#':
+                    self.__game.toggle_marked(x, y)
+
+        return progress
+
+    def get_safe(self) -> set[tuple[int, int]]:
+        '''
+        Returns the hidden tiles proven to be safe
+        '''
+        return self.__coords(self.__safe)
+
+    def get_mines(self) -> set[tuple[int, int]]:
+        '''
+        Returns the tiles proven to be mines
+        '''
+        return self.__coords(self.__mines)
+
+    def get_revealed(self) -> set[tuple[int, int]]:
+        '''
+        Returns the revealed tiles
+        '''
+        return self.__coords({cell for cell, state in enumerate(self.__known)
+                              if state == self.__SAFE and cell not in self.__safe})
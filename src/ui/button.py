@@ -12,42 +12,51 @@ from src.ui.text import Text
 
 class Button:
     '''
-    This class is used for a button GUI element
+    This class is used for a button GUI element.
+    It is only redrawn when its hover state changes or it is invalidated.
     '''
-    __x: int
-    __y: int
-    __width: int
-    __height: int
+    __color: tuple[int, int, int] = (100, 100, 100)
+    __hover_color: tuple[int, int, int] = (130, 130, 130)
+    __rect: tuple[int, int, int, int]
     __text: Text
     __on_click: Callable[[], None]
+    __hovered: bool = False
+    __dirty: bool = True
 
     def __init__(self,
                  x: int,
                  y: int,
                  text: str,
                  on_click: Callable[[], None],
-                 width: int = 240,
-                 height: int = 30):
-        self.__x = x
-        self.__y = y
-        self.__width = width
-        self.__height = height
-        self.__text = Text(self.__x, self.__y, text.capitalize())
+                 size: tuple[int, int] = (240, 30)):
+        width, height = size
+        self.__rect = (x - width // 2, y - height // 2, width, height)
+        self.__text = Text(x, y, text.capitalize())
         self.__on_click = on_click
 
+    def invalidate(self):
+        '''
+        Marks the button to be redrawn on the next render
+        '''
+        self.__dirty = True
+
     def render(self, screen: Screen, mouse: Mouse):
         '''
-        Renders button to the screen
+        Renders button to the screen if needed and handles clicks on it
         '''
-        rect(screen.get_screen(), (100, 100, 100), [
-            self.__x - self.__width // 2,
-            self.__y - self.__height // 2,
-            self.__width,
-            self.__height])
-        self.__text.render(screen)
-        if (mouse.is_in_square(self.__x - self.__width // 2,
-                               self.__x + self.__width // 2,
-                               self.__y - self.__height // 2,
-                               self.__y + self.__height // 2)) \
-                and mouse.is_left_clicked():
+        x_min, y_min, width, height = self.__rect
+        hovered = mouse.is_in_square(x_min, x_min + width, y_min, y_min + height)
+
+        if hovered != self.__hovered:
+            self.__hovered = hovered
+            self.__dirty = True
+
+        if self.__dirty:
+            self.__dirty = False
+            rect(screen.get_screen(),
+                 self.__hover_color if hovered else self.__color,
+                 self.__rect)
+            self.__text.render(screen)
+
+        if hovered and mouse.is_left_clicked():
             self.__on_click()
@@ -2,26 +2,114 @@
 CLI module
 '''
 
+import sys
+from typing import TextIO, TYPE_CHECKING
 
 from src.base.game import Game
 from src.base.board import Board
 
+if TYPE_CHECKING:
+    from src.solver.no_guess_pool import NoGuessPool
+
 
 class CLI:
     '''
     This class is used to play minesweeper on the console.
     It provides an interface for playing using commands.
+    Without commands it prompts for them, otherwise it runs the given stream of
+    commands (a file or stdin) in batch mode. The board output after a command
+    can be the whole board, only the changed tiles as "x y char" lines,
+    only the final board of every game or nothing.
+    Everything is written through one buffer that is flushed in large chunks.
+    With a pool of no-guess boards new games are taken from it, so they can be
+    solved without guessing and start with their opening revealed. When the pool
+    has no board of the size ready yet the game is random.
     '''
+    __BUFFER_SIZE: int = 1 << 16
 
-    def __init__(self):
+    def __init__(self,
+                 commands: TextIO | None = None,
+                 output: str = "board",
+                 stream: TextIO | None = None,
+                 pool: "NoGuessPool | None" = None):
         self.__accept_input: bool = True
         self.__game: Game = None
+        self.__output: str = output
+        self.__stream: TextIO = sys.stdout if stream is None else stream
+        self.__buffer: list[str] = []
+        self.__buffered: int = 0
+        self.__pool: "NoGuessPool | None" = pool
+
+        if commands is None:
+            while self.__accept_input:
+                cmd: str = input("Minesweeper CLI> ")
+                self.__parse(cmd)
+                self.__flush()
+        else:
+            for cmd in commands:
+                cmd = cmd.strip()
+                if cmd:
+                    self.__parse(cmd)
+                if not self.__accept_input:
+                    break
+
+            self.__write_final_board()
+
+        self.__write("Thank you for playing!")
+        self.__flush()
+
+    def __write(self, text: str):
+        '''
+        Adds a line to the output buffer, writing the buffer once it is large enough
+        '''
+        self.__buffer.append(text)
+        self.__buffered += len(text) + 1
 
-        while self.__accept_input:
-            cmd: str = input("Minesweeper CLI> ")
-            self.__parse(cmd)
+        if self.__buffered >= self.__BUFFER_SIZE:
+            self.__flush()
 
-        print("Thank you for playing!")
+    def __flush(self):
+        '''
+        Writes the output buffer to the stream
+        '''
+        if self.__buffer:
+            self.__stream.write("\n".join(self.__buffer) + "\n")
+            self.__stream.flush()
+            self.__buffer.clear()
+            self.__buffered = 0
+
+    def __write_board(self):
+        '''
+        Writes the whole board
+        '''
+        self.__write("\n".join(" ".join(row) for row in self.__game.repr()))
+
+    def __write_final_board(self):
+        '''
+        Writes the board of a game that ended or was left if only final boards are written
+        '''
+        if self.__game is not None and self.__output == "final":
+            self.__write_board()
+
+    def __write_changes(self, changes: list[tuple[int, int, str]]):
+        '''
+        Writes the board after a command in the selected output mode
+        '''
+        if self.__output == "board":
+            self.__write_board()
+        elif self.__output == "delta" and changes:
+            self.__write("\n".join(f"{x} {y} {char}" for x, y, char in changes))
+
+    def __new_game(self, board_info: tuple[int, int, int]):
+        '''
+        Starts a game, from the pool of no-guess boards if there is one
+        '''
+        state = self.__pool.get(board_info) if self.__pool is not None else None
+
+        if self.__pool is not None and state is None:
+            self.__write("No board without guesses is ready yet, the board is random")
+
+        self.__game = Game(state or board_info)
 
     def __parse(self, cmd: str):
         '''
@@ -32,62 +120,65 @@ class CLI:
         instr, *args = cmd.split(' ')
 
         def should_accept_cmd(expected_num_args: int = 2) -> bool:
+            if len(args) != expected_num_args or not all(arg.isdigit() for arg in args):
+                self.__write("Invalid arguments")
+                return False
+
             if instr.lower() == "new" and \
                     not Board.is_valid_board(int(args[0]),
                                              int(args[1]),
                                              int(args[2])):
-                print("Not a valid game")
-                return False
-
-            if self.__game is None and instr.lower() in ("show", "toggle"):
-                print("Not in an active game")
+                self.__write("Not a valid game")
                 return False
 
-            if len(args) != expected_num_args or args == filter(lambda arg: arg.isalphanum(), args):
-                print("Invalid arguments")
+            if self.__game is None and instr.lower() in ("show", "toggle", "chord"):
+                self.__write("Not in an active game")
                 return False
 
             return True
 
         if instr.lower() == "help":
-            print("Here are the list of commands:")
-            print("help - prints this menu")
-            print("exit - exits the cli")
-            print("new - starts new game. Usage new <rows> <cols> <mines>")
-            print("show - shows board at specific coordinates. Usage show <x> <y>")
-            print(
+            self.__write("Here are the list of commands:")
+            self.__write("help - prints this menu")
+            self.__write("exit - exits the cli")
+            self.__write("new - starts new game. Usage new <rows> <cols> <mines>")
+            self.__write("show - shows board at specific coordinates. Usage show <x> <y>")
+            self.__write(
                 "toggle - toggles board flag at specific coordinates. Usage toggle <x> <y>")
+            self.__write("chord - shows the neighbours of a number with all of its mines flagged. "
+                         "Usage chord <x> <y>")
         elif instr.lower() == "exit":
             self.__accept_input = False
         elif instr.lower() == "new":
             if not should_accept_cmd(3):
                 return
 
-            print(
+            self.__write_final_board()
+            self.__write(
                 f"Starting a new game with {args[0]} rows, {args[1]} columns and {args[2]} mines")
-            self.__game = Game((int(args[0]), int(args[1]), int(args[2])))
-            self.__game.print()
-        elif instr.lower() == "show":
+            self.__new_game((int(args[0]), int(args[1]), int(args[2])))
+            self.__write_changes([])
+        elif instr.lower() in ("show", "chord"):
             if not should_accept_cmd():
                 return
 
-            self.__game.show(int(args[0]), int(args[1]))
-            self.__game.print()
+            reveal = self.__game.show if instr.lower() == "show" else self.__game.chord
+            self.__write_changes(reveal(int(args[0]), int(args[1])))
 
             if not self.__game.should_continue():
+                self.__write_final_board()
                 time = self.__game.get_time()
                 if self.__game.has_won():
-                    print("You won!")
-                    print(f"{time = }")
+                    self.__write("You won!")
+                    self.__write(f"{time = }")
                 else:
-                    print("You lost!")
+                    self.__write("You lost!")
 
                 self.__game = None
         elif instr.lower() == "toggle":
             if not should_accept_cmd():
                 return
 
-            self.__game.toggle_marked(int(args[0]), int(args[1]))
-            self.__game.print()
+            self.__write_changes(self.__game.toggle_marked(int(args[0]), int(args[1])))
         else:
-            print("Invalid command. Type help to see a list of available commands.")
+            self.__write("Invalid command. Type help to see a list of available commands.")
@@ -13,19 +13,21 @@ from src.ui.mouse import Mouse
 
 class DifficultySelect:
     '''
-    This class is used for the rendering of difficulty select menu
+    This class is used for the rendering of difficulty select menu.
+    The buttons are built once per screen generation and only redrawn when needed.
     '''
+    __buttons: list[Button] = []
+    __generation: int = -1
 
-    def render(self,
-               screen: Screen,
-               mouse: Mouse,
-               state: MenuState,
-               difficulty_presets: dict[str, tuple[int, int, int]],
-               start_game: Callable):
+    def __build(self,
+                screen: Screen,
+                state: MenuState,
+                difficulty_presets: dict[str, tuple[int, int, int]],
+                start_game: Callable):
         '''
-        Renders difficulty select menu to the screen
+        Builds the buttons of the menu
         '''
-        for i, difficulty in enumerate(difficulty_presets.keys()):
+        self.__buttons = [
             Button(screen.get_width() // 2,
                    screen.get_padding() + i * screen.get_margin(),
                    difficulty,
@@ -33,10 +35,28 @@ class DifficultySelect:
                            screen,
                            state,
                            difficulty_presets[difficulty],
-                           difficulty)).render(screen, mouse)
-        Button(screen.get_width() // 2,
-               screen.get_padding() +
-               len(difficulty_presets.keys()) *
-               screen.get_margin(),
-               "leaderboards",
-               lambda: state.set_state(State.LEADERBOARD_SELECT)).render(screen, mouse)
+                           difficulty))
+            for i, difficulty in enumerate(difficulty_presets.keys())]
+        self.__buttons.append(
+            Button(screen.get_width() // 2,
+                   screen.get_padding() +
+                   len(difficulty_presets.keys()) *
+                   screen.get_margin(),
+                   "leaderboards",
+                   lambda: state.set_state(State.LEADERBOARD_SELECT)))
+
+    def render(self,
+               screen: Screen,
+               mouse: Mouse,
+               state: MenuState,
+               difficulty_presets: dict[str, tuple[int, int, int]],
+               start_game: Callable):
+        '''
+        Renders difficulty select menu to the screen
+        '''
+        if self.__generation != screen.get_generation():
+            self.__generation = screen.get_generation()
+            self.__build(screen, state, difficulty_presets, start_game)
+
+        for button in self.__buttons:
+            button.render(screen, mouse)
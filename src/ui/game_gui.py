@@ -5,19 +5,45 @@ Game GUI module
 import pygame
 
 from src.ui.menu_state import MenuState, State
+from src.base.board import Board
 from src.base.game import Game
+from src.base.leaderboard import Leaderboard
+from src.base.numpy_board import NumpyBoard
+from src.solver.no_guess_pool import NoGuessPool
 from src.ui.text import Text
 from src.ui.mouse import Mouse
 from src.ui.screen import Screen
+from src.ui.sprites import Sprites
 
 
 class GameGUI:
     '''
-    This class is used to handle the base game graphical user interface
+    This class is used to handle the base game graphical user interface.
+    The window shows a viewport of as many tiles as fit on the desktop, but
+    always enough for the difficulty presets, that can be scrolled with the
+    arrow keys and the mouse wheel (with shift for horizontal and page sized
+    steps), so the cost of a frame depends only on the window size and not on
+    the board size.
+    With a pool of no-guess boards every game, also after a restart, is one
+    that can be solved without guessing and starts with its opening revealed.
     '''
-    __image_size: int = 32
-    __last_state: list[list[str]] | None = None
+    __sprites: Sprites = Sprites()
+    __image_size: int = __sprites.get_size()
+    # Part of the desktop the viewport may cover, the rest is left for the window decorations
+    __desktop_share: float = 0.85
+    # Boards with more tiles use the numpy engine
+    __large_board: int = 100_000
+    __SCROLL_KEYS: dict[int, tuple[int, int]] = {pygame.K_LEFT: (-1, 0),
+                                                 pygame.K_RIGHT: (1, 0),
+                                                 pygame.K_UP: (0, -1),
+                                                 pygame.K_DOWN: (0, 1)}
+    __view: tuple[int, int] = (0, 0)
+    __camera: tuple[int, int] = (0, 0)
+    __redraw: bool = True
+    __changes: list[tuple[int, int, str]] = []
     __game: Game | None = None
+    __game_info: tuple[int, int, int] = (0, 0, 0)
+    __pool: NoGuessPool | None = None
     __difficulty: str = ""
 
     def __get_image_from_tile_char(self, char: str):
@@ -34,35 +60,90 @@ class GameGUI:
             return "0"
         return char
 
-    def render(self, screen: Screen, mouse: Mouse):
+    def __draw_tile(self, screen: Screen, x: int, y: int, char: str):
         '''
-        Renders a minesweeper game on the screen
+        Draws a single tile of the board on the screen if it is in the viewport
         '''
-        state = self.__game.repr()
+        x, y = x - self.__camera[0], y - self.__camera[1]
 
+        if 0 <= x < self.__view[0] and 0 <= y < self.__view[1]:
+            screen.get_screen().blit(
+                self.__sprites.get(self.__get_image_from_tile_char(char)),
+                (x * self.__image_size, y * self.__image_size))
+
+    def __scroll(self, dx: int, dy: int):
+        '''
+        Moves the viewport, keeping it inside the board
+        '''
+        rows, cols = self.__game.get_dimensions()
+        camera = (min(max(self.__camera[0] + dx, 0), rows - self.__view[0]),
+                  min(max(self.__camera[1] + dy, 0), cols - self.__view[1]))
+
+        if camera != self.__camera:
+            self.__camera = camera
+            self.__redraw = True
+
+    def handle_event(self, event: pygame.event.Event):
+        '''
+        Scrolls the viewport on arrow keys and mouse wheel events
+        '''
+        if self.__game is None:
+            return
+
+        if event.type == pygame.KEYDOWN and event.key in self.__SCROLL_KEYS:
+            dx, dy = self.__SCROLL_KEYS[event.key]
+            page = event.mod & pygame.KMOD_SHIFT
+        elif event.type == pygame.MOUSEWHEEL:
+            dx, dy = event.x, -event.y
+            if pygame.key.get_mods() & pygame.KMOD_SHIFT:
+                dx, dy = dy, dx
+            page = False
+        else:
+            return
+
+        if page:
+            dx, dy = dx * self.__view[0], dy * self.__view[1]
+
+        self.__scroll(dx, dy)
+
+    def update(self, mouse: Mouse, leaderboard: Leaderboard):
+        '''
+        Applies the clicks of the mouse to the game, the tiles they change
+        are drawn by the next render
+        '''
         x, y = mouse.get_pos()
-        x, y = x // self.__image_size, y // self.__image_size
+        x, y = x // self.__image_size + self.__camera[0], y // self.__image_size + self.__camera[1]
+        changes: list[tuple[int, int, str]] = []
 
         if mouse.is_left_clicked():
-            self.__game.show(x, y)
+            changes += self.__game.show(x, y)
+
+        if mouse.is_chord_clicked():
+            changes += self.__game.chord(x, y)
 
-            if self.__game.has_won() and state != self.__game.repr():
-                with open(self.__difficulty, "a", encoding="utf-8") as file:
-                    file.write(str(self.__game.get_time()) + "\n")
+        if self.__game.has_won() and changes:
+            leaderboard.add_score(self.__difficulty, self.__game.get_time())
 
         if mouse.is_right_clicked():
-            self.__game.toggle_marked(x, y)
+            changes += self.__game.toggle_marked(x, y)
 
-        rows, cols = self.__game.get_dimensions()
-        for i in range(rows):
-            for j in range(cols):
-                if self.__last_state and self.__last_state[i][j] == state[i][j]:
-                    continue
-                tile = pygame.image.load(
-                    f"assets/{self.__get_image_from_tile_char(state[i][j])}.png")
-                tile_rect = tile.get_rect()
-                tile_rect.x, tile_rect.y = i * self.__image_size, j * self.__image_size
-                screen.get_screen().blit(tile, tile_rect)
+        self.__changes = changes
+
+    def render(self, screen: Screen):
+        '''
+        Renders a minesweeper game on the screen.
+        Only the tiles that changed since the last frame are redrawn.
+        '''
+        if self.__redraw:
+            self.__redraw = False
+            for i in range(self.__camera[0], self.__camera[0] + self.__view[0]):
+                for j in range(self.__camera[1], self.__camera[1] + self.__view[1]):
+                    self.__draw_tile(screen, i, j, self.__game.repr_tile(i, j))
+        else:
+            for i, j, char in self.__changes:
+                self.__draw_tile(screen, i, j, char)
+
+        self.__changes = []
 
         if not self.__game.should_continue():
             Text(screen.get_width() // 2,
@@ -71,7 +152,34 @@ class GameGUI:
                  if self.__game.has_won(
             ) else "You lost").render(screen)
 
-        self.__last_state = state
+    def set_pool(self, pool: NoGuessPool | None):
+        '''
+        Sets the pool the boards of new games are taken from, None for random boards
+        '''
+        self.__pool = pool
+
+    def __new_game(self):
+        '''
+        Creates a game, from the pool of no-guess boards if there is one
+        '''
+        rows, cols, _ = self.__game_info
+        board_info = self.__game_info
+
+        if self.__pool is not None:
+            board_info = self.__pool.get(self.__game_info) or self.__game_info
+
+        self.__game = Game(board_info, NumpyBoard if rows * cols > self.__large_board else Board)
+        self.__redraw = True
+
+    def __get_max_view(self) -> tuple[int, int]:
+        '''
+        Returns the most tiles that fit on the desktop in each direction,
+        boards larger than that, presets included, are scrolled
+        '''
+        width, height = pygame.display.get_desktop_sizes()[0]
+
+        return (max(int(width * self.__desktop_share) // self.__image_size, 1),
+                max(int(height * self.__desktop_share) // self.__image_size, 1))
 
     def start_game(self,
                    screen: Screen,
@@ -79,25 +187,32 @@ class GameGUI:
                    game_info: tuple[int, int, int],
                    difficulty: str):
         '''
-        Initializes a game
+        Initializes a game, the window is sized to the board or the largest viewport
         '''
         state.set_state(State.GAME)
         self.__difficulty = difficulty
         rows, cols, mines = game_info
+        max_view = self.__get_max_view()
+        self.__view = min(rows, max_view[0]), min(cols, max_view[1])
+        self.__camera = (0, 0)
         screen.set_size(
-            rows * self.__image_size, cols * self.__image_size)
-        self.__game = Game((rows, cols, mines))
+            self.__view[0] * self.__image_size, self.__view[1] * self.__image_size)
+        self.__game_info = (rows, cols, mines)
+        self.__new_game()
 
     def stop_game(self):
         '''
         Stops the current game
         '''
         self.__game = None
-        self.__last_state = None
+        self.__redraw = True
 
     def restart(self):
         '''
         Restarts the game
         '''
-        self.__last_state = None
-        self.__game.restart()
+        if self.__pool is not None:
+            self.__new_game()
+        else:
+            self.__redraw = True
+            self.__game.restart()
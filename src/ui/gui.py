@@ -5,38 +5,68 @@ GUI module
 import sys
 import pygame
 
+from src.base import instrumentation
+from src.base.difficulty import DIFFICULTY_PRESETS
+from src.base.leaderboard import Leaderboard
 from src.ui.leaderboard_menu import LeaderboardMenu
 from src.ui.difficulty_select import DifficultySelect
 from src.ui.game_gui import GameGUI
 from src.ui.screen import Screen
 from src.ui.mouse import Mouse
 from src.ui.menu_state import MenuState, State
+from src.ui.sprites import Sprites
+from src.ui.text import Text
+from src.solver.no_guess_pool import NoGuessPool
 
 
 class GUI:
     '''
     This class is used to play minesweeper with a graphical user interface.
     It has a menu for choosing a difficulty and leaderboards for difficulties with top scores.
+    With instrumentation enabled every frame records the time spent handling
+    input, in the game logic, rendering and updating the display.
+    In no-guess mode the boards of the presets are generated in the background.
     '''
-    __difficulty_presets: dict[str, tuple[int, int, int]] = {"easy": (10, 10, 10), "medium": (
-        16, 16, 40), "hard": (16, 30, 99)}
+    __difficulty_presets: dict[str, tuple[int, int, int]] = DIFFICULTY_PRESETS
     __game_gui: GameGUI = GameGUI()
     __leaderboard_menu: LeaderboardMenu = LeaderboardMenu()
     __screen: Screen = Screen()
     __mouse: Mouse = Mouse()
     __state: MenuState = MenuState()
     __difficulty_select: DifficultySelect = DifficultySelect()
+    __leaderboard: Leaderboard = Leaderboard()
+    __redraw: bool = True
+    __rendered_state: State | None = None
+    __pool: NoGuessPool | None = None
 
-    def __init__(self):
-        pygame.init()
-        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
-        pygame.display.set_icon(pygame.image.load("assets/mine.png"))
+    def __init__(self, fps: int = 60, no_guess: bool = False):
+        # Only the modules that are used, the mixer would open the audio device
+        pygame.display.init()
+        pygame.font.init()
+        pygame.event.set_allowed([pygame.QUIT,
+                                  pygame.KEYDOWN,
+                                  pygame.KEYUP,
+                                  pygame.MOUSEMOTION,
+                                  pygame.MOUSEBUTTONDOWN,
+                                  pygame.MOUSEBUTTONUP,
+                                  pygame.MOUSEWHEEL])
+        # All of the images and fonts are loaded at once before the window opens
+        Sprites.load()
+        Text.load_fonts()
+        pygame.display.set_icon(Sprites().get_image("mine"))
         pygame.display.set_caption('Minesweeper')
+        for difficulty in self.__difficulty_presets:
+            self.__leaderboard.import_legacy(difficulty)
         self.__screen.set_menu_size(
             (len(self.__difficulty_presets.keys()) + 1))
+        if no_guess:
+            self.__pool = NoGuessPool(list(self.__difficulty_presets.values()))
+            self.__game_gui.set_pool(self.__pool)
+        clock = pygame.time.Clock()
 
         while True:
             self.__render()
+            clock.tick(fps)
 
     def __back(self):
         '''
@@ -50,12 +80,32 @@ class GUI:
         elif self.__state.get_state() == State.LEADERBOARD:
             self.__state.set_state(State.LEADERBOARD_SELECT)
 
+    def __get_events(self) -> list[pygame.event.Event]:
+        '''
+        Returns the pending events.
+        Blocks until an event arrives if nothing needs to be redrawn.
+        '''
+        if self.__redraw:
+            self.__redraw = False
+            return pygame.event.get()
+
+        return [pygame.event.wait(), *pygame.event.get()]
+
     def __render(self):
         '''
         Renders everything to the screen
         '''
-        for event in pygame.event.get():
+        events = self.__get_events()
+        # Waiting for events is idle time, the frame starts when they arrived
+        start = instrumentation.clock()
+
+        for event in events:
+            self.__mouse.handle_event(event)
+            if self.__state.get_state() == State.GAME:
+                self.__game_gui.handle_event(event)
             if event.type == pygame.QUIT:
+                if self.__pool is not None:
+                    self.__pool.close()
                 sys.exit()
             elif event.type == pygame.KEYUP:
                 if event.key == pygame.K_ESCAPE:
@@ -63,10 +113,20 @@ class GUI:
                 if event.key == pygame.K_r and self.__state.get_state() == State.GAME:
                     self.__game_gui.restart()
 
-        self.__mouse.handle_events()
+        mark = instrumentation.lap("frame.input", start)
+        state = self.__state.get_state()
+
+        if state == State.GAME:
+            self.__game_gui.update(self.__mouse, self.__leaderboard)
+
+        mark = instrumentation.lap("frame.logic", mark)
+
+        if state != self.__rendered_state:
+            self.__rendered_state = state
+            self.__screen.clear()
 
         if self.__state.get_state() == State.GAME:
-            self.__game_gui.render(self.__screen, self.__mouse)
+            self.__game_gui.render(self.__screen)
         elif self.__state.get_state() == State.DIFFICULTY_SELECT:
             self.__difficulty_select.render(self.__screen,
                                             self.__mouse,
@@ -77,8 +137,14 @@ class GUI:
             self.__leaderboard_menu.render(self.__screen,
                                            self.__mouse,
                                            self.__state,
-                                           self.__difficulty_presets)
+                                           self.__difficulty_presets,
+                                           self.__leaderboard)
 
         self.__mouse.cleanup()
+        # A state change has to be drawn without waiting for the next event
+        self.__redraw = state != self.__state.get_state()
+        mark = instrumentation.lap("frame.render", mark)
 
         pygame.display.update()
+        instrumentation.lap("frame.update", mark)
+        instrumentation.lap("frame.total", start)
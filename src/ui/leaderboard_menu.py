@@ -4,6 +4,7 @@ Leaderboard menu module
 
 from functools import partial
 
+from src.base.leaderboard import Leaderboard
 from src.ui.menu_state import MenuState, State
 from src.ui.screen import Screen
 from src.ui.button import Button
@@ -16,54 +17,47 @@ class LeaderboardMenu:
     This class is used for the rendering of the leaderboard and the selection of it
     '''
     __difficulty: str = ""
-    __top_scores_amount = 10
+    __buttons: list[Button] = []
+    __generation: int = -1
 
-    def __render_leaderboard_list(self,
-                                  screen: Screen,
-                                  mouse: Mouse,
-                                  state: MenuState,
-                                  difficulty_presets: dict[str, tuple[int, int, int]]):
+    def __build_leaderboard_list(self,
+                                 screen: Screen,
+                                 state: MenuState,
+                                 difficulty_presets: dict[str, tuple[int, int, int]]):
         '''
-        Renders the leaderboard depending on the presets
+        Builds the buttons of the leaderboard list depending on the presets
         '''
         def set_leaderboard(difficulty: str):
             self.__difficulty = difficulty
             state.set_state(State.LEADERBOARD)
 
-        for i, difficulty in enumerate(difficulty_presets.keys()):
+        self.__buttons = [
             Button(screen.get_width() // 2,
                    screen.get_padding() + i * screen.get_margin(),
                    f"{difficulty} leaderboard",
-                   partial(set_leaderboard, difficulty)).render(screen, mouse)
-        Button(screen.get_width() // 2,
-               screen.get_padding() +
-               len(difficulty_presets.keys()) * screen.get_margin(),
-               "back",
-               lambda: state.set_state(State.DIFFICULTY_SELECT)).render(screen, mouse)
+                   partial(set_leaderboard, difficulty))
+            for i, difficulty in enumerate(difficulty_presets.keys())]
+        self.__buttons.append(
+            Button(screen.get_width() // 2,
+                   screen.get_padding() +
+                   len(difficulty_presets.keys()) * screen.get_margin(),
+                   "back",
+                   lambda: state.set_state(State.DIFFICULTY_SELECT)))
 
-    def __render_leaderboard(self, screen: Screen):
+    def __render_leaderboard(self, screen: Screen, leaderboard: Leaderboard):
         '''
         Renders a list depending on the difficulty
         '''
-        def get_top_k_scores(k: int, difficulty: str):
-            '''
-            Renders the top scores of screen
-            '''
-            with open(difficulty, "r", encoding="utf-8") as file:
-                return sorted(list(map(float, filter(lambda x: x.replace(
-                    '.', '', 1).isdigit(), file.read().split("\n")))))[:k]
-
-        screen.get_screen().fill((0, 0, 0))
-
         try:
-            top_scores = get_top_k_scores(self.__top_scores_amount,
-                                          self.__difficulty)
+            top_scores = leaderboard.get_top_scores(self.__difficulty)
 
             if not top_scores:
                 raise LookupError
 
-            screen.set_size(
-                640, (len(top_scores) + 2) * (screen.get_margin() // 2) + 2 * screen.get_padding())
+            height = (len(top_scores) + 2) * (screen.get_margin() // 2) + \
+                2 * screen.get_padding()
+            if screen.get_height() != height:
+                screen.set_size(640, height)
             Text(screen.get_width() // 2,
                  screen.get_padding(), f"Top {self.__difficulty} scores:").render(screen)
             for i, score in enumerate(top_scores):
@@ -73,7 +67,7 @@ class LeaderboardMenu:
             Text(screen.get_width() // 2,
                  screen.get_padding() + (len(top_scores) + 2) * screen.get_margin() // 2,
                  "Press ESCAPE to go back").render(screen)
-        except (FileNotFoundError, LookupError):
+        except LookupError:
             Text(screen.get_width() // 2,
                  screen.get_height() // 2 - screen.get_margin() // 2,
                  "No scores found for this difficulty").render(screen)
@@ -85,13 +79,21 @@ class LeaderboardMenu:
                screen: Screen,
                mouse: Mouse,
                state: MenuState,
-               difficulty_presets: dict[str, tuple[int, int, int]]):
+               difficulty_presets: dict[str, tuple[int, int, int]],
+               leaderboard: Leaderboard):
         '''
         Decides whether to render a leaderboard or a list of leaderboards
-        depending on the state
+        depending on the state.
+        Nothing is rebuilt or redrawn until the screen is resized or cleared.
         '''
+        changed = self.__generation != screen.get_generation()
+
         if state.get_state() == State.LEADERBOARD_SELECT:
-            self.__render_leaderboard_list(
-                screen, mouse, state, difficulty_presets)
-        else:
-            self.__render_leaderboard(screen)
+            if changed:
+                self.__build_leaderboard_list(screen, state, difficulty_presets)
+            for button in self.__buttons:
+                button.render(screen, mouse)
+        elif changed:
+            self.__render_leaderboard(screen, leaderboard)
+
+        self.__generation = screen.get_generation()
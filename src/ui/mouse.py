@@ -9,31 +9,57 @@ class Mouse:
     '''
     This class is used for mouse event handling
     '''
-    __CLICK_MINIMUM = 100
-    __timer_lclick: int = 0
-    __timer_rclick: int = 0
+    __LEFT_BUTTON = 1
+    __MIDDLE_BUTTON = 2
+    __RIGHT_BUTTON = 3
+    __lpressed: bool = False
+    __mpressed: bool = False
+    __rpressed: bool = False
+    __both_pressed: bool = False
     __lclick: bool = False
     __rclick: bool = False
+    __chord_click: bool = False
+    __pos: tuple[int, int] = (0, 0)
 
-    def handle_events(self):
+    def handle_event(self, event: pygame.event.Event):
         '''
-        Handles mouse up/down events
+        Handles mouse up/down events.
+        A click is registered when a pressed button is released.
+        Releasing the middle button, or one of the left and right buttons
+        while both are pressed, registers a chord click instead.
         '''
-        left, _, right = pygame.mouse.get_pressed()
+        if event.type not in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
+            return
 
-        if left:
-            self.__timer_lclick += 1
+        self.__pos = event.pos
+
+        if event.type == pygame.MOUSEMOTION:
+            return
+
+        pressed = event.type == pygame.MOUSEBUTTONDOWN
+
+        if event.button == self.__MIDDLE_BUTTON:
+            self.__chord_click |= self.__mpressed and not pressed
+            self.__mpressed = pressed
+            return
+
+        if event.button == self.__LEFT_BUTTON:
+            released, self.__lpressed = self.__lpressed and not pressed, pressed
+        elif event.button == self.__RIGHT_BUTTON:
+            released, self.__rpressed = self.__rpressed and not pressed, pressed
         else:
-            if self.__timer_lclick > self.__CLICK_MINIMUM:
-                self.__lclick = True
-            self.__timer_lclick = 0
+            return
 
-        if right:
-            self.__timer_rclick += 1
+        if pressed:
+            self.__both_pressed |= self.__lpressed and self.__rpressed
+        elif self.__both_pressed:
+            # The first button released chords, releasing the other one does nothing
+            self.__chord_click |= released and (self.__lpressed or self.__rpressed)
+            self.__both_pressed = self.__lpressed or self.__rpressed
+        elif event.button == self.__LEFT_BUTTON:
+            self.__lclick |= released
         else:
-            if self.__timer_rclick > self.__CLICK_MINIMUM:
-                self.__rclick = True
-            self.__timer_rclick = 0
+            self.__rclick |= released
 
     def is_left_clicked(self) -> bool:
         '''
@@ -47,6 +73,12 @@ class Mouse:
         '''
         return self.__rclick
 
+    def is_chord_clicked(self) -> bool:
+        '''
+        Checks if the middle button or both the left and right buttons are clicked
+        '''
+        return self.__chord_click
+
     def is_in_square(self, x_min, x_max, y_min, y_max) -> bool:
         '''
         Checks if mouse position is in a square
@@ -56,12 +88,12 @@ class Mouse:
 
     def get_pos(self) -> tuple[int, int]:
         '''
-        Returns the mouse coordinates in the window
+        Returns the mouse coordinates in the window from the last mouse event
         '''
-        return pygame.mouse.get_pos()
+        return self.__pos
 
     def cleanup(self):
         '''
-        Resets left and right clicked state to false
+        Resets left, right and chord clicked state to false
         '''
-        self.__lclick = self.__rclick = False
+        self.__lclick = self.__rclick = self.__chord_click = False
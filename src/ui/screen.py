@@ -16,6 +16,7 @@ class Screen:
     __padding: int = 80
     __margin: int = 60
     __default_width = 640
+    __generation: int = 0
 
     def set_size(self, width: int, height: int):
         '''
@@ -23,6 +24,20 @@ class Screen:
         '''
         size = self.__width, self.__height = width, height
         self.__screen = set_mode(size)
+        self.__generation += 1
+
+    def clear(self):
+        '''
+        Clears the screen so that everything on it has to be drawn again
+        '''
+        self.__screen.fill((0, 0, 0))
+        self.__generation += 1
+
+    def get_generation(self) -> int:
+        '''
+        Returns a number that changes every time the screen is resized or cleared
+        '''
+        return self.__generation
 
     def get_screen(self) -> Surface:
         '''
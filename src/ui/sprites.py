@@ -0,0 +1,72 @@
+'''
+Sprites module
+'''
+
+import pygame
+
+
+class Sprites:
+    '''
+    This class is used to cache the tile images.
+    The images are read from disk in one step when the GUI starts, then
+    packed into a single sprite sheet converted to the display pixel format
+    and handed out as subsurfaces. All instances share the images.
+    '''
+    __names: list[str] = [str(i) for i in range(9)] + ["flag", "hidden", "mine"]
+    __size: int = 32
+    __images: dict[str, pygame.Surface] = {}
+    __sheet: pygame.Surface | None = None
+    __sprites: dict[str, pygame.Surface] = {}
+
+    @classmethod
+    def load(cls):
+        '''
+        Reads all of the tile images, doesn't need the display mode to be set
+        '''
+        cls.__images = {name: pygame.image.load(f"assets/{name}.png") for name in cls.__names}
+
+    @classmethod
+    def __pack(cls):
+        '''
+        Packs the tile images into the sprite sheet.
+        Needs the display mode to be set beforehand.
+        '''
+        if not cls.__images:
+            cls.load()
+
+        sheet = pygame.Surface((len(cls.__names) * cls.__size, cls.__size))
+
+        for i, name in enumerate(cls.__names):
+            sheet.blit(cls.__images[name], (i * cls.__size, 0))
+
+        cls.__sheet = sheet.convert()
+        cls.__sprites = {
+            name: cls.__sheet.subsurface(
+                (i * cls.__size, 0, cls.__size, cls.__size))
+            for i, name in enumerate(cls.__names)
+        }
+
+    def get(self, name: str) -> pygame.Surface:
+        '''
+        Returns the cached image with the given name, packing the sheet if needed
+        '''
+        if self.__sheet is None:
+            self.__pack()
+
+        return self.__sprites[name]
+
+    def get_image(self, name: str) -> pygame.Surface:
+        '''
+        Returns the image with the given name as it was read, for use before
+        the display mode is set
+        '''
+        if not self.__images:
+            self.load()
+
+        return self.__images[name]
+
+    def get_size(self) -> int:
+        '''
+        Returns the width and height of a single sprite
+        '''
+        return self.__size
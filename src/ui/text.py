@@ -2,6 +2,8 @@
 Text module
 '''
 
+from functools import lru_cache
+from pygame import Surface
 from pygame.font import Font, get_default_font
 
 from src.ui.screen import Screen
@@ -9,25 +11,63 @@ from src.ui.screen import Screen
 
 class Text:
     '''
-    This class is used for a text GUI element
+    This class is used for a text GUI element.
+    Fonts are loaded once per size and rendered surfaces are kept in an LRU cache,
+    so redrawing the same text only costs a blit.
     '''
     __font_size: int = 20
+    __color: tuple[int, int, int] = (255, 255, 255)
     __x: int
     __y: int
     __text: str
-    __font: Font
 
     def __init__(self, x: int, y: int, text: str):
         self.__x = x
         self.__y = y
         self.__text = text
-        self.__font = Font(get_default_font(), self.__font_size)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __get_font(size: int) -> Font:
+        '''
+        Returns the shared default font of the given size
+        '''
+        return Font(get_default_font(), size)
+
+    @staticmethod
+    def load_fonts(sizes: tuple[int, ...] = (__font_size,)):
+        '''
+        Loads the fonts of the given sizes, so the first text drawn doesn't wait for them
+        '''
+        for size in sizes:
+            Text.__get_font(size)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def __get_surface(text: str, size: int, color: tuple[int, int, int]) -> Surface:
+        '''
+        Returns the rendered surface of a text
+        '''
+        return Text.__get_font(size).render(text, True, color)
+
+    @staticmethod
+    def cache_info() -> dict[str, int]:
+        '''
+        Returns the hit and miss counters of the font and text surface caches
+        '''
+        # pylint: disable=no-value-for-parameter
+        fonts, surfaces = Text.__get_font.cache_info(), Text.__get_surface.cache_info()
+        return {"font_hits": fonts.hits,
+                "font_misses": fonts.misses,
+                "surface_hits": surfaces.hits,
+                "surface_misses": surfaces.misses,
+                "surfaces": surfaces.currsize}
 
     def render(self, screen: Screen):
         '''
         Renders text to the screen
         '''
-        text = self.__font.render(self.__text, (0, 0, 0), (255, 255, 255))
+        text = self.__get_surface(self.__text, self.__font_size, self.__color)
         text_rect = text.get_rect()
         text_rect.center = (self.__x, self.__y)
         screen.get_screen().blit(text, text_rect)
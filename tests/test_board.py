@@ -1,8 +1,11 @@
 '''
 Board tests
 '''
-from random import randint
+from random import Random, randint
+import pytest
 from src.base.board import Board
+from src.base.chunked_board import ChunkedBoard
+from src.base.numpy_board import NumpyBoard
 from src.base.tile import Tile
 
 ROWS: int = 50
@@ -33,6 +36,24 @@ def test_mine_coords_generation():
         assert board.should_continue()
 
 
+def test_seeded_mine_coords_generation():
+    '''
+    Tests that seeded generation is reproducible and fills dense boards exactly
+    '''
+    first = Board.generate_mine_coords(ROWS, COLS, NUM_MINES, forbidden, 42)
+    second = Board.generate_mine_coords(ROWS, COLS, NUM_MINES, forbidden, Random(42))
+    assert first == second
+
+    dense = Board.generate_mine_coords(ROWS, COLS, ROWS * COLS - NUM_FORBIDDEN, forbidden)
+    assert len(dense) == ROWS * COLS - NUM_FORBIDDEN
+    assert not dense & forbidden
+
+    board, other = Board((ROWS, COLS, NUM_MINES), 7), Board((ROWS, COLS, NUM_MINES), 7)
+    board.show(0, 0)
+    other.show(0, 0)
+    assert board.repr() == other.repr()
+
+
 def test_board_validity_check():
     '''
     Tests the board validation
@@ -43,3 +64,36 @@ def test_board_validity_check():
     assert not Board.is_valid_board(100, 100, 99001)
     assert Board.is_valid_board(10, 10, 10)
     assert Board.is_valid_board(100, 100, 1000)
+
+
+def test_revealing_large_empty_region():
+    '''
+    Tests that one click reveals a region far larger than the recursion limit
+    '''
+    rows, cols, mine_rows = 300, 300, 30
+    board: Board = Board([[Tile(x >= rows - mine_rows) for y in range(cols)]
+                          for x in range(rows)])
+
+    board.show(0, 0)
+    state = board.repr()
+
+    assert board.has_won()
+    assert all(state[x][y] == ' ' for x in range(rows - mine_rows - 1)
+               for y in range(cols))
+    assert all(state[rows - mine_rows - 1][y] == '3' for y in range(1, cols - 1))
+    assert all(state[x][y] == '#' for x in range(rows - mine_rows, rows)
+               for y in range(cols))
+
+
+@pytest.mark.parametrize("board_type", [Board, NumpyBoard, ChunkedBoard])
+def test_first_click_outside_of_board(board_type: type):
+    '''
+    Tests that showing a tile outside of the board doesn't start the game,
+    so the first real click is still kept free of mines
+    '''
+    for seed in range(50):
+        board = board_type((10, 10, 50), seed)
+
+        assert not board.show(100, 100) and not board.has_started()
+        board.show(5, 5)
+        assert board.has_started() and not board.has_lost()
@@ -0,0 +1,100 @@
+'''
+Chunked board tests
+'''
+from src.base.chunked_board import ChunkedBoard
+from src.base.game import Game
+
+ROWS: int = 20
+COLS: int = 30
+NUM_MINES: int = 100
+CHUNK_SIZE: int = 8
+START: tuple[int, int] = (10, 15)
+
+
+def find_mines() -> set[tuple[int, int]]:
+    '''
+    Finds the mines of the seeded board by showing every tile on a new copy of it
+    '''
+    mines: set[tuple[int, int]] = set()
+
+    for x in range(ROWS):
+        for y in range(COLS):
+            board = ChunkedBoard((ROWS, COLS, NUM_MINES), 1, CHUNK_SIZE)
+            board.show(*START)
+            board.show(x, y)
+            if board.has_lost():
+                mines.add((x, y))
+
+    return mines
+
+
+def test_bounded_board():
+    '''
+    Tests that the chunks hold the exact mine count with correct numbers across
+    chunk borders and that the game can be won
+    '''
+    mines = find_mines()
+    board = ChunkedBoard((ROWS, COLS, NUM_MINES), 1, CHUNK_SIZE)
+    board.show(*START)
+
+    assert len(mines) == NUM_MINES
+    assert not {(START[0] + dx, START[1] + dy) for dx in [-1, 0, 1] for dy in [-1, 0, 1]} & mines
+
+    for x in range(ROWS):
+        for y in range(COLS):
+            if (x, y) not in mines:
+                board.show(x, y)
+                count = sum((x + dx, y + dy) in mines for dx in [-1, 0, 1] for dy in [-1, 0, 1])
+                assert board.repr_tile(x, y) == (str(count) if count else ' ')
+
+    assert board.has_won()
+
+
+def test_endless_board():
+    '''
+    Tests that an endless board only generates the chunks around the explored
+    area and that the same seed gives the same board
+    '''
+    far = (10 ** 12, -10 ** 12)
+    boards = [ChunkedBoard(0.2, 5, 16) for _ in range(2)]
+
+    for board in boards:
+        assert board.repr_tile(*far) == '#'
+        assert board.get_chunk_count() == 0
+        board.show(*far)
+        board.toggle_marked(far[0] + 20, far[1])
+        assert board.should_continue()
+
+    assert boards[0].repr() == boards[1].repr()
+    assert boards[0].get_chunk_count() < 100
+    assert boards[0].repr_tile(far[0] + 20, far[1]) == 'P'
+
+
+def test_game_with_chunked_board():
+    '''
+    Tests that a game can use a chunked board
+    '''
+    game = Game((1_000_000, 1_000_000, 200_000_000_000), ChunkedBoard, seed=2)
+    changes = game.show(500_000, 500_000)
+
+    assert changes
+    assert all(char not in ('#', '*') for _, _, char in changes)
+    assert game.should_continue()
+    assert game.get_mines() == 200_000_000_000
+
+
+def test_reveal_limit():
+    '''
+    Tests that only endless boards limit the tiles revealed at once and that
+    looking at the board never generates chunks
+    '''
+    bounded = ChunkedBoard((ROWS, COLS, 10), 1, CHUNK_SIZE, max_reveal=5)
+    endless = ChunkedBoard(0.01, 1, CHUNK_SIZE, max_reveal=5)
+
+    assert len(bounded.show(*START)) > 5
+    assert len(endless.show(*START)) <= 5 + 8
+
+    for board in (bounded, endless):
+        chunks = board.get_chunk_count()
+        board.repr()
+        assert board.get_chunk_count() == chunks
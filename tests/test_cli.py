@@ -0,0 +1,106 @@
+'''
+CLI batch mode tests
+'''
+import io
+import subprocess
+import sys
+from time import sleep
+from src.solver.no_guess_pool import NoGuessPool
+from src.ui.cli import CLI
+
+ROWS: int = 16
+COLS: int = 30
+COMMANDS: str = f"new {ROWS} {COLS} 99\nshow 8 15\ntoggle 0 0\n\nshow x 1\nfoo\n"
+MESSAGES: list[str] = [f"Starting a new game with {ROWS} rows, {COLS} columns and 99 mines",
+                       "Invalid arguments",
+                       "Invalid command. Type help to see a list of available commands.",
+                       "Thank you for playing!"]
+
+
+def run(output: str) -> list[str]:
+    '''
+    Runs the commands in batch mode and returns the output lines
+    '''
+    stream = io.StringIO()
+    CLI(io.StringIO(COMMANDS), output, stream)
+    return stream.getvalue().splitlines()
+
+
+def test_no_output():
+    '''
+    Tests that only the messages are written without board output
+    '''
+    assert run("none") == MESSAGES
+
+
+def test_final_output():
+    '''
+    Tests that the board is written once when the input ends
+    '''
+    lines = run("final")
+
+    assert lines[:3] == MESSAGES[:3] and lines[-1] == MESSAGES[-1]
+    assert len(lines) == len(MESSAGES) + ROWS
+    assert all(len(line) == 2 * COLS - 1 for line in lines[3:-1])
+    assert lines[3][0] == 'P'
+
+
+def test_board_output():
+    '''
+    Tests that the whole board is written after every game command
+    '''
+    lines = run("board")
+
+    assert len(lines) == len(MESSAGES) + 3 * ROWS
+    assert all(line[0] == '#' for line in lines[1:1 + ROWS])
+
+
+def test_delta_output():
+    '''
+    Tests that only the changed tiles are written
+    '''
+    changes = [line.split(' ', 2) for line in run("delta")[1:-3]]
+
+    assert changes[-1] == ['0', '0', 'P']
+    assert ['8', '15', ' '] in changes
+    assert all(0 <= int(x) < ROWS and 0 <= int(y) < COLS for x, y, _ in changes)
+
+
+def test_no_guess():
+    '''
+    Tests that no-guess games are taken from the pool and start with their opening revealed,
+    and that a random game is played while the pool has no board of the size ready
+    '''
+    stream = io.StringIO()
+    pool = NoGuessPool([(ROWS, COLS, 99)], size=1, seed=0)
+
+    try:
+        for _ in range(600):
+            if pool.get_ready((ROWS, COLS, 99)):
+                break
+            sleep(0.05)
+
+        CLI(io.StringIO(f"new 10 10 10\nnew {ROWS} {COLS} 99\n"), "board", stream, pool)
+    finally:
+        pool.close()
+
+    lines = stream.getvalue().splitlines()
+    board = lines[-1 - ROWS:-1]
+
+    assert lines.count("No board without guesses is ready yet, the board is random") == 1
+    assert any(char not in "# " for line in board for char in line)
+    assert not any('*' in line for line in board)
+
+
+def test_cli_does_not_import_pygame():
+    '''
+    Tests that starting the CLI from the entry point doesn't load the GUI or numpy
+    '''
+    script = ("import sys\n"
+              "from src.minesweeper import main\n"
+              "main(['cli', '--batch', '-', '--output', 'none'])\n"
+              "assert 'pygame' not in sys.modules\n"
+              "assert 'numpy' not in sys.modules\n")
+
+    subprocess.run([sys.executable, "-c", script], input="new 10 10 10\nexit\n", text=True,
+                   stdout=subprocess.DEVNULL, check=True)
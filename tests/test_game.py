@@ -4,9 +4,12 @@ Game tests
 
 from time import perf_counter
 from random import randint
+import pytest
 from src.base.game import Game
 from src.base.tile import Tile
 from src.base.board import Board
+from src.base.chunked_board import ChunkedBoard
+from src.base.numpy_board import NumpyBoard
 
 ROWS: int = 50
 COLS: int = 50
@@ -62,3 +65,68 @@ def test_timer():
     end = perf_counter()
 
     assert abs(game.get_time() - (end - start)) < epsilon
+
+
+def test_changes_match_representation():
+    '''
+    Tests that the returned changes are exactly the tiles whose representation changed
+    '''
+    game = Game((ROWS, COLS, NUM_MINES))
+
+    for _ in range(100):
+        before = game.repr()
+        x, y = randint(0, ROWS - 1), randint(0, COLS - 1)
+        changes = game.toggle_marked(x, y) if randint(0, 3) == 0 else game.show(x, y)
+        after = game.repr()
+
+        assert sorted(changes) == sorted((i, j, after[i][j])
+                                         for i in range(ROWS) for j in range(COLS)
+                                         if before[i][j] != after[i][j])
+
+
+@pytest.mark.parametrize("board_type", [Board, NumpyBoard, ChunkedBoard])
+def test_chording(board_type: type):
+    '''
+    Tests chording on every board engine by marking the hidden neighbours of numbers
+    with as many hidden neighbours as mines and chording the numbers afterwards
+    '''
+    game = Game((ROWS, COLS, NUM_MINES), board_type, seed=0)
+    board = game.repr()
+    revealed = 0
+
+    def apply(changes: list[tuple[int, int, str]]):
+        for x, y, char in changes:
+            board[x][y] = char
+
+    apply(game.show(ROWS // 2, COLS // 2))
+
+    for _ in range(5):
+        numbers = [(x, y) for x in range(ROWS) for y in range(COLS) if board[x][y].isdigit()]
+        for x, y in numbers:
+            neighbours = [(i, j) for i in range(max(x - 1, 0), min(x + 2, ROWS))
+                          for j in range(max(y - 1, 0), min(y + 2, COLS))
+                          if board[i][j] in '#P']
+            if len(neighbours) == int(board[x][y]):
+                for i, j in neighbours:
+                    if board[i][j] == '#':
+                        apply(game.toggle_marked(i, j))
+
+        for x, y in numbers:
+            changes = game.chord(x, y)
+            revealed += len(changes)
+            apply(changes)
+
+        assert board == game.repr()
+
+    assert revealed and not game.has_lost()
+
+
+def test_saving_unsaveable_board():
+    '''
+    Tests that saving a game on a board engine without a saved state is rejected
+    '''
+    game = Game((ROWS, COLS, NUM_MINES), ChunkedBoard, seed=0)
+    game.show(ROWS // 2, COLS // 2)
+
+    with pytest.raises(Exception, match="can't be saved"):
+        game.dumps()
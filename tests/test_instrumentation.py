@@ -0,0 +1,56 @@
+'''
+Instrumentation tests
+'''
+import io
+import json
+from src.base import instrumentation
+from src.base.board import Board
+from src.base.numpy_board import NumpyBoard
+
+
+def test_ring_buffer():
+    '''
+    Tests that a ring buffer keeps the newest samples in order
+    '''
+    buffer = instrumentation.RingBuffer("ms", 4)
+
+    for value in range(6):
+        buffer.append(value)
+
+    assert buffer.values() == [2.0, 3.0, 4.0, 5.0]
+    assert buffer.get_count() == 6
+
+
+def test_disabled():
+    '''
+    Tests that nothing is recorded while disabled
+    '''
+    instrumentation.disable()
+    Board((10, 10, 10), 0).show(0, 0)
+
+    assert not instrumentation.summarize()
+
+
+def test_board_counters(tmp_path):
+    '''
+    Tests that both board engines record their counters and that they can be dumped
+    '''
+    instrumentation.enable(str(tmp_path / "profile.json"))
+
+    try:
+        for board_type in (Board, NumpyBoard):
+            board_type((10, 10, 10), 0).show(0, 0)
+
+        summary = instrumentation.summarize()
+        dump = json.loads(instrumentation.dumps())
+        output = io.StringIO()
+        instrumentation.print_summary(output)
+    finally:
+        instrumentation.disable()
+
+    assert {"board.mines", "board.neighbours", "board.revealed", "board.flood_fill"} <= \
+        set(summary)
+    assert summary["board.revealed"]["count"] == 2
+    assert summary["board.neighbours"]["unit"] == "ms"
+    assert len(dump["board.revealed"]["values"]) == 2
+    assert "board.mines: 2 samples" in output.getvalue()
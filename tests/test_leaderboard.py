@@ -0,0 +1,46 @@
+'''
+Leaderboard tests
+'''
+from random import random
+from src.base.leaderboard import Leaderboard
+
+NUM_SCORES: int = 1000
+TOP_SCORES_AMOUNT: int = 10
+
+
+def test_top_scores(tmp_path):
+    '''
+    Tests that the cached top scores stay correct while scores are added
+    '''
+    leaderboard = Leaderboard(str(tmp_path / "scores.db"), TOP_SCORES_AMOUNT)
+    scores: list[float] = []
+
+    assert not leaderboard.get_top_scores("easy")
+
+    for _ in range(NUM_SCORES):
+        score = random() * 100
+        scores.append(score)
+        leaderboard.add_score("easy", score)
+        assert leaderboard.get_top_scores("easy") == sorted(scores)[:TOP_SCORES_AMOUNT]
+
+    leaderboard.add_score("hard", 0.5)
+    assert leaderboard.get_top_scores("easy") == sorted(scores)[:TOP_SCORES_AMOUNT]
+    leaderboard.close()
+
+    reopened = Leaderboard(str(tmp_path / "scores.db"), TOP_SCORES_AMOUNT)
+    assert reopened.get_top_scores("easy") == sorted(scores)[:TOP_SCORES_AMOUNT]
+    assert reopened.get_top_scores("hard") == [0.5]
+
+
+def test_importing_legacy_scores(tmp_path):
+    '''
+    Tests importing scores from the old plain text files
+    '''
+    legacy = tmp_path / "medium"
+    legacy.write_text("12.5\n3.25\n\n", encoding="utf-8")
+    leaderboard = Leaderboard(str(tmp_path / "scores.db"), TOP_SCORES_AMOUNT)
+
+    leaderboard.import_legacy("medium", str(legacy))
+
+    assert leaderboard.get_top_scores("medium") == [3.25, 12.5]
+    assert not legacy.exists()
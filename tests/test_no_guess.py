@@ -0,0 +1,62 @@
+'''
+No-guess generation tests
+'''
+from time import sleep
+import numpy as np
+from src.base.board import Board
+from src.solver.no_guess import generate
+from src.solver.no_guess_pool import NoGuessPool
+from src.solver.solver import Solver
+
+
+def assert_no_guess(state, board_info):
+    '''
+    Asserts that a board matches its size and is won by the solver from its opening
+    '''
+    rows, cols, mines = board_info
+    board = Board(state)
+
+    assert (state.rows, state.cols, int(state.mines.sum())) == (rows, cols, mines)
+    assert not np.all(state.hidden)
+    assert not np.any(state.mines & ~state.hidden)
+
+    Solver(board).play()
+    assert board.has_won()
+
+
+def test_generate():
+    '''
+    Tests that generated boards can be solved without guessing and are reproducible
+    '''
+    for board_info in [(10, 10, 10), (16, 16, 40), (16, 30, 99)]:
+        state = generate(board_info, 1)
+
+        assert_no_guess(state, board_info)
+        assert np.array_equal(state.mines, generate(board_info, 1).mines)
+
+
+def test_pool():
+    '''
+    Tests that the pool fills in the background and only returns boards that are ready,
+    also for sizes it didn't keep before
+    '''
+    pool = NoGuessPool([(8, 8, 10)], size=2, seed=0)
+
+    try:
+        for _ in range(600):
+            if pool.get_ready((8, 8, 10)) == 2:
+                break
+            sleep(0.05)
+
+        assert pool.get_ready((8, 8, 10)) == 2
+        assert_no_guess(pool.get((8, 8, 10)), (8, 8, 10))
+        assert pool.get((9, 9, 10)) is None
+
+        for _ in range(600):
+            if pool.get_ready((9, 9, 10)):
+                break
+            sleep(0.05)
+
+        assert_no_guess(pool.get((9, 9, 10)), (9, 9, 10))
+    finally:
+        pool.close()
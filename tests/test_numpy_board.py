@@ -0,0 +1,156 @@
+'''
+Numpy board tests
+'''
+from random import randint
+from time import perf_counter
+import numpy as np
+from src.base.board import Board
+from src.base.game import Game
+from src.base.numpy_board import NumpyBoard
+from src.base.tile import Tile
+
+ROWS: int = 50
+COLS: int = 50
+NUM_MINES: int = 300
+mine_coords: set[tuple[int, int]] = Board.generate_mine_coords(
+    ROWS, COLS, NUM_MINES, set())
+
+
+def make_tiles() -> list[list[Tile]]:
+    '''
+    Creates a fresh set of tiles with the same mines
+    '''
+    return [[Tile((x, y) in mine_coords) for y in range(COLS)] for x in range(ROWS)]
+
+
+def test_same_representation_as_board():
+    '''
+    Tests that the numpy board behaves the same as the list board
+    '''
+    board = Board(make_tiles())
+    numpy_board = NumpyBoard(make_tiles())
+
+    for _ in range(200):
+        x, y = randint(0, ROWS - 1), randint(0, COLS - 1)
+        if (x, y) in mine_coords:
+            board.toggle_marked(x, y)
+            numpy_board.toggle_marked(x, y)
+        else:
+            board.show(x, y)
+            numpy_board.show(x, y)
+
+        assert board.repr() == numpy_board.repr()
+        assert board.should_continue() == numpy_board.should_continue()
+
+
+def test_first_click_is_safe():
+    '''
+    Tests that the first shown tile never has a mine around it
+    '''
+    board = NumpyBoard((ROWS, COLS, NUM_MINES))
+    assert not board.has_started()
+
+    board.show(ROWS // 2, COLS // 2)
+
+    assert board.has_started() and board.should_continue()
+    assert board.repr()[ROWS // 2][COLS // 2] == ' '
+
+
+def test_first_click_moves_mines():
+    '''
+    Tests that the mines around the first click are moved away on both boards
+    and that the neighbour counts match a full recount
+    '''
+    for seed in range(5):
+        x, y = randint(0, ROWS - 1), randint(0, COLS - 1)
+        for board_type in (Board, NumpyBoard):
+            board = board_type((ROWS, COLS, ROWS * COLS // 2), seed)
+            board.show(x, y)
+            mines = board.get_state().mines
+            assert mines.sum() == ROWS * COLS // 2
+            assert not mines[max(x - 1, 0) : x + 2, max(y - 1, 0) : y + 2].any()
+
+            for cx, cy in zip(*np.nonzero(~mines)):
+                board.show(cx, cy)
+            assert board.has_won()
+            assert board.repr() == NumpyBoard(board.get_state()).repr()
+
+
+def test_first_click_on_large_board():
+    '''
+    Tests that the first click doesn't depend on the size of the board
+    '''
+    # Dense enough that the opening of the first click stays small
+    board = NumpyBoard((2000, 2000, 1_000_000), 0)
+    start = perf_counter()
+    board.show(1000, 1000)
+
+    assert perf_counter() - start < 0.1
+    assert board.has_started() and board.should_continue()
+
+
+def test_winning_a_game():
+    '''
+    Tests winning a game with the numpy board engine
+    '''
+    game = Game(make_tiles(), NumpyBoard)
+
+    for x in range(ROWS):
+        for y in range(COLS):
+            if (x, y) not in mine_coords:
+                game.show(x, y)
+
+    assert not game.should_continue() and game.has_won()
+
+
+def test_chording_same_as_board():
+    '''
+    Tests that chording flagged numbers reveals the same tiles on both boards
+    and that a number is only chorded once all of its mines are flagged
+    '''
+    board = Board(make_tiles())
+    numpy_board = NumpyBoard(make_tiles())
+    numbers = [(x, y) for x in range(ROWS) for y in range(COLS)
+               if (x, y) not in mine_coords
+               and any((x + dx, y + dy) in mine_coords for dx in [-1, 0, 1] for dy in [-1, 0, 1])]
+
+    for x, y in numbers[::7]:
+        board.show(x, y)
+        numpy_board.show(x, y)
+        if any((x + dx, y + dy) in mine_coords and board.repr_tile(x + dx, y + dy) == '#'
+               for dx in [-1, 0, 1] for dy in [-1, 0, 1]):
+            assert not board.chord(x, y) and not numpy_board.chord(x, y)
+
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                if (x + dx, y + dy) in mine_coords and board.repr_tile(x + dx, y + dy) == '#':
+                    board.toggle_marked(x + dx, y + dy)
+                    numpy_board.toggle_marked(x + dx, y + dy)
+
+        assert sorted(board.chord(x, y)) == sorted(numpy_board.chord(x, y))
+        assert board.repr() == numpy_board.repr()
+        assert not board.has_lost()
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                if 0 <= x + dx < ROWS and 0 <= y + dy < COLS:
+                    assert board.repr_tile(x + dx, y + dy) != '#'
+
+
+def test_flagged_chokepoint_stops_region():
+    '''
+    Tests that flagged empty tiles stop the revealed region the same way on both boards
+    '''
+    # The mines of column 6 leave a two tile wide passage at the top
+    mines = {(x, 6) for x in range(3, 8)} | {(x, 11) for x in range(8)}
+    boards = [board_type([[Tile((x, y) in mines) for y in range(12)] for x in range(8)])
+              for board_type in (Board, NumpyBoard)]
+
+    for board in boards:
+        board.toggle_marked(0, 6)
+        board.toggle_marked(1, 6)
+
+    changes, numpy_changes = (sorted(board.show(7, 0)) for board in boards)
+
+    assert changes == numpy_changes
+    assert all(y < 7 for _, y, _ in changes)
+    assert boards[0].repr() == boards[1].repr()
@@ -0,0 +1,96 @@
+'''
+Probability engine tests
+'''
+from itertools import combinations
+from src.base.game import Game
+from src.solver.probability import ProbabilityEngine
+from src.solver.solver import Solver
+
+ROWS: int = 5
+COLS: int = 6
+NUM_MINES: int = 5
+NUM_GAMES: int = 30
+
+
+def brute_force(state: list[list[str]], num_mines: int) -> dict[tuple[int, int], float]:
+    '''
+    Returns the mine probabilities by checking every placement of the mines
+    '''
+    hidden = [(x, y) for x, row in enumerate(state) for y, char in enumerate(row) if char == '#']
+    numbers = [(x, y, int(char)) for x, row in enumerate(state)
+               for y, char in enumerate(row) if char.isdigit()]
+    counts = {cell: 0 for cell in hidden}
+    total = 0
+
+    for mines in map(set, combinations(hidden, num_mines)):
+        if all(sum((x + dx, y + dy) in mines for dx in (-1, 0, 1) for dy in (-1, 0, 1)) == number
+               for x, y, number in numbers):
+            total += 1
+            for cell in mines:
+                counts[cell] += 1
+
+    return {cell: count / total for cell, count in counts.items()}
+
+
+def test_probabilities_are_exact():
+    '''
+    Tests the probabilities against a brute force count on small boards
+    '''
+    engine = ProbabilityEngine(seed=0)
+
+    for seed in range(NUM_GAMES):
+        game = Game((ROWS, COLS, NUM_MINES), seed=seed)
+        game.show(ROWS // 2, COLS // 2)
+        if not game.should_continue():
+            continue
+
+        state = game.repr()
+        probabilities = engine.probabilities(state, game.get_mines())
+        expected = brute_force(state, game.get_mines())
+
+        assert probabilities.keys() == expected.keys()
+        for cell, probability in expected.items():
+            assert abs(probabilities[cell] - probability) < 1e-9
+
+
+def test_probabilities_after_solver():
+    '''
+    Tests that proven tiles get certain probabilities, the probabilities add up
+    to the mine count and that memoized results do not change them
+    '''
+    game = Game((16, 30, 99), seed=5)
+    solver = Solver(game)
+    solver.play((8, 15))
+    engine = ProbabilityEngine(seed=0)
+
+    probabilities = engine.probabilities(game.repr(), game.get_mines())
+
+    assert abs(sum(probabilities.values()) - game.get_mines()) < 1e-6
+    for cell in solver.get_mines():
+        assert abs(probabilities[cell] - 1) < 1e-9
+    assert engine.probabilities(game.repr(), game.get_mines()) == probabilities
+    assert probabilities[ProbabilityEngine.safest(probabilities)] == min(probabilities.values())
+
+
+def test_sampled_probabilities():
+    '''
+    Tests that a component too large to enumerate within the time budget is
+    sampled without bias
+    '''
+    state = [['#'] * 20, ['1'] * 20, ['#'] * 20, ['#'] * 20, ['#'] * 20]
+    exact = ProbabilityEngine(time_budget=60).probabilities(state, 20)
+    sampled = ProbabilityEngine(time_budget=0.2, samples=4000, seed=0).probabilities(state, 20)
+
+    assert sampled.keys() == exact.keys()
+    for cell, probability in exact.items():
+        assert abs(sampled[cell] - probability) < 0.15
+
+
+def test_inconsistent_state():
+    '''
+    Tests that a number that can't be satisfied gives no probabilities
+    '''
+    assert not ProbabilityEngine().probabilities([['2', '#'], ['1', '1']], 1)
+    # The interior tiles don't make up for the inconsistent number
+    assert not ProbabilityEngine().probabilities(
+        [list("2 ####"), list(" #####"), list("######"), list("######")], 5)
@@ -0,0 +1,118 @@
+'''
+Journal and replay tests
+'''
+from random import Random
+import pytest
+from src.base import journal
+from src.base.board import Board
+from src.base.chunked_board import ChunkedBoard
+from src.base.game import Game
+from src.base.numpy_board import NumpyBoard
+from src.base.replay import Replay
+from src.base.tile import Tile
+
+ROWS: int = 16
+COLS: int = 30
+NUM_MINES: int = 99
+NUM_MOVES: int = 200
+
+
+def play(game: Game, rng: Random):
+    '''
+    Makes random moves until the game ends or the moves run out
+    '''
+    for _ in range(NUM_MOVES):
+        if not game.should_continue():
+            break
+        x, y = rng.randrange(ROWS), rng.randrange(COLS)
+        if rng.random() < 0.3:
+            game.toggle_marked(x, y)
+        else:
+            game.show(x, y)
+
+
+@pytest.mark.parametrize("board_type", [Board, NumpyBoard, ChunkedBoard])
+def test_replay_from_seed(tmp_path, board_type: type):
+    '''
+    Tests that replaying a recorded game with restarts ends on the same board
+    '''
+    path = str(tmp_path / "game.journal")
+    rng = Random(0)
+    game = Game((ROWS, COLS, NUM_MINES), board_type, seed=rng, journal=path)
+    play(game, rng)
+    game.restart()
+    play(game, rng)
+    game.close()
+
+    replay = Replay(path)
+    moves = replay.get_moves()
+
+    assert journal.RESTART in [action for _, action, _, _ in moves]
+    assert [timestamp for timestamp, _, _, _ in moves] == \
+        sorted(timestamp for timestamp, _, _, _ in moves)
+    assert replay.play().repr() == game.repr()
+    assert Replay(path, board_type).play().repr() == game.repr()
+
+
+def test_replay_from_layout(tmp_path):
+    '''
+    Tests that a game started from tiles is replayed from its saved layout,
+    also when the last record was cut off
+    '''
+    path = str(tmp_path / "game.journal")
+    mine_coords = Board.generate_mine_coords(ROWS, COLS, NUM_MINES, set(), 1)
+    game = Game([[Tile((x, y) in mine_coords) for y in range(COLS)] for x in range(ROWS)],
+                journal=path)
+    play(game, Random(1))
+    game.close()
+
+    with open(path, "ab") as file:
+        file.write(b"\0" * (journal.RECORD.size - 1))
+
+    assert Replay(path).play().repr() == game.repr()
+
+
+def test_replay_speed(tmp_path):
+    '''
+    Tests that a replay with a speed waits for the recorded times
+    '''
+    path = str(tmp_path / "game.journal")
+    game = Game((ROWS, COLS, NUM_MINES), seed=2, journal=path)
+    game.show(0, 0)
+    game.toggle_marked(ROWS - 1, COLS - 1)
+    game.close()
+    moves = []
+
+    Replay(path).play(speed=1000, on_move=lambda *move: moves.append(move))
+
+    assert [move[:3] for move in moves] == [(journal.SHOW, 0, 0),
+                                            (journal.TOGGLE, ROWS - 1, COLS - 1)]
+    assert moves[0][3]
+
+
+def test_journal_is_written_without_close(tmp_path):
+    '''
+    Tests that moves outside of the board are recorded like any other move and
+    that the journal is written when the game is left or collected without closing it
+    '''
+    path, other = str(tmp_path / "game.journal"), str(tmp_path / "other.journal")
+
+    with Game((ROWS, COLS, NUM_MINES), seed=2, journal=path) as game:
+        assert not game.show(-1, 0)
+        game.show(0, 0)
+
+    game = Game((ROWS, COLS, NUM_MINES), seed=2, journal=other)
+    game.show(0, 0)
+    del game
+
+    assert [move[1:] for move in Replay(path).get_moves()] == [(journal.SHOW, -1, 0),
+                                                               (journal.SHOW, 0, 0)]
+    assert [move[1:] for move in Replay(other).get_moves()] == [(journal.SHOW, 0, 0)]
+
+
+def test_endless_board_is_not_recorded(tmp_path):
+    '''
+    Tests that a board the replay can't rebuild is not recorded
+    '''
+    with pytest.raises(Exception):
+        Game(0.2, ChunkedBoard, seed=0, journal=str(tmp_path / "game.journal"))
@@ -0,0 +1,85 @@
+'''
+Serialization tests
+'''
+import pytest
+from src.base import serialization
+from src.base.board import Board
+from src.base.game import Game
+from src.base.numpy_board import NumpyBoard
+
+ROWS: int = 16
+COLS: int = 30
+NUM_MINES: int = 99
+
+
+def play(game: Game | Board | NumpyBoard):
+    '''
+    Opens the board and marks a few tiles
+    '''
+    game.show(ROWS // 2, COLS // 2)
+    for x, y in [(0, 0), (0, COLS - 1), (ROWS - 1, 0)]:
+        game.toggle_marked(x, y)
+
+
+@pytest.mark.parametrize("saved_type", [Board, NumpyBoard])
+@pytest.mark.parametrize("loaded_type", [Board, NumpyBoard])
+def test_board_roundtrip(saved_type: type, loaded_type: type):
+    '''
+    Tests that a board in progress plays on the same after saving and loading it
+    '''
+    board = saved_type((ROWS, COLS, NUM_MINES), 1)
+    play(board)
+    data = serialization.dumps(board.get_state())
+    loaded = loaded_type(serialization.loads(data)[0])
+
+    assert len(data) == serialization.HEADER.size + 3 * ((ROWS * COLS + 7) // 8)
+    assert loaded.repr() == board.repr()
+    assert loaded.get_mines() == NUM_MINES
+    assert loaded.should_continue()
+    for x in range(ROWS):
+        for y in range(COLS):
+            if board.repr_tile(x, y) == '#':
+                assert sorted(loaded.show(x, y)) == sorted(board.show(x, y))
+    assert loaded.has_won() == board.has_won()
+    assert loaded.has_lost() == board.has_lost()
+
+
+def test_board_not_started():
+    '''
+    Tests that a board saved before the first click places its mines after loading
+    '''
+    state, _ = serialization.loads(serialization.dumps(NumpyBoard((ROWS, COLS, NUM_MINES))
+                                                       .get_state()))
+    board = Board(state)
+
+    assert not board.has_started()
+    board.show(0, 0)
+    assert sum(row.count('#') for row in board.repr()) >= NUM_MINES
+
+
+def test_game_save_load(tmp_path):
+    '''
+    Tests that a saved game keeps its board and time played
+    '''
+    path = str(tmp_path / "game.msw")
+    game = Game((ROWS, COLS, NUM_MINES), seed=2)
+    play(game)
+    game.save(path)
+
+    loaded = Game.load(path)
+
+    assert loaded.repr() == game.repr()
+    assert loaded.get_dimensions() == (ROWS, COLS)
+    assert loaded.should_continue()
+
+
+def test_invalid_data():
+    '''
+    Tests that data which is not a saved board is rejected
+    '''
+    data = serialization.dumps(Board((ROWS, COLS, NUM_MINES)).get_state())
+
+    with pytest.raises(Exception):
+        serialization.loads(data[:-1])
+    with pytest.raises(Exception):
+        serialization.loads(b"XXXX" + data[4:])
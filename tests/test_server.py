@@ -0,0 +1,157 @@
+'''
+Game server tests
+'''
+import asyncio
+import json
+from time import perf_counter
+from src.server.load import percentile, run_load
+from src.server.server import GameServer
+
+
+async def request(reader: asyncio.StreamReader,
+                  writer: asyncio.StreamWriter,
+                  message: dict | str) -> dict:
+    '''
+    Sends a request and returns its response
+    '''
+    writer.write((message if isinstance(message, str) else json.dumps(message)).encode() + b"\n")
+    return json.loads(await reader.readline())
+
+
+def run_with_server(test, **options):
+    '''
+    Runs a test coroutine with a started server and its port, then stops the server
+    '''
+    async def run():
+        server = GameServer(port=0, **options)
+        _, port = await server.start()
+        try:
+            await test(server, port)
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_playing_a_game():
+    '''
+    Tests that the changes of the moves add up to the state of the board
+    '''
+    async def test(_, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        game = await request(reader, writer, {"op": "new", "rows": 9, "cols": 9,
+                                              "mines": 10, "seed": 3, "id": "a"})
+        assert game == {"id": "a", "ok": True, "session": 1, "rows": 9, "cols": 9, "mines": 10}
+
+        board = [['#'] * 9 for _ in range(9)]
+        shown = await request(reader, writer, {"op": "show", "session": 1, "x": 4, "y": 4})
+        toggled = await request(reader, writer, {"op": "toggle", "session": 1, "x": 0, "y": 0})
+        for x, y, char in shown["changes"] + toggled["changes"]:
+            board[x][y] = char
+
+        state = await request(reader, writer, {"op": "state", "session": 1})
+        assert shown["ok"] and shown["changes"]
+        assert state["state"] == shown["state"]
+        assert state["board"] == ["".join(row) for row in board]
+
+        assert await request(reader, writer, {"op": "close", "session": 1}) == {"ok": True}
+        assert not (await request(reader, writer, {"op": "state", "session": 1}))["ok"]
+        writer.close()
+
+    run_with_server(test)
+
+
+def test_invalid_requests():
+    '''
+    Tests that invalid requests are answered with an error and the connection stays open
+    '''
+    async def test(_, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await request(reader, writer, {"op": "new", "rows": 5, "cols": 5, "mines": 5})
+
+        for message in ["not json", "[1]", {"op": "jump"},
+                        {"op": "new", "rows": 5, "cols": 5, "mines": 30},
+                        {"op": "new", "rows": 500, "cols": 500, "mines": 5},
+                        {"op": "show", "session": 2, "x": 0, "y": 0},
+                        {"op": "show", "session": 1, "x": 5, "y": 0},
+                        {"op": "show", "session": 1, "x": "0", "y": 0}]:
+            response = await request(reader, writer, message)
+            assert not response["ok"] and response["error"]
+
+        assert (await request(reader, writer, {"op": "show", "session": 1, "x": 0, "y": 0}))["ok"]
+        writer.close()
+
+    run_with_server(test, max_cells=1000)
+
+
+def test_sessions_are_isolated():
+    '''
+    Tests that a connection can't play the sessions of another one
+    '''
+    async def test(_, port):
+        first = await asyncio.open_connection("127.0.0.1", port)
+        second = await asyncio.open_connection("127.0.0.1", port)
+        new = {"op": "new", "rows": 5, "cols": 5, "mines": 5}
+
+        session = (await request(*first, new))["session"]
+        await request(*second, {"op": "toggle", "session": session, "x": 0, "y": 0})
+        assert not (await request(*second, {"op": "state", "session": session}))["ok"]
+        assert (await request(*first, {"op": "state", "session": session}))["board"] == \
+            ["#####"] * 5
+
+        first[1].close()
+        second[1].close()
+
+    run_with_server(test)
+
+
+def test_rate_limit():
+    '''
+    Tests that requests over the burst are delayed to the rate
+    '''
+    async def test(_, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        start = perf_counter()
+        writer.write(b'{"op": "state", "session": 1}\n' * 6)
+        for _ in range(6):
+            assert not json.loads(await reader.readline())["ok"]
+
+        assert perf_counter() - start >= 0.2
+        writer.close()
+
+    run_with_server(test, rate=20, burst=1)
+
+
+def test_shutdown():
+    '''
+    Tests that stopping the server closes the open connections
+    '''
+    async def test(server, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await request(reader, writer, {"op": "new", "rows": 5, "cols": 5, "mines": 5})
+        assert server.get_connection_count() == 1
+
+        await server.stop()
+
+        assert server.get_connection_count() == 0
+        assert await reader.read() == b""
+        writer.close()
+
+    run_with_server(test)
+
+
+def test_load_generator():
+    '''
+    Tests that the load generator makes its requests without errors
+    '''
+    async def test(_, port):
+        summary = await run_load("127.0.0.1", port, connections=5, requests=20)
+
+        assert summary["requests"] == 100
+        assert summary["errors"] == 0
+        assert 0 < summary["p50"] <= summary["p99"] <= summary["max"]
+
+    run_with_server(test, rate=0)
+
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.99) == 4.0
@@ -0,0 +1,50 @@
+'''
+Session manager tests
+'''
+from random import Random
+from src.server.sessions import SessionManager
+
+
+def test_evicted_games_continue():
+    '''
+    Tests that games evicted to snapshots are played like games that stayed in memory
+    '''
+    resident = SessionManager(seed=0)
+    evicting = SessionManager(max_tiles=200, seed=0)
+    rng = Random(1)
+
+    for key in range(10):
+        resident.create(key, (10, 10, 10))
+        evicting.create(key, (10, 10, 10))
+
+    for _ in range(200):
+        key, x, y = rng.randrange(10), rng.randrange(10), rng.randrange(10)
+        expected, game = resident.get(key), evicting.get(key)
+        move = "toggle_marked" if rng.random() < 0.2 else "show"
+
+        assert getattr(game, move)(x, y) == getattr(expected, move)(x, y)
+        assert game.repr() == expected.repr()
+        assert game.should_continue() == expected.should_continue()
+
+    stats = evicting.get_stats()
+    assert stats["sessions"] == 10
+    assert stats["resident"] == 2 and stats["resident_tiles"] <= 200
+    assert stats["snapshots"] == 8 and stats["snapshot_bytes"] > 0
+    assert stats["evictions"] > 0 and stats["rehydrations"] > 0
+    assert stats["max_rehydration_time"] > 0
+    assert resident.get_stats()["evictions"] == 0
+
+
+def test_close():
+    '''
+    Tests that closed sessions are removed whether they are resident or not
+    '''
+    sessions = SessionManager(max_tiles=100)
+    sessions.create("a", (10, 10, 10))
+    sessions.create("b", (10, 10, 10))
+
+    assert "a" in sessions and len(sessions) == 2
+    assert sessions.close("a") and sessions.close("b")
+    assert not sessions.close("a")
+    assert sessions.get("a") is None
+    assert sessions.get_stats()["snapshot_bytes"] == sessions.get_stats()["resident_tiles"] == 0
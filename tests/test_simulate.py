@@ -0,0 +1,61 @@
+'''
+Simulation tests
+'''
+import json
+from random import Random
+from src.simulate import main, play_game, run_batch
+
+TASK: dict = {"difficulty": "easy", "rows": 10, "cols": 10, "mines": 10, "seed": 0,
+              "guess": "random", "batch_size": 20, "batch": 0, "games": 20}
+
+
+def test_play_game():
+    '''
+    Tests that a game is played to the end
+    '''
+    won, revealed, guesses = play_game((10, 10, 10), Random(0))
+
+    assert 0 < revealed <= 90
+    assert guesses >= 0
+    assert won == (revealed == 90)
+
+
+def test_batches_are_reproducible():
+    '''
+    Tests that a batch gives the same results on every run
+    '''
+    first, second = run_batch(TASK), run_batch(TASK)
+
+    assert first["games"] == 20
+    assert 0 <= first["wins"] <= 20
+    assert {key: value for key, value in first.items() if key != "time"} == \
+        {key: value for key, value in second.items() if key != "time"}
+
+
+def test_resume(tmp_path, capsys):
+    '''
+    Tests that a second run reuses the batches streamed by the first one
+    '''
+    output = str(tmp_path / "simulation.jsonl")
+    args = ["--games", "30", "--batch-size", "10", "--difficulties", "easy",
+            "--custom", "8", "8", "10", "--workers", "2", "--output", output]
+
+    assert main(args) == 0
+    first = capsys.readouterr().out
+    with open(output, "r", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+
+    assert len(records) == 6
+    assert {record["difficulty"] for record in records} == {"easy", "8x8x10"}
+
+    assert main(args) == 0
+    with open(output, "r", encoding="utf-8") as file:
+        assert len(file.readlines()) == 6
+    assert capsys.readouterr().out == first
+
+    # Only the last batches have a different amount of games
+    assert main(["--games", "25"] + args[2:]) == 0
+    with open(output, "r", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    assert len(records) == 8
+    assert [record["games"] for record in records[6:]] == [5, 5]
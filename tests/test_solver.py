@@ -0,0 +1,51 @@
+'''
+Solver tests
+'''
+from src.base.board import Board
+from src.base.game import Game
+from src.base.tile import Tile
+from src.solver.solver import Solver
+
+ROWS: int = 16
+COLS: int = 30
+NUM_MINES: int = 99
+NUM_GAMES: int = 50
+
+
+def test_solver_only_proves_true_facts():
+    '''
+    Tests that the solver never hits a mine and only proves real mines
+    '''
+    for seed in range(NUM_GAMES):
+        mine_coords = Board.generate_mine_coords(ROWS, COLS, NUM_MINES,
+                                                 {(dx, dy) for dx in range(3) for dy in range(3)},
+                                                 seed)
+        game = Game([[Tile((x, y) in mine_coords) for y in range(COLS)] for x in range(ROWS)])
+        solver = Solver(game)
+
+        solver.play((1, 1), mark_mines=True)
+
+        assert not game.has_lost()
+        assert solver.get_mines() <= mine_coords
+        assert not solver.get_safe() & mine_coords
+        if game.should_continue():
+            assert not solver.get_safe()
+
+
+def test_subset_rule():
+    '''
+    Tests the 1-2-1 pattern that can only be solved by comparing constraints
+    '''
+    mine_coords = {(0, 1), (0, 3), (4, 0)}
+    rows, cols = 5, 5
+    game = Game([[Tile((x, y) in mine_coords) for y in range(cols)] for x in range(rows)])
+
+    for x in range(1, rows):
+        for y in range(cols):
+            if (x, y) not in mine_coords:
+                game.show(x, y)
+
+    safe, mines = Solver(game).step()
+
+    assert mines == mine_coords
+    assert safe == {(0, 0), (0, 2), (0, 4)}